@@ -0,0 +1,205 @@
+import sqlite3
+import time
+from pathlib import Path
+
+try:
+    from board.signatures import BloomFilter, signature64
+except ImportError:  # run as a script from inside board/
+    from signatures import BloomFilter, signature64
+
+# Bloom filter sizing: room for at least this many signatures, rebuilt at double size when full
+BLOOM_MIN_CAPACITY = 100000
+SIG_MASK = (1 << 64) - 1
+
+
+def checkpoint_path_for(json_path):
+    # raw_applicant_data.json -> raw_applicant_data.checkpoint.sqlite
+    path = Path(json_path)
+    return path.with_name(path.stem + ".checkpoint.sqlite")
+
+
+def sqlite_sig(sig):
+    # Unsigned 64-bit signature -> sqlite's signed INTEGER range
+    return sig - (1 << 64) if sig >= 1 << 63 else sig
+
+
+def entry_signature(e):
+    # Same fields the scraper has always deduplicated on, hashed to 64 bits
+    return sqlite_sig(
+        signature64(str(e.get("raw_inst")), str(e.get("raw_prog")), str(e.get("raw_text"))[:50])
+    )
+
+
+class ScrapeCheckpoint:
+    """
+    Durable scrape progress kept in sqlite next to the raw store.
+
+    Tracks the last completed page, a hash of every completed page, the
+    signature of every stored entry and one row per run. Pages and their
+    signatures are committed in the same transaction right after the rows
+    themselves are appended to the raw store, so a restart resumes at the
+    exact next page without reading the archive.
+
+    Signatures are 64-bit integers. A Bloom filter saved next to the
+    database answers most seen() calls for new rows without a query.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        with self.conn:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    last_page INTEGER NOT NULL,
+                    raw_rows INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started_at REAL NOT NULL,
+                    updated_at REAL,
+                    start_page INTEGER NOT NULL,
+                    last_page INTEGER,
+                    rows_added INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    page INTEGER PRIMARY KEY,
+                    sha256 TEXT,
+                    rows_added INTEGER NOT NULL,
+                    run_id INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS signatures (
+                    sig INTEGER PRIMARY KEY
+                );
+                """
+            )
+        self.run_id = None
+        self._pending_pages = []
+        self._pending_sigs = set()
+        self.bloom_path = self.path.with_suffix(".bloom")
+        self._sig_count = self.conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        self.bloom = BloomFilter.load(self.bloom_path)
+        if self.bloom is None or self.bloom.count != self._sig_count or self.bloom.is_full():
+            self._rebuild_bloom()
+
+    def has_state(self):
+        return self._state() is not None
+
+    @property
+    def last_page(self):
+        state = self._state()
+        return state[0] if state else 0
+
+    @property
+    def raw_rows(self):
+        state = self._state()
+        return state[1] if state else 0
+
+    def next_page(self):
+        return self.last_page + 1
+
+    def seed(self, entries, last_page, raw_rows):
+        # One-time migration for an archive that predates checkpoints
+        with self.conn:
+            self._insert_sigs(entry_signature(e) for e in entries)
+            self._set_state(last_page, raw_rows)
+        self._save_bloom()
+
+    def reconcile(self, raw_store):
+        # Rows appended to the raw store just before a crash, before their
+        # checkpoint commit, still need their signatures so they aren't re-added
+        committed = self.raw_rows
+        if len(raw_store) <= committed:
+            return 0
+        tail = list(raw_store.iter_from(committed))
+        with self.conn:
+            self._insert_sigs(entry_signature(e) for e in tail)
+            self._set_state(self.last_page, committed + len(tail))
+        self._save_bloom()
+        return len(tail)
+
+    def start_run(self, start_page):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (started_at, start_page) VALUES (?, ?)",
+                (time.time(), start_page),
+            )
+        self.run_id = cur.lastrowid
+        return self.run_id
+
+    def seen(self, sig):
+        if sig in self._pending_sigs:
+            return True
+        # A Bloom miss is definite; only possible hits go to sqlite
+        if (sig & SIG_MASK) not in self.bloom:
+            return False
+        row = self.conn.execute("SELECT 1 FROM signatures WHERE sig = ?", (sig,)).fetchone()
+        return row is not None
+
+    def page_done(self, page, sha256, sigs):
+        # Buffered until commit() so the checkpoint never runs ahead of the raw store
+        self._pending_pages.append((page, sha256, len(sigs)))
+        self._pending_sigs.update(sigs)
+
+    def commit(self, raw_rows):
+        if not self._pending_pages:
+            return
+        last_page = max(page for page, _, _ in self._pending_pages)
+        added = sum(rows for _, _, rows in self._pending_pages)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pages (page, sha256, rows_added, run_id) VALUES (?, ?, ?, ?)",
+                ((page, sha, rows, self.run_id) for page, sha, rows in self._pending_pages),
+            )
+            self._insert_sigs(self._pending_sigs)
+            self._set_state(max(last_page, self.last_page), raw_rows)
+            if self.run_id is not None:
+                self.conn.execute(
+                    "UPDATE runs SET updated_at = ?, last_page = ?, rows_added = rows_added + ? "
+                    "WHERE run_id = ?",
+                    (time.time(), last_page, added, self.run_id),
+                )
+        self._pending_pages = []
+        self._pending_sigs = set()
+        self._save_bloom()
+
+    def close(self):
+        self.conn.close()
+
+    def _insert_sigs(self, sigs):
+        # Called inside a transaction; the Bloom filter is saved after it commits
+        sigs = list(sigs)
+        cur = self.conn.executemany(
+            "INSERT OR IGNORE INTO signatures (sig) VALUES (?)", ((sig,) for sig in sigs)
+        )
+        self._sig_count += max(cur.rowcount, 0)
+        for sig in sigs:
+            self.bloom.add(sig & SIG_MASK)
+
+    def _save_bloom(self):
+        self.bloom.count = self._sig_count
+        if self.bloom.is_full():
+            self._rebuild_bloom()
+        try:
+            self.bloom.save(self.bloom_path)
+        except OSError as e:
+            print(f"Could not save the checkpoint Bloom filter ({e}).")
+
+    def _rebuild_bloom(self):
+        self.bloom = BloomFilter(max(BLOOM_MIN_CAPACITY, 2 * self._sig_count))
+        for (sig,) in self.conn.execute("SELECT sig FROM signatures"):
+            self.bloom.add(sig & SIG_MASK)
+        self.bloom.count = self._sig_count
+
+    def _state(self):
+        return self.conn.execute("SELECT last_page, raw_rows FROM state WHERE id = 1").fetchone()
+
+    def _set_state(self, last_page, raw_rows):
+        self.conn.execute(
+            "INSERT INTO state (id, last_page, raw_rows) VALUES (1, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET last_page = excluded.last_page, raw_rows = excluded.raw_rows",
+            (last_page, raw_rows),
+        )
@@ -1,6 +1,11 @@
 import json
 import re
 
+try:
+    from board.raw_store import RawStore, store_path_for
+except ImportError:  # run as a script from inside board/
+    from raw_store import RawStore, store_path_for
+
 class DataCleaner:
     def __init__(self, input_file="raw_applicant_data.json", output_file="applicant_data.json"):
         self.input_file = input_file
@@ -15,6 +20,12 @@ class DataCleaner:
             return data
 
         try:
+            # Prefer the scraper's append-only store; fall back to a plain JSON file.
+            raw_store = RawStore(store_path_for(self.input_file))
+            if raw_store.exists():
+                content = raw_store.to_list()
+                print(f"Loaded {len(content)} entries from {raw_store.path}.")
+                return content
             with open(self.input_file, 'r', encoding='utf-8') as f:
                 content = json.load(f)
                 print(f"Loaded {len(content)} entries from {self.input_file}.")
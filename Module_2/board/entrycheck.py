@@ -1,8 +1,18 @@
 import json
+
+try:
+    from board.raw_store import RawStore, store_path_for
+except ImportError:  # run as a script from inside board/
+    from raw_store import RawStore, store_path_for
+
 #checks the number of entries in both raw and cleaned data files before llm processing
 def check_data_counts():
     with open("applicant_data.json", "r", encoding="utf-8") as f:
         data = json.load(f)
-    with open("raw_applicant_data.json", "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
-    return print("raw_applicant_data entries: " + str(len(raw_data)) + "\n""(Cleaned) applicant_data entries: " +str(len(data)))
\ No newline at end of file
+    raw_store = RawStore(store_path_for("raw_applicant_data.json"))
+    if raw_store.exists():
+        raw_count = len(raw_store)
+    else:
+        with open("raw_applicant_data.json", "r", encoding="utf-8") as f:
+            raw_count = len(json.load(f))
+    return print("raw_applicant_data entries: " + str(raw_count) + "\n""(Cleaned) applicant_data entries: " +str(len(data)))
@@ -0,0 +1,207 @@
+"""
+Raw Store Module
+================
+
+Append-only, optionally gzip-compressed NDJSON archive for raw scraper
+entries. Appending costs O(new entries) regardless of archive size.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+
+def store_path_for(json_path):
+    """Return the store directory that replaces a legacy ``*.json`` file."""
+    path = Path(json_path)
+    return path.with_name(path.stem + ".store")
+
+
+class RawStore:
+    """
+    Segmented NDJSON store with an fsync'd offset index.
+
+    ``index.json`` lists every segment with its committed record count,
+    byte length and batch id. Segments are only ever appended to; each append
+    is fsync'd before the index is atomically replaced, so after a crash any
+    bytes past the committed length are a torn write and are truncated on
+    open. A batch is everything appended between ``new_segment`` calls and
+    spans as many segments as it needs.
+    """
+
+    SEGMENT_RECORDS = 10000
+
+    def __init__(self, path, compress=False):
+        """
+        Open (or create) a store directory.
+
+        Args:
+            path (str or Path): Store directory.
+            compress (bool): Gzip new segments. Existing segments keep their format.
+        """
+        self.path = Path(path)
+        self.index_file = self.path / "index.json"
+        self.compress = compress
+        self.segments = []
+        self._roll = False
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as file_handle:
+                self.segments = json.load(file_handle).get("segments", [])
+        except (OSError, ValueError, AttributeError):
+            self.segments = []
+        self._truncate_torn_writes()
+
+    def __len__(self):
+        return sum(segment["records"] for segment in self.segments)
+
+    def __iter__(self):
+        for segment in self.segments:
+            yield from self._read_segment(segment)
+
+    def exists(self):
+        """Return True if the store has been written to before."""
+        return self.index_file.exists()
+
+    def new_segment(self):
+        """Make the next append start a fresh segment and a new batch."""
+        self._roll = True
+
+    def append(self, entries):
+        """
+        Durably append entries.
+
+        Args:
+            entries (Iterable[dict]): Records to append.
+
+        Returns:
+            int: Number of records written.
+        """
+        entries = list(entries)
+        written = 0
+        self.path.mkdir(parents=True, exist_ok=True)
+        while written < len(entries):
+            segment = self._writable_segment()
+            room = self.SEGMENT_RECORDS - segment["records"]
+            batch = entries[written:written + room]
+            payload = "".join(
+                json.dumps(entry, ensure_ascii=False) + "\n" for entry in batch
+            ).encode("utf-8")
+
+            with open(self.path / segment["name"], "ab") as file_handle:
+                if segment["name"].endswith(".gz"):
+                    with gzip.GzipFile(fileobj=file_handle, mode="wb") as gz_handle:
+                        gz_handle.write(payload)
+                else:
+                    file_handle.write(payload)
+                file_handle.flush()
+                os.fsync(file_handle.fileno())
+                segment["bytes"] = file_handle.tell()
+
+            segment["records"] += len(batch)
+            written += len(batch)
+            self._write_index()
+        return written
+
+    def iter_from(self, offset):
+        """Yield records from position ``offset`` on without decoding earlier segments."""
+        for segment in self.segments:
+            if offset >= segment["records"]:
+                offset -= segment["records"]
+                continue
+            for count, record in enumerate(self._read_segment(segment)):
+                if count >= offset:
+                    yield record
+            offset = 0
+
+    def iter_batches(self, reverse=False):
+        """
+        Yield each batch as a list of records, oldest first unless ``reverse``.
+
+        Segments keep their order within a batch.
+        """
+        batches = []
+        for position, segment in enumerate(self.segments):
+            batch = self._batch_of(position)
+            if not batches or batches[-1][0] != batch:
+                batches.append((batch, []))
+            batches[-1][1].append(segment)
+        for _, segments in reversed(batches) if reverse else batches:
+            records = []
+            for segment in segments:
+                records.extend(self._read_segment(segment))
+            yield records
+
+    def to_list(self, newest_batch_first=False):
+        """Return every record as a list (the legacy ``raw_data`` view)."""
+        records = []
+        for batch in self.iter_batches(reverse=newest_batch_first):
+            records.extend(batch)
+        return records
+
+    def import_json(self, json_path):
+        """
+        Seed an empty store from a legacy JSON list file.
+
+        Returns:
+            int: Number of records imported.
+        """
+        if len(self) or not os.path.exists(json_path):
+            return 0
+        try:
+            with open(json_path, "r", encoding="utf-8") as file_handle:
+                data = json.load(file_handle)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(data, list):
+            return 0
+        self.new_segment()
+        return self.append(data)
+
+    def _batch_of(self, position):
+        # Indexes written before batch ids held one batch per segment
+        return self.segments[position].get("batch", position)
+
+    def _writable_segment(self):
+        last = self.segments[-1] if self.segments else None
+        if last is None or self._roll or last["records"] >= self.SEGMENT_RECORDS:
+            # A full segment overflows into the same batch; new_segment() starts the next
+            batch = self._batch_of(len(self.segments) - 1) if last else -1
+            if last is None or self._roll:
+                batch += 1
+            suffix = ".ndjson.gz" if self.compress else ".ndjson"
+            name = f"segment-{len(self.segments) + 1:05d}{suffix}"
+            last = {"name": name, "records": 0, "bytes": 0, "batch": batch}
+            self.segments.append(last)
+            self._roll = False
+        return last
+
+    def _write_index(self):
+        tmp_file = self.path / "index.json.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as file_handle:
+            json.dump({"version": 1, "segments": self.segments}, file_handle)
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        os.replace(tmp_file, self.index_file)
+
+    def _truncate_torn_writes(self):
+        for segment in self.segments:
+            segment_file = self.path / segment["name"]
+            try:
+                if segment_file.stat().st_size > segment["bytes"]:
+                    os.truncate(segment_file, segment["bytes"])
+            except OSError:
+                continue
+
+    def _read_segment(self, segment):
+        segment_file = self.path / segment["name"]
+        opener = gzip.open if segment["name"].endswith(".gz") else open
+        try:
+            with opener(segment_file, "rt", encoding="utf-8") as file_handle:
+                for count, line in enumerate(file_handle):
+                    if count >= segment["records"]:
+                        break
+                    yield json.loads(line)
+        except FileNotFoundError:
+            pass  # a missing segment reads as empty
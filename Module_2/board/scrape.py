@@ -1,9 +1,16 @@
-import json
+import hashlib
 import re
 import urllib3
 from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    from board.checkpoint import ScrapeCheckpoint, checkpoint_path_for, entry_signature
+    from board.raw_store import RawStore, store_path_for
+except ImportError:  # run as a script from inside board/
+    from checkpoint import ScrapeCheckpoint, checkpoint_path_for, entry_signature
+    from raw_store import RawStore, store_path_for
+
 
 class GradCafeScraper:
     BASE_URL = "https://www.thegradcafe.com/survey/index.php"
@@ -14,19 +21,32 @@ class GradCafeScraper:
         self.raw_data = []
         self.http = self._setup_http()
 
-        # AUTO-RESUME LOGIC 
+        # AUTO-RESUME LOGIC
+        # Raw entries live in an append-only NDJSON store next to output_file so each
+        # incremental save only writes the new rows. An old JSON file is imported once.
+        # Resume position and dedupe signatures come from the sqlite checkpoint, so
+        # startup doesn't read the archive. self.raw_data only holds this session's rows.
+        self.raw_store = RawStore(store_path_for(self.output_file))
+        self.checkpoint = ScrapeCheckpoint(checkpoint_path_for(self.output_file))
+        self._saved_count = 0
         try:
-            with open(self.output_file, "r", encoding="utf-8") as f:
-                self.raw_data = json.load(f)
-            if not isinstance(self.raw_data, list):
-                raise ValueError("JSON root is not a list")
-            print(f"Loaded {len(self.raw_data)} existing entries. Resuming scrape...")
-        except FileNotFoundError:
-            print("No existing file found. Starting fresh.")
-            self.raw_data = []
-        except Exception:
-            print("Existing JSON is corrupt/empty or invalid. Starting fresh.")
-            self.raw_data = []
+            imported = self.raw_store.import_json(self.output_file)
+            if imported:
+                print(f"Imported {imported} entries from {self.output_file}.")
+            if not self.checkpoint.has_state() and len(self.raw_store):
+                # Archive from before checkpoints: fall back to the old ~20 per page guess once
+                self.checkpoint.seed(
+                    self.raw_store, len(self.raw_store) // 20, len(self.raw_store)
+                )
+            recovered = self.checkpoint.reconcile(self.raw_store)
+            if recovered:
+                print(f"Recovered {recovered} entries saved after the last checkpoint.")
+        except Exception as e:
+            print(f"Existing raw store/checkpoint is invalid ({e}). Starting fresh.")
+        if len(self.raw_store):
+            print(f"Found {len(self.raw_store)} existing entries. Resuming scrape...")
+        else:
+            print("No existing data found. Starting fresh.")
 
     def _setup_http(self):
        # Timeouts and Retries in case of cloudfare or transient issues 
@@ -94,29 +114,22 @@ class GradCafeScraper:
     # Scrapes data until target count is met or too many empty pages encountered. Resumes from existing data if target count is not met prior to stopping.
     def scrape_data(self, target_count=50000, save_every_pages=8, max_empty_pages=10):
        
-        # Determine starting page. Each page has ~20 entries when I counted 01/28/25.
-        if len(self.raw_data) > 0:
-            current_page = max(1, (len(self.raw_data) // 20) + 1)
-        else:
-            current_page = 1
+        # Resume right after the last page the checkpoint saw completed and saved
+        current_page = self.checkpoint.next_page()
+        self.checkpoint.start_run(current_page)
 
         print(f"--- STARTING SCRAPE AT PAGE {current_page} ---")
 
-        # Signature set for deduplication
-        seen = set()
-        for e in self.raw_data:
-            sig = (e.get("raw_inst"), e.get("raw_prog"), str(e.get("raw_text"))[:50])
-            seen.add(sig)
-
         empty_streak = 0
         # Main scraping loop
         try:
-            while len(self.raw_data) < target_count:
+            while self._total_rows() < target_count:
                 url = self._build_url(current_page)
                 html = self._fetch_html(url)
 
                 if not html:
                     print(f"Skipping page {current_page} (no HTML).")
+                    self.checkpoint.page_done(current_page, None, [])
                     current_page += 1
                     empty_streak += 1
                     if empty_streak >= max_empty_pages:
@@ -154,29 +167,31 @@ class GradCafeScraper:
 
                 new_entries = self._extract_data_from_soup(soup, url)
                 # Handle empty page but is a patchwork code as there shouldn't be any empty pages in normal operation. Catch all for blocs I can't predict.
+                page_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
                 if not new_entries:
                     print(f"No entries found on page {current_page}.")
                     empty_streak += 1
                     if empty_streak >= max_empty_pages:
                         print("Too many empty pages in a row. Stopping.")
                         break
+                    self.checkpoint.page_done(current_page, page_hash, [])
                     current_page += 1
                     continue
 
                 empty_streak = 0
 
                 # Deduplicate and Append to avoid duplicates & skewing data
-                added_count = 0
+                page_sigs = []
                 for e in new_entries:
-                    sig = (e.get("raw_inst"), e.get("raw_prog"), str(e.get("raw_text"))[:50])
-                    if sig in seen:
+                    sig = entry_signature(e)
+                    if sig in page_sigs or self.checkpoint.seen(sig):
                         continue
-                    seen.add(sig)
+                    page_sigs.append(sig)
                     self.raw_data.append(e)
-                    added_count += 1
 
-                print(f"Pg {current_page} | Added: {added_count} | Total: {len(self.raw_data)}")
+                print(f"Pg {current_page} | Added: {len(page_sigs)} | Total: {self._total_rows()}")
 
+                self.checkpoint.page_done(current_page, page_hash, page_sigs)
                 current_page += 1
 
                 # Incremental Save
@@ -190,7 +205,11 @@ class GradCafeScraper:
         finally:
             self.save_raw_data()
 
-        return self.raw_data[:target_count]
+        return (self.raw_store.to_list() + self.raw_data[self._saved_count:])[:target_count]
+
+    def _total_rows(self):
+        # Stored rows plus rows scraped since the last save
+        return len(self.raw_store) + len(self.raw_data) - self._saved_count
 
     def _extract_data_from_soup(self, soup, url):
         # Heavily based on HTML structure of website. If site changes this will not work but analysis can be redone from Webdata_raw.py
@@ -269,10 +288,15 @@ class GradCafeScraper:
         return entries
 
     def save_raw_data(self):
+        # Append only what was scraped since the last save (O(new rows), not O(total))
         try:
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                json.dump(self.raw_data, f, indent=2, ensure_ascii=False)
-            print(f"Saved {len(self.raw_data)} entries to {self.output_file}")
+            new_rows = self.raw_data[self._saved_count:]
+            if new_rows:
+                self.raw_store.append(new_rows)
+                self._saved_count = len(self.raw_data)
+            # Rows are durable now, so the pages they came from can be checkpointed
+            self.checkpoint.commit(len(self.raw_store))
+            print(f"Saved {len(new_rows)} new entries ({len(self.raw_store)} total) to {self.raw_store.path}")
         except Exception as e:
             print(f"Error saving: {e}")
 
@@ -0,0 +1,187 @@
+"""
+Signature Index Module
+======================
+
+Compact dedupe indexes: entries are reduced to 64-bit hashes kept in an
+array-backed hash set, optionally fronted by a persisted Bloom filter.
+"""
+
+import hashlib
+import math
+import os
+import struct
+from array import array
+from pathlib import Path
+
+
+def signature64(*parts):
+    """
+    Hash ``parts`` to an unsigned 64-bit signature.
+
+    Parts are joined with ``\\x1f`` first, so ``signature64("a\\x1fb")`` and
+    ``signature64("a", "b")`` are the same signature. None counts as "".
+    """
+    key = "\x1f".join("" if part is None else str(part) for part in parts)
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SignatureSet:
+    """
+    Set of 64-bit signatures stored in one ``array('Q')``.
+
+    Open addressing with linear probing, kept at most half full, so a
+    member costs at most 16 bytes instead of a tuple of strings. Slot value
+    0 marks an empty slot; the signature 0 is stored as 1.
+    """
+
+    MIN_SLOTS = 1024
+
+    def __init__(self, signatures=(), capacity=0):
+        """
+        Build a set, sized for ``capacity`` members up front.
+
+        Args:
+            signatures (Iterable[int]): Initial members.
+            capacity (int): Expected number of members.
+        """
+        slots = self.MIN_SLOTS
+        while slots < capacity * 2:
+            slots *= 2
+        self._slots = array("Q", bytes(8 * slots))
+        self._mask = slots - 1
+        self._count = 0
+        self.update(signatures)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (value for value in self._slots if value)
+
+    def __contains__(self, signature):
+        signature = signature or 1
+        slots = self._slots
+        mask = self._mask
+        index = signature & mask
+        while True:
+            value = slots[index]
+            if value == signature:
+                return True
+            if not value:
+                return False
+            index = (index + 1) & mask
+
+    def add(self, signature):
+        """Add ``signature``; returns True if it was not a member yet."""
+        signature = signature or 1
+        slots = self._slots
+        mask = self._mask
+        index = signature & mask
+        while True:
+            value = slots[index]
+            if value == signature:
+                return False
+            if not value:
+                break
+            index = (index + 1) & mask
+        slots[index] = signature
+        self._count += 1
+        if self._count * 2 > len(slots):
+            self._grow()
+        return True
+
+    def update(self, signatures):
+        """Add every signature in ``signatures``."""
+        for signature in signatures:
+            self.add(signature)
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        self._count = 0
+        for value in old:
+            if value:
+                self.add(value)
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit signatures, persisted as one small binary file.
+
+    The ``k`` bit positions come from double hashing the two 32-bit halves
+    of a signature. ``count`` is the number of distinct members the owner
+    has added; it is saved with the bits so a stale file can be detected.
+    """
+
+    _HEADER = struct.Struct("<4sQIQQ")
+    _MAGIC = b"BLM1"
+
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        Size the filter for ``capacity`` members at ``error_rate`` false positives.
+
+        Args:
+            capacity (int): Expected number of members.
+            error_rate (float): Target false-positive rate at ``capacity``.
+        """
+        capacity = max(1, int(capacity))
+        bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.size = (bits + 7) // 8 * 8
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray(self.size // 8)
+
+    def _positions(self, signature):
+        low = signature & 0xFFFFFFFF
+        step = (signature >> 32) | 1
+        size = self.size
+        return ((low + i * step) % size for i in range(self.hashes))
+
+    def __contains__(self, signature):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(signature))
+
+    def add(self, signature):
+        """Set the bits of ``signature``."""
+        bits = self._bits
+        for pos in self._positions(signature):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def is_full(self):
+        """Return True once ``count`` passes ``capacity`` and the error rate climbs."""
+        return self.count > self.capacity
+
+    def save(self, path):
+        """Atomically write the filter to ``path``."""
+        path = Path(path)
+        tmp_file = path.with_name(path.name + ".tmp")
+        with open(tmp_file, "wb") as file_handle:
+            file_handle.write(
+                self._HEADER.pack(self._MAGIC, self.size, self.hashes, self.capacity, self.count)
+            )
+            file_handle.write(self._bits)
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by ``save``; returns None if it is missing or damaged."""
+        try:
+            with open(path, "rb") as file_handle:
+                header = file_handle.read(cls._HEADER.size)
+                bits = file_handle.read()
+        except OSError:
+            return None
+        if len(header) != cls._HEADER.size:
+            return None
+        magic, size, hashes, capacity, count = cls._HEADER.unpack(header)
+        if magic != cls._MAGIC or len(bits) * 8 != size:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.size = size
+        bloom.hashes = hashes
+        bloom.capacity = capacity
+        bloom.count = count
+        bloom._bits = bytearray(bits)
+        return bloom
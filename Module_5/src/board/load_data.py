@@ -2,6 +2,8 @@
 Database Loader Module
 ======================
 Read cleaned JSON and safely load it into PostgreSQL using composed SQL.
+A reset reload builds a shadow table and swaps it in, so readers never
+see the table empty.
 """
 
 import json
@@ -68,99 +70,194 @@ def clean_date(value):
     return val_str
 
 
+TABLE = "applicants"
+# reset=True loads into this table, then swaps it in for TABLE
+SHADOW_TABLE = "applicants_new"
+# TABLE's previous contents between the swap and their drop
+OLD_TABLE = "applicants_old"
+# Relations named after their table ("<table>_<suffix>"), renamed along with it
+TABLE_RELATIONS = (("INDEX", "pkey"), ("INDEX", "term_idx"), ("SEQUENCE", "p_id_seq"))
+# Longest the swap waits for running readers before giving up on this reload
+SWAP_LOCK_TIMEOUT = "5s"
+
+COLUMNS = [
+    "program",
+    "university",
+    "comments",
+    "date_added",
+    "url",
+    "status",
+    "term",
+    "us_or_international",
+    "gpa",
+    "gre",
+    "gre_v",
+    "gre_aw",
+    "degree",
+    "llm_generated_program",
+    "llm_generated_university",
+]
+
+
+def _entry_row(entry):
+    """Return the cleaned ``COLUMNS`` values of one JSON record."""
+    return (
+        clean_val(get_val(entry, "program", "Program Name")),
+        clean_val(get_val(entry, "university", "University")),
+        clean_val(get_val(entry, "comments", "Comments")),
+        clean_date(
+            get_val(
+                entry,
+                "date_added",
+                "Date of Information Added to Grad CafÃ©",
+            )
+        ),
+        clean_val(get_val(entry, "url", "URL link to applicant entry")),
+        clean_val(get_val(entry, "status", "Applicant Status")),
+        clean_val(get_val(entry, "term", "Semester and Year of Program Start")),
+        clean_val(
+            get_val(
+                entry,
+                "us_or_international",
+                "International / American Student",
+            )
+        ),
+        clean_val(get_val(entry, "gpa", "GPA")),
+        clean_val(get_val(entry, "gre", "GRE Score")),
+        clean_val(get_val(entry, "gre_v", "GRE V Score")),
+        clean_val(get_val(entry, "gre_aw", "GRE AW")),
+        clean_val(get_val(entry, "degree", "Masters or PhD")),
+        clean_val(entry.get("llm_generated_program")),
+        clean_val(entry.get("llm_generated_university")),
+    )
+
+
+def _create_table(cur, table, primary_key=True):
+    """Create ``table`` if missing; without ``primary_key`` the key is added after loading."""
+    create_stmt = sql.SQL(
+        """
+        CREATE TABLE IF NOT EXISTS {} (
+            p_id SERIAL{}, program TEXT, university TEXT, comments TEXT,
+            date_added DATE, url TEXT, status TEXT, term TEXT,
+            us_or_international TEXT, gpa FLOAT, gre FLOAT, gre_v FLOAT,
+            gre_aw FLOAT, degree TEXT, llm_generated_program TEXT,
+            llm_generated_university TEXT
+        );
+        """
+    ).format(sql.Identifier(table), sql.SQL(" PRIMARY KEY" if primary_key else ""))
+    cur.execute(create_stmt)
+
+
+def _copy_rows(cur, table, data):
+    """Stream the JSON records in ``data`` into ``table`` with one COPY; returns the count."""
+    copy_stmt = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(map(sql.Identifier, COLUMNS)),
+    )
+    count = 0
+    with cur.copy(copy_stmt) as copy:
+        for entry in data:
+            copy.write_row(_entry_row(entry))
+            count += 1
+    return count
+
+
+def _build_indexes(cur, table):
+    """Add the primary key and the ``term`` index to a loaded table, and analyze it."""
+    cur.execute(
+        sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} PRIMARY KEY ({});").format(
+            sql.Identifier(table), sql.Identifier(f"{table}_pkey"), sql.Identifier("p_id")
+        )
+    )
+    cur.execute(
+        sql.SQL("CREATE INDEX {} ON {} ({});").format(
+            sql.Identifier(f"{table}_term_idx"), sql.Identifier(table), sql.Identifier("term")
+        )
+    )
+    cur.execute(sql.SQL("ANALYZE {};").format(sql.Identifier(table)))
+
+
+def _rename_table(cur, table, new_name):
+    """Rename ``table`` and its ``TABLE_RELATIONS``, skipping any that do not exist."""
+    cur.execute(
+        sql.SQL("ALTER TABLE IF EXISTS {} RENAME TO {};").format(
+            sql.Identifier(table), sql.Identifier(new_name)
+        )
+    )
+    for kind, suffix in TABLE_RELATIONS:
+        cur.execute(
+            sql.SQL("ALTER {} IF EXISTS {} RENAME TO {};").format(
+                sql.SQL(kind),
+                sql.Identifier(f"{table}_{suffix}"),
+                sql.Identifier(f"{new_name}_{suffix}"),
+            )
+        )
+
+
+def _drop_table(cur, table):
+    cur.execute(sql.SQL("DROP TABLE IF EXISTS {};").format(sql.Identifier(table)))
+
+
+def _shadow_load(conn, data):
+    """
+    Replace the table's contents with ``data`` without readers noticing.
+
+    The records are copied into ``SHADOW_TABLE`` and indexed there, then one
+    short transaction renames the live table away and the shadow table into
+    its place; the old table is dropped afterwards. Until the swap commits
+    readers see the old rows, then all the new ones. Returns the row count.
+    """
+    with conn.cursor() as cur:
+        # Leftovers of an interrupted reload
+        _drop_table(cur, SHADOW_TABLE)
+        _drop_table(cur, OLD_TABLE)
+        _create_table(cur, SHADOW_TABLE, primary_key=False)
+        count = _copy_rows(cur, SHADOW_TABLE, data)
+        _build_indexes(cur, SHADOW_TABLE)
+    conn.commit()
+
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("SET LOCAL lock_timeout = {};").format(sql.Literal(SWAP_LOCK_TIMEOUT))
+        )
+        _rename_table(cur, TABLE, OLD_TABLE)
+        _rename_table(cur, SHADOW_TABLE, TABLE)
+    conn.commit()
+
+    with conn.cursor() as cur:
+        _drop_table(cur, OLD_TABLE)
+    conn.commit()
+    return count
+
+
 def load_data(filename="applicant_data.json", reset=False):
-    """Open DB connection and load JSON records with parameterized SQL."""
+    """
+    Open DB connection and load JSON records, streaming them with COPY.
+
+    With ``reset`` the records replace the table's contents through
+    ``_shadow_load``, so the dashboard never sees it missing or half loaded;
+    otherwise they are appended.
+    """
     print(f"--- Loading data from {filename} ---")
     try:
         with psycopg.connect(get_db_info()) as conn:
-            with conn.cursor() as cur:
-                if reset:
-                    drop_stmt = sql.SQL("DROP TABLE IF EXISTS {};").format(
-                        sql.Identifier("applicants")
-                    )
-                    cur.execute(drop_stmt)
-
-                create_stmt = sql.SQL(
-                    """
-                    CREATE TABLE IF NOT EXISTS {} (
-                        p_id SERIAL PRIMARY KEY, program TEXT, university TEXT, comments TEXT,
-                        date_added DATE, url TEXT, status TEXT, term TEXT,
-                        us_or_international TEXT, gpa FLOAT, gre FLOAT, gre_v FLOAT,
-                        gre_aw FLOAT, degree TEXT, llm_generated_program TEXT,
-                        llm_generated_university TEXT
-                    );
-                    """
-                ).format(sql.Identifier("applicants"))
-                cur.execute(create_stmt)
-
-                try:
-                    with open(filename, "r", encoding="utf-8") as file_handle:
-                        data = json.load(file_handle)
-                except FileNotFoundError:
-                    print(f"Error: {filename} does not exist.")
-                    return
-
-                cols = [
-                    "program",
-                    "university",
-                    "comments",
-                    "date_added",
-                    "url",
-                    "status",
-                    "term",
-                    "us_or_international",
-                    "gpa",
-                    "gre",
-                    "gre_v",
-                    "gre_aw",
-                    "degree",
-                    "llm_generated_program",
-                    "llm_generated_university",
-                ]
-                insert_query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-                    sql.Identifier("applicants"),
-                    sql.SQL(", ").join(map(sql.Identifier, cols)),
-                    sql.SQL(", ").join(sql.Placeholder() * len(cols)),
-                )
+            if not reset:
+                with conn.cursor() as cur:
+                    _create_table(cur, TABLE)
+
+            try:
+                with open(filename, "r", encoding="utf-8") as file_handle:
+                    data = json.load(file_handle)
+            except FileNotFoundError:
+                print(f"Error: {filename} does not exist.")
+                return
 
-                count = 0
-                for entry in data:
-                    cur.execute(
-                        insert_query,
-                        (
-                            clean_val(get_val(entry, "program", "Program Name")),
-                            clean_val(get_val(entry, "university", "University")),
-                            clean_val(get_val(entry, "comments", "Comments")),
-                            clean_date(
-                                get_val(
-                                    entry,
-                                    "date_added",
-                                    "Date of Information Added to Grad CafÃ©",
-                                )
-                            ),
-                            clean_val(get_val(entry, "url", "URL link to applicant entry")),
-                            clean_val(get_val(entry, "status", "Applicant Status")),
-                            clean_val(
-                                get_val(entry, "term", "Semester and Year of Program Start")
-                            ),
-                            clean_val(
-                                get_val(
-                                    entry,
-                                    "us_or_international",
-                                    "International / American Student",
-                                )
-                            ),
-                            clean_val(get_val(entry, "gpa", "GPA")),
-                            clean_val(get_val(entry, "gre", "GRE Score")),
-                            clean_val(get_val(entry, "gre_v", "GRE V Score")),
-                            clean_val(get_val(entry, "gre_aw", "GRE AW")),
-                            clean_val(get_val(entry, "degree", "Masters or PhD")),
-                            clean_val(entry.get("llm_generated_program")),
-                            clean_val(entry.get("llm_generated_university")),
-                        ),
-                    )
-                    count += 1
-                print(f"Successfully inserted {count} rows.")
+            if reset:
+                count = _shadow_load(conn, data)
+            else:
+                with conn.cursor() as cur:
+                    count = _copy_rows(cur, TABLE, data)
+            print(f"Successfully inserted {count} rows.")
 
     except psycopg.Error as db_error:
         print(f"Database Error: {db_error}")
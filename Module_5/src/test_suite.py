@@ -19,4 +19,5 @@ from tests.test_db_insert import *  # noqa: F401,F403
 from tests.test_flask_page import *  # noqa: F401,F403
 from tests.test_integration_end_to_end import *  # noqa: F401,F403
 from tests.test_load_data_coverage import *  # noqa: F401,F403
+from tests.test_shadow_reload import *  # noqa: F401,F403
 from tests.test_unit_internals import *  # noqa: F401,F403
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import MagicMock, mock_open, patch
+
+import board.load_data as load_data_module
+
+
+class _Sql:
+    """Stand-in for psycopg.sql that renders composed statements as plain text."""
+
+    class SQL(str):
+        def format(self, *args):
+            return _Sql.SQL(str.format(self, *args))
+
+        def join(self, parts):
+            return _Sql.SQL(str.join(self, parts))
+
+    @staticmethod
+    def Identifier(name):
+        return f'"{name}"'
+
+    @staticmethod
+    def Literal(value):
+        return f"'{value}'"
+
+
+def _reload(data, reset=True):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    events = MagicMock()
+    events.attach_mock(cursor.execute, "execute")
+    events.attach_mock(conn.commit, "commit")
+    copy = cursor.copy.return_value.__enter__.return_value
+    with patch.object(load_data_module, "sql", _Sql), \
+         patch.object(load_data_module.psycopg, "connect") as connect, \
+         patch("builtins.open", mock_open(read_data="[]")), \
+         patch("json.load", return_value=data):
+        connect.return_value.__enter__.return_value = conn
+        load_data_module.load_data("clean.json", reset=reset)
+    statements = [
+        " ".join(entry.args[0].split()) if entry[0] == "execute" else "COMMIT"
+        for entry in events.mock_calls
+    ]
+    return statements, cursor, copy
+
+
+@pytest.mark.db
+def test_reset_loads_a_shadow_table_and_swaps_it_in():
+    """A reset reload never drops or empties the live table before the new one is ready."""
+    data = [{"Program Name": "CS", "University": " Uni ", "GPA": "3.9"}, {"University": "Yale"}]
+
+    statements, cursor, copy = _reload(data)
+
+    assert cursor.copy.call_args.args[0].startswith('COPY "applicants_new" ("program"')
+    assert [row.args[0][:2] for row in copy.write_row.call_args_list] == [
+        ("CS", "Uni"), (None, "Yale")
+    ]
+    assert statements[:3] == [
+        'DROP TABLE IF EXISTS "applicants_new";',
+        'DROP TABLE IF EXISTS "applicants_old";',
+        statements[2],
+    ]
+    assert statements[2].startswith('CREATE TABLE IF NOT EXISTS "applicants_new" ( p_id SERIAL,')
+    assert statements[3:] == [
+        'ALTER TABLE "applicants_new" ADD CONSTRAINT "applicants_new_pkey" PRIMARY KEY ("p_id");',
+        'CREATE INDEX "applicants_new_term_idx" ON "applicants_new" ("term");',
+        'ANALYZE "applicants_new";',
+        "COMMIT",
+        "SET LOCAL lock_timeout = '5s';",
+        'ALTER TABLE IF EXISTS "applicants" RENAME TO "applicants_old";',
+        'ALTER INDEX IF EXISTS "applicants_pkey" RENAME TO "applicants_old_pkey";',
+        'ALTER INDEX IF EXISTS "applicants_term_idx" RENAME TO "applicants_old_term_idx";',
+        'ALTER SEQUENCE IF EXISTS "applicants_p_id_seq" RENAME TO "applicants_old_p_id_seq";',
+        'ALTER TABLE IF EXISTS "applicants_new" RENAME TO "applicants";',
+        'ALTER INDEX IF EXISTS "applicants_new_pkey" RENAME TO "applicants_pkey";',
+        'ALTER INDEX IF EXISTS "applicants_new_term_idx" RENAME TO "applicants_term_idx";',
+        'ALTER SEQUENCE IF EXISTS "applicants_new_p_id_seq" RENAME TO "applicants_p_id_seq";',
+        "COMMIT",
+        'DROP TABLE IF EXISTS "applicants_old";',
+        "COMMIT",
+    ]
+
+
+@pytest.mark.db
+def test_append_copies_into_the_live_table():
+    """Without reset the records are copied straight into applicants."""
+    statements, cursor, copy = _reload([{"University": "Uni"}], reset=False)
+
+    assert len(statements) == 1
+    assert statements[0].startswith('CREATE TABLE IF NOT EXISTS "applicants" ( p_id SERIAL PRIMARY KEY,')
+    assert cursor.copy.call_args.args[0].startswith('COPY "applicants" (')
+    assert copy.write_row.call_count == 1
@@ -0,0 +1,75 @@
+"""
+Clean Benchmark
+===============
+
+Measure rows/sec of the fused field extractor against the per-field helpers
+it replaces, and of ``DataCleaner.clean_data`` and the Arrow
+``DataCleaner.clean_table`` (when pyarrow is installed) as a whole, on
+``board/raw_applicant_data.json`` repeated ``--scale`` times.
+
+Run from the Module_6 directory::
+
+    python benchmarks/bench_clean.py --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.pages import load_raw_entries
+from worker.etl.clean import DataCleaner, pc
+
+
+def best_rate(func, rows, repeat):
+    """Return the best rows/sec over ``repeat`` passes of ``func(rows)``."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(rows) / best
+
+
+def main():
+    """Print a rows/sec table for the extractor and the full cleaners."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--scale", type=int, default=1, help="repeat the dataset N times")
+    args = arg_parser.parse_args()
+
+    entries = load_raw_entries() * args.scale
+    blobs = [
+        " ".join(
+            str(item.get(key, ""))
+            for key in ("raw_text", "Decision Details", "raw_decision", "raw_comments", "Comments")
+        )
+        for item in entries
+    ]
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    # pylint: disable=protected-access
+    helpers = best_rate(
+        lambda rows: [DataCleaner._extract_fields_slow(blob) for blob in rows], blobs, args.repeat
+    )
+    fused = best_rate(
+        lambda rows: [DataCleaner._extract_fields(blob) for blob in rows], blobs, args.repeat
+    )
+    full = best_rate(cleaner.clean_data, entries, args.repeat)
+
+    print(f"{len(entries)} rows")
+    print(f"{'field helpers':<14} {helpers:10.0f} rows/s")
+    print(f"{'fused':<14} {fused:10.0f} rows/s  {fused / helpers:5.2f}x")
+    print(f"{'clean_data':<14} {full:10.0f} rows/s")
+    if pc is not None:
+        table = best_rate(cleaner.clean_table, entries, args.repeat)
+        print(f"{'clean_table':<14} {table:10.0f} rows/s  {table / full:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
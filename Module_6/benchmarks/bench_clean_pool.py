@@ -0,0 +1,54 @@
+"""
+Clean Pool Benchmark
+====================
+
+Measure rows/sec of ``DataCleaner.clean_data_parallel`` for several process
+counts against in-process ``clean_data``, on ``board/raw_applicant_data.json``
+repeated ``--scale`` times, and print the slowest and mean chunk times.
+
+Run from the Module_6 directory::
+
+    python benchmarks/bench_clean_pool.py --scale 40 --workers 0 2 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.pages import load_raw_entries
+from worker.etl.clean import DataCleaner
+
+
+def main():
+    """Print a rows/sec table for each process count."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--scale", type=int, default=40, help="repeat the dataset N times")
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    arg_parser.add_argument("--chunk-size", type=int, default=DataCleaner.PARALLEL_CHUNK_ROWS)
+    args = arg_parser.parse_args()
+
+    rows = load_raw_entries() * args.scale
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    print(f"{len(rows)} rows, {os.cpu_count()} cores, {args.chunk_size} rows per chunk")
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        cleaner.clean_data_parallel(rows, workers=workers, chunk_size=args.chunk_size, min_rows=0)
+        rate = len(rows) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        chunk_seconds = [timing["seconds"] for timing in cleaner.chunk_timings]
+        print(
+            f"workers={workers:<3} {rate:10.0f} rows/s  {rate / baseline:5.2f}x  "
+            f"chunk max {max(chunk_seconds):.3f}s mean "
+            f"{sum(chunk_seconds) / len(chunk_seconds):.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Load Benchmark
+==============
+
+Measure rows/sec into a live ``applicants`` table for each batch size in
+``--sizes`` through three paths: one INSERT per row (the old
+``load_from_list``), one pipelined ``executemany`` and ``copy_from_list``
+(binary COPY into a staging table). Every run is rolled back, so the table
+is left as it was. The smallest size where COPY beats ``executemany`` is the
+crossover to use for ``COPY_MIN_ROWS``.
+
+Needs psycopg and a database (``DATABASE_URL`` or the ``DB_*`` variables).
+Run from the Module_6 directory::
+
+    python benchmarks/bench_load.py --sizes 10 50 200 500 1000 5000 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.bench_records import synthetic_rows
+from worker.etl.clean import DataCleaner
+
+try:
+    import psycopg
+    from db.load_data import (
+        APPLICANT_COLUMNS, COPY_MIN_ROWS, _applicant_row, _insert_query, copy_from_list,
+        ensure_tables, get_db_info, load_from_list,
+    )
+except ImportError:  # pragma: no cover - psycopg is not installed
+    psycopg = None
+
+
+def per_row(conn, rows):
+    """Insert ``rows`` with one round trip each."""
+    insert_query = _insert_query(APPLICANT_COLUMNS)
+    with conn.cursor() as cur:
+        for entry in rows:
+            cur.execute(insert_query, _applicant_row(entry))
+
+
+PATHS = (
+    ("per-row", per_row),
+    ("executemany", lambda conn, rows: load_from_list(conn, rows, copy_min_rows=None)),
+    ("copy", copy_from_list),
+)
+
+
+def best_rate(conn, load, rows, repeat):
+    """Return the best rows/sec of ``repeat`` rolled-back ``load(conn, rows)`` runs."""
+    best = 0.0
+    for _ in range(repeat):
+        with conn.transaction(force_rollback=True):
+            start = time.perf_counter()
+            load(conn, rows)
+            best = max(best, len(rows) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    """Print a rows/sec table per batch size and the executemany/COPY crossover."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+",
+                            default=[10, 50, 200, 500, 1000, 5000, 100000])
+    arg_parser.add_argument("--repeat", type=int, default=3, help="best of N runs per size")
+    arg_parser.add_argument("--skip-per-row-above", type=int, default=100000,
+                            help="skip the per-row path for larger sizes")
+    args = arg_parser.parse_args()
+    if psycopg is None:
+        sys.exit("bench_load needs psycopg.")
+
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    rows = cleaner.clean_records(list(synthetic_rows(max(args.sizes))))
+    crossover = None
+    print(f"{'rows':>8} " + " ".join(f"{label:>12}" for label, _ in PATHS) + f" {'copy/row':>9}")
+    with psycopg.connect(get_db_info()) as conn:
+        ensure_tables(conn)
+        for size in sorted(args.sizes):
+            rates = {}
+            for label, load in PATHS:
+                if label == "per-row" and size > args.skip_per_row_above:
+                    continue
+                rates[label] = best_rate(conn, load, rows[:size], args.repeat)
+            if crossover is None and rates["copy"] > rates["executemany"]:
+                crossover = size
+            cells = " ".join(
+                f"{rates[label]:12.0f}" if label in rates else f"{'-':>12}" for label, _ in PATHS
+            )
+            speedup = f"{rates['copy'] / rates['per-row']:8.1f}x" if "per-row" in rates else ""
+            print(f"{size:8d} {cells} {speedup:>9}")
+    print(f"COPY overtakes executemany at {crossover or 'none of these'} rows "
+          f"(COPY_MIN_ROWS is {COPY_MIN_ROWS}).")
+
+
+if __name__ == "__main__":
+    main()
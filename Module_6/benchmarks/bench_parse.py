@@ -0,0 +1,60 @@
+"""
+Parse Benchmark
+===============
+
+Measure pages/sec for each GradCafeScraper parser backend on result pages
+rebuilt from ``board/raw_applicant_data.json``.
+
+Run from the Module_6 directory::
+
+    python benchmarks/bench_parse.py --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.pages import results_pages
+from worker.etl.scrape import PARSER_BACKENDS, GradCafeScraper
+
+
+def bench_backend(parser, pages, repeat):
+    """Return the best pages/sec over ``repeat`` passes for one backend."""
+    scraper = GradCafeScraper(output_file=None, debug=False, parser=parser)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, html in pages:
+            scraper._parse_html(html, "bench")  # pylint: disable=protected-access
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(pages) / best
+
+
+def main():
+    """Print a pages/sec table for every available backend."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    pages = results_pages()
+    print(f"{len(pages)} pages, {sum(len(e) for e, _ in pages)} rows")
+    baseline = None
+    for parser in PARSER_BACKENDS:
+        try:
+            rate = bench_backend(parser, pages, args.repeat)
+        except ValueError as unavailable:
+            print(f"{parser:<12} skipped ({unavailable})")
+            continue
+        baseline = baseline or rate
+        print(f"{parser:<12} {rate:8.1f} pages/s  {rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
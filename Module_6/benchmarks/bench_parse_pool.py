@@ -0,0 +1,67 @@
+"""
+Parse Pool Benchmark
+====================
+
+Measure end-to-end pages/sec of ``GradCafeScraper.scrape_pages`` with page
+parsing on the fetching threads versus in ``parse_processes`` worker
+processes. Fetches are served from pages rebuilt from
+``board/raw_applicant_data.json`` after a simulated network delay, so the
+numbers reflect parsing throughput rather than GradCafe's rate limits.
+
+Run from the Module_6 directory::
+
+    python benchmarks/bench_parse_pool.py --copies 5 --processes 0 2 4
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.pages import results_pages
+from worker.etl.scrape import GradCafeScraper
+
+
+def bench(pages, workers, processes, latency, parser):
+    """Return pages/sec for one configuration."""
+    scraper = GradCafeScraper(
+        output_file=None, debug=False, workers=workers, parser=parser, parse_processes=processes
+    )
+
+    def fetch(url):
+        time.sleep(latency)
+        return pages[int(re.search(r"page=(\d+)", url).group(1)) - 1][1]
+
+    scraper._fetch_html = fetch  # pylint: disable=protected-access
+    start = time.perf_counter()
+    scraper.scrape_pages(1, len(pages))
+    return len(pages) / (time.perf_counter() - start)
+
+
+def main():
+    """Print a pages/sec table for each process count."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--copies", type=int, default=3, help="repeat the page set")
+    arg_parser.add_argument("--workers", type=int, default=8)
+    arg_parser.add_argument("--processes", type=int, nargs="+", default=[0, 2, 4])
+    arg_parser.add_argument("--latency", type=float, default=0.01, help="seconds per fetch")
+    arg_parser.add_argument("--parser", default="html.parser")
+    args = arg_parser.parse_args()
+
+    pages = results_pages() * args.copies
+    print(f"{len(pages)} pages, {os.cpu_count()} cores, {args.workers} fetch threads")
+    baseline = None
+    for processes in args.processes:
+        rate = bench(pages, args.workers, processes, args.latency, args.parser)
+        baseline = baseline or rate
+        print(f"processes={processes:<3} {rate:8.1f} pages/s  {rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Record Benchmark
+================
+
+Compare cleaned rows held as legacy JSON dicts (``DataCleaner.clean_data``)
+with ``ApplicantRecord`` objects (``DataCleaner.clean_records``) on
+``--rows`` synthetic rows: memory retained by the cleaned list, cleaning
+rows/sec, and rows/sec through ``load_from_list`` with a no-op cursor (when
+psycopg is installed).
+
+Run from the Module_6 directory::
+
+    python benchmarks/bench_records.py --rows 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from benchmarks.pages import load_raw_entries
+from worker.etl.clean import DataCleaner
+
+try:
+    from db.load_data import load_from_list
+except ImportError:  # pragma: no cover - psycopg is not installed
+    load_from_list = None
+
+
+class _NullCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params):
+        """Discard the statement."""
+
+    def executemany(self, query, params_seq):
+        """Discard the statements."""
+
+
+class _NullConn:  # pylint: disable=too-few-public-methods
+    def cursor(self):
+        """Return a cursor that discards every statement."""
+        return _NullCursor()
+
+
+def synthetic_rows(count):
+    """Yield ``count`` raw rows cycling through the dataset, each with unique comments."""
+    entries = load_raw_entries()
+    for number in range(count):
+        row = dict(entries[number % len(entries)])
+        row["raw_comments"] = f"{row.get('raw_comments', '')} #{number}"
+        yield row
+
+
+def retained_mb(clean, count):
+    """Return the MB still allocated by the list ``clean`` builds from ``count`` rows."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cleaned = [row for chunk in _chunks(clean, count) for row in chunk]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del cleaned
+    return (after - before) / 2**20
+
+
+def _chunks(clean, count, size=10000):
+    rows = synthetic_rows(count)
+    while True:
+        chunk = [row for _, row in zip(range(size), rows)]
+        if not chunk:
+            return
+        yield clean(chunk)
+
+
+def rate(func, items):
+    """Return items/sec of one ``func(items)`` call."""
+    start = time.perf_counter()
+    func(items)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main():
+    """Print memory and rows/sec for dicts against records."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    arg_parser.add_argument("--rows", type=int, default=1000000)
+    args = arg_parser.parse_args()
+
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    print(f"{args.rows} synthetic rows")
+    results = {}
+    for label, clean in (("dicts", cleaner.clean_data), ("records", cleaner.clean_records)):
+        memory = retained_mb(clean, args.rows)
+        raw = list(synthetic_rows(args.rows))
+        gc.collect()
+        clean_rate = rate(clean, raw)
+        cleaned = clean(raw)
+        del raw
+        load_rate = None
+        if load_from_list is not None:
+            load_rate = rate(
+                lambda rows: load_from_list(_NullConn(), rows, copy_min_rows=None), cleaned
+            )
+        del cleaned
+        results[label] = (memory, clean_rate, load_rate)
+
+    print(f"{'':<8} {'memory MB':>10} {'clean rows/s':>13} {'load rows/s':>12}")
+    for label, (memory, clean_rate, load_rate) in results.items():
+        load = f"{load_rate:12.0f}" if load_rate else f"{'n/a':>12}"
+        print(f"{label:<8} {memory:10.1f} {clean_rate:13.0f} {load}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark Fixtures
+==================
+
+Rebuild GradCafe survey result pages from the stored raw entries so parsers
+can be compared offline against realistic markup.
+"""
+
+import json
+import re
+from html import escape
+from pathlib import Path
+
+RAW_DATA_PATH = Path(__file__).resolve().parents[1] / "src" / "board" / "raw_applicant_data.json"
+ENTRIES_PER_PAGE = 20
+
+_ROW_TAIL_RE = re.compile(
+    r"^(.*?)\s*((?:January|February|March|April|May|June|July|August|September"
+    r"|October|November|December) \d{1,2}, \d{4})\s*(.*?)\s*(Total comments.*)$"
+)
+
+
+def load_raw_entries(path=RAW_DATA_PATH):
+    """Return the stored raw scraper entries."""
+    with open(path, "r", encoding="utf-8") as file_handle:
+        return json.load(file_handle)
+
+
+def render_row(entry, result_id):
+    """Render one entry as the main row plus detail row GradCafe serves."""
+    inst, prog = entry["raw_inst"], entry["raw_prog"]
+    rest = entry["raw_text"][len(inst) + len(prog) + 2:]
+    match = _ROW_TAIL_RE.match(rest)
+    degree, added, decision, actions = match.groups() if match else (rest, "", "", "")
+
+    main_row = (
+        '<tr class="tw-border-none">'
+        '<td class="tw-py-5 tw-pl-4 tw-pr-3 tw-text-sm sm:tw-pl-0">'
+        '<div class="tw-flex tw-items-center"><div class="tw-ml-0">'
+        f'<div class="tw-font-medium tw-text-gray-900">{escape(inst)}</div>'
+        "</div></div></td>"
+        '<td class="tw-px-3 tw-py-5 tw-text-sm tw-text-gray-500">'
+        f'<div class="tw-text-gray-900"><span>{escape(prog)}</span>'
+        '<svg viewBox="0 0 2 2" class="tw-mx-2 tw-inline tw-h-0.5 tw-w-0.5 tw-fill-current">'
+        '<circle cx="1" cy="1" r="1"></circle></svg>'
+        f'<span class="tw-text-gray-500">{escape(degree)}</span></div></td>'
+        f'<td class="tw-px-3 tw-py-5 tw-text-sm tw-text-gray-500 tw-whitespace-nowrap">{added}</td>'
+        '<td class="tw-px-3 tw-py-5 tw-text-sm tw-text-gray-500">'
+        '<div class="tw-inline-flex tw-items-center tw-rounded-md tw-px-2 tw-py-1">'
+        f"{escape(decision)}</div></td>"
+        '<td class="tw-relative tw-py-5 tw-pl-3 tw-pr-4 tw-text-right tw-text-sm">'
+        f'<div class="tw-flex tw-gap-4"><a href="/result/{result_id}#comments">'
+        f'{escape(actions)}</a></div></td>'
+        "</tr>"
+    )
+    detail_row = (
+        '<tr class="tw-border-none">'
+        '<td colspan="3" class="tw-pb-4 tw-pl-4 tw-pr-3 sm:tw-pl-0">'
+        '<div class="tw-flex tw-gap-2 tw-flex-wrap">'
+        f'<div class="tw-inline-flex tw-text-xs">{escape(entry["raw_comments"].strip())}</div>'
+        "</div></td></tr>"
+    )
+    return main_row + detail_row
+
+
+def render_results_page(entries, first_id=1):
+    """Render a full survey results page around ``entries``."""
+    rows = "".join(render_row(entry, first_id + i) for i, entry in enumerate(entries))
+    return (
+        "<!DOCTYPE html><html><head><title>Survey Results | The GradCafe</title>"
+        "<script>window.dataLayer = window.dataLayer || [];</script>"
+        "<style>.tw-hidden{display:none}</style></head><body>"
+        '<nav class="tw-bg-white"><a href="/">GradCafe</a><a href="/survey">Results</a></nav>'
+        '<div class="tw-px-4"><table class="tw-min-w-full">'
+        "<thead><tr><th>School</th><th>Program</th><th>Added On</th><th>Decision</th>"
+        "<th></th></tr></thead>"
+        f'<tbody class="tw-divide-y">{rows}</tbody></table></div>'
+        "<footer><p>&copy; The GradCafe</p></footer></body></html>"
+    )
+
+
+def results_pages(entries=None, per_page=ENTRIES_PER_PAGE):
+    """Return ``(entries, html)`` pairs covering the stored raw data."""
+    if entries is None:
+        entries = load_raw_entries()
+    pages = []
+    for start in range(0, len(entries), per_page):
+        chunk = entries[start:start + per_page]
+        pages.append((chunk, render_results_page(chunk, first_id=start + 1)))
+    return pages
@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 from worker.etl.clean import DataCleaner
+from worker.etl.dates import parse_date
 from worker.etl.query_data import DataAnalyzer
 
 
@@ -14,8 +15,8 @@ def test_cleaner_uncovered_branches():
     assert status == "Interview"
     assert parsed == "7 Jan"
 
-    assert DataCleaner._manual_format_date("2026 12") is None
-    assert DataCleaner._manual_format_date("Jan 2026") is None
+    assert parse_date("2026 12") is None
+    assert parse_date("Jan 2026") is None
 
     assert DataCleaner._extract_origin("American applicant") == "American"
     assert DataCleaner._extract_gre("") == {"total": None, "verbal": None, "aw": None}
@@ -20,3 +20,26 @@ from tests.test_flask_page import *  # noqa: F401,F403
 from tests.test_integration_end_to_end import *  # noqa: F401,F403
 from tests.test_load_data_coverage import *  # noqa: F401,F403
 from tests.test_unit_internals import *  # noqa: F401,F403
+from tests.test_scrape_concurrency import *  # noqa: F401,F403
+from tests.test_parser_backends import *  # noqa: F401,F403
+from tests.test_stream_parser import *  # noqa: F401,F403
+from tests.test_page_cache import *  # noqa: F401,F403
+from tests.test_rate_limit import *  # noqa: F401,F403
+from tests.test_raw_store import *  # noqa: F401,F403
+from tests.test_boundary_search import *  # noqa: F401,F403
+from tests.test_backfill import *  # noqa: F401,F403
+from tests.test_ingest_cursor import *  # noqa: F401,F403
+from tests.test_streaming_pipeline import *  # noqa: F401,F403
+from tests.test_parse_pool import *  # noqa: F401,F403
+from tests.test_page_archive import *  # noqa: F401,F403
+from tests.test_detail_enrichment import *  # noqa: F401,F403
+from tests.test_signatures import *  # noqa: F401,F403
+from tests.test_clean_fields import *  # noqa: F401,F403
+from tests.test_columnar_clean import *  # noqa: F401,F403
+from tests.test_clean_pool import *  # noqa: F401,F403
+from tests.test_merge_index import *  # noqa: F401,F403
+from tests.test_applicant_record import *  # noqa: F401,F403
+from tests.test_reclean import *  # noqa: F401,F403
+from tests.test_dates import *  # noqa: F401,F403
+from tests.test_copy_loader import *  # noqa: F401,F403
+from tests.test_load_batching import *  # noqa: F401,F403
@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 from flask import Flask, render_template, jsonify, flash, request
-from src.web.publisher import publish_task
+from src.web.publisher import publish_task, publish_backfill
 import psycopg
 
 SRC_DIR = Path(__file__).resolve().parents[1]
@@ -47,6 +47,31 @@ def create_app():
         except Exception as e:
             return jsonify({"error": str(e)}), 503
 
+    @app.route('/backfill', methods=['POST'])
+    def backfill():
+        params = request.get_json(silent=True) or request.form
+        try:
+            start_page = int(params.get("start_page", 1))
+            end_page = int(params["end_page"])
+            shard_size = int(params.get("shard_size", 25))
+            job_id, shards = publish_backfill(
+                start_page, end_page, shard_size, job_id=params.get("job_id")
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 503
+        return jsonify({"status": "queued", "task": "backfill_range",
+                        "job_id": job_id, "shards": shards}), 202
+
+    @app.route('/reclean', methods=['POST'])
+    def reclean():
+        try:
+            publish_task("reclean", {})
+            return jsonify({"status": "queued", "task": "reclean"}), 202
+        except Exception as e:
+            return jsonify({"error": str(e)}), 503
+
     @app.route('/update-analysis', methods=['POST'])
     def update_analysis():
         try:
@@ -2,6 +2,7 @@ import os
 import json
 import pika
 import datetime
+import uuid
 
 EXCHANGE = "tasks"
 QUEUE = "tasks_q"
@@ -20,28 +21,62 @@ def _open_channel():
     
     return conn, ch
 
-def publish_task(kind: str, payload: dict = None):
-    if payload is None:
-        payload = {}
-        
-    msg = {
+def _message(kind: str, payload: dict = None):
+    return json.dumps({
         "kind": kind,
         "ts": datetime.datetime.utcnow().isoformat(),
-        "payload": payload
-    }
-    
-    body = json.dumps(msg)
+        "payload": payload or {}
+    })
+
+def _publish(ch, body):
+    ch.basic_publish(
+        exchange=EXCHANGE,
+        routing_key=ROUTING_KEY,
+        body=body,
+        properties=pika.BasicProperties(
+            delivery_mode=2, # Persistent
+            content_type='application/json'
+        )
+    )
+
+def publish_task(kind: str, payload: dict = None):
+    body = _message(kind, payload)
     conn, ch = _open_channel()
     
     try:
-        ch.basic_publish(
-            exchange=EXCHANGE,
-            routing_key=ROUTING_KEY,
-            body=body,
-            properties=pika.BasicProperties(
-                delivery_mode=2, # Persistent
-                content_type='application/json'
-            )
-        )
+        _publish(ch, body)
+    finally:
+        conn.close()
+
+def shard_page_range(start_page: int, end_page: int, shard_size: int):
+    """Split the inclusive page range into consecutive (start, end) shards."""
+    if start_page < 1 or end_page < start_page or shard_size < 1:
+        raise ValueError("need 1 <= start_page <= end_page and shard_size >= 1")
+    return [
+        (first, min(first + shard_size - 1, end_page))
+        for first in range(start_page, end_page + 1, shard_size)
+    ]
+
+def publish_backfill(start_page: int, end_page: int, shard_size: int = 25, job_id: str = None):
+    """
+    Queue one backfill_range task per shard of [start_page, end_page].
+    Every consumer on the queue picks up shards independently; progress is
+    tracked per (job_id, shard_id) in the backfill_shards table. Publishing
+    again with the same job_id re-runs only the shards that are not done.
+    """
+    shards = shard_page_range(start_page, end_page, shard_size)
+    job_id = job_id or uuid.uuid4().hex
+    conn, ch = _open_channel()
+
+    try:
+        for shard_id, (first, last) in enumerate(shards):
+            _publish(ch, _message("backfill_range", {
+                "job_id": job_id,
+                "shard_id": shard_id,
+                "shards": len(shards),
+                "start_page": first,
+                "end_page": last,
+            }))
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+    return job_id, len(shards)
@@ -1,7 +1,9 @@
 import sys
 import os
 import json
+import itertools
 import time
+import socket
 import pika
 import psycopg
 from datetime import datetime
@@ -9,14 +11,30 @@ from datetime import datetime
 # Path setup to import siblings
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.worker.etl.scrape import GradCafeScraper
+from src.worker.etl.scrape import GradCafeScraper, advance_cursor
 from src.worker.etl.clean import DataCleaner
 from src.worker.etl.query_data import DataAnalyzer
-from src.db.load_data import load_from_list, get_last_seen_date, update_watermark, ensure_tables
+from src.db.load_data import (
+    load_from_list, copy_from_list, load_stream, load_raw_rows, get_last_seen_date, ensure_tables,
+    iter_stale_raw_rows, upsert_records,
+    get_ingest_cursor, update_ingest_cursor,
+    claim_backfill_shard, finish_backfill_shard, fail_backfill_shard,
+)
 
 RABBITMQ_URL = os.environ.get("RABBITMQ_URL")
 DATABASE_URL = os.environ.get("DATABASE_URL")
 SEED_JSON_PATH = os.environ.get("SEED_JSON_PATH")
+PAGE_CACHE_DIR = os.environ.get("PAGE_CACHE_DIR")
+PAGE_ARCHIVE_DIR = os.environ.get("PAGE_ARCHIVE_DIR")
+# Set to enrich new rows with GPA/GRE from their detail pages.
+DETAIL_CACHE_PATH = os.environ.get("DETAIL_CACHE_PATH")
+SCRAPE_WORKERS = int(os.environ.get("SCRAPE_WORKERS", "4"))
+# Backfills parse pages in worker processes so they use every core.
+PARSE_PROCESSES = int(os.environ.get("PARSE_PROCESSES", os.cpu_count() or 1))
+# Furthest page a catch-up after downtime will search for the watermark.
+CATCHUP_MAX_PAGES = 500
+# Raw rows re-cleaned and upserted per transaction by the reclean task.
+RECLEAN_BATCH_ROWS = int(os.environ.get("RECLEAN_BATCH_ROWS", "1000"))
 
 def get_db_conn():
     return psycopg.connect(DATABASE_URL)
@@ -56,46 +74,140 @@ def auto_seed_if_needed():
                 print(f" [*] Applicants already populated ({existing_count} rows); skipping seed.")
                 return
 
-            load_from_list(conn, seed_data)
+            inserted, skipped = copy_from_list(conn, seed_data)
             conn.commit()
-            print(f" [*] Auto-seeded applicants with {len(seed_data)} rows from {SEED_JSON_PATH}")
+            print(f" [*] Auto-seeded applicants with {inserted} rows from {SEED_JSON_PATH} "
+                  f"({skipped} duplicates skipped)")
     except Exception as seed_load_error:  # pylint: disable=broad-except
         print(f" [!] Failed to auto-seed DB: {seed_load_error}")
 
 def handle_scrape_new_data(ch, method, properties, body):
     print(" [x] Handling scrape_new_data")
     
-    # 1. Get Watermark (Last seen date)
-    last_seen = get_last_seen_date()
-    print(f"     Last seen date: {last_seen}")
+    # 1. Get the ingest cursor (falls back to the legacy last-seen date)
+    cursor = get_ingest_cursor()
+    last_seen = None if cursor else get_last_seen_date()
+    if cursor:
+        print(f"     Cursor: {cursor['date']} ({len(cursor['signatures'])} rows on that date)")
+    else:
+        print(f"     Last seen date: {last_seen}")
 
     # 2. Scrape
     # Initialize scraper with shared volume path or just use memory
-    scraper = GradCafeScraper(output_file=None, debug=True)
-    # We pass the last_seen date to the scraper so it stops early
-    raw_data = scraper.scrape_data(target_count=50, max_pages=5, stop_date=last_seen)
-    
-    if not raw_data:
-        print("     No new data found.")
-        return
+    scraper = GradCafeScraper(
+        output_file=None,
+        debug=True,
+        workers=SCRAPE_WORKERS,
+        page_cache=PAGE_CACHE_DIR,
+        rate_limiter=True,
+        archive=PAGE_ARCHIVE_DIR,
+        detail_cache=DETAIL_CACHE_PATH,
+    )
+    if cursor or last_seen:
+        # Search for the page holding the watermark, then fetch everything before it
+        raw_chunks = scraper.iter_scrape(
+            max_pages=CATCHUP_MAX_PAGES,
+            stop_date=last_seen,
+            cursor=cursor,
+            boundary_search=True,
+        )
+    else:
+        raw_chunks = scraper.iter_scrape(target_count=50, max_pages=5)
 
-    # 3. Clean
+    # 3. Stream page-sized chunks through clean -> load, committing each chunk.
+    # tee holds at most the one chunk in flight, which the cursor needs once loaded
+    # and raw_applicants stores alongside its cleaned rows.
+    raw_chunks, to_clean, to_store = itertools.tee(raw_chunks, 3)
     cleaner = DataCleaner(input_file=None, output_file=None)
-    cleaned_data = cleaner.clean_data(raw_data)
+    new_cursor = cursor
+    total = 0
+    with get_db_conn() as conn:
+        loaded = load_stream(conn, cleaner.iter_clean(to_clean, stamp=True), raw_chunks=to_store)
+        for raw_chunk, count in zip(raw_chunks, loaded):
+            new_cursor = advance_cursor(new_cursor, raw_chunk)
+            total += count
+            print(f"     Committed {count} rows ({total} so far)")
+
+        if not total:
+            print("     No new data found.")
+            return
+
+        # 4. Advance the cursor only once every chunk is committed: chunks arrive
+        # newest first, so moving it earlier could skip rows after a crash. A
+        # catch-up that never got back to the watermark leaves a gap below its
+        # last page, so the cursor stays put and the next run searches again.
+        if (cursor or last_seen) and not scraper.reached_watermark:
+            print(f"     Watermark not reached within {CATCHUP_MAX_PAGES} pages; cursor not moved.")
+            return
+        if new_cursor and new_cursor != cursor:
+            with conn.transaction():
+                update_ingest_cursor(conn, new_cursor)
+            print(f"     Advanced cursor to: {new_cursor['date']}")
 
-    # 4. Load to DB & Update Watermark
+def handle_backfill_range(ch, method, properties, body):
+    shard = json.loads(body).get("payload", {})
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    print(f" [x] Handling backfill_range {shard.get('job_id')}#{shard.get('shard_id')} "
+          f"(pages {shard.get('start_page')}-{shard.get('end_page')})")
+
+    # Claiming registers the shard; a done or actively running shard is skipped
+    # so redelivered messages and duplicate publishes are harmless.
     with get_db_conn() as conn:
-        with conn.transaction():
-            load_from_list(conn, cleaned_data)
-            
-            # Update watermark to the most recent date found in this batch
-            # Assuming raw_data is sorted or we find the max date
-            # Simplified: just taking the first one if they are ordered by date desc
-            if raw_data:
-                newest_date = raw_data[0].get('raw_date')
-                if newest_date:
-                    update_watermark(conn, newest_date)
-                    print(f"     Updated watermark to: {newest_date}")
+        if not claim_backfill_shard(conn, shard, worker_id):
+            print("     Shard already done or running elsewhere; skipping.")
+            return
+
+    try:
+        scraper = GradCafeScraper(
+            output_file=None,
+            debug=False,
+            workers=SCRAPE_WORKERS,
+            rate_limiter=True,
+            parse_processes=PARSE_PROCESSES,
+            archive=PAGE_ARCHIVE_DIR,
+            detail_cache=DETAIL_CACHE_PATH,
+        )
+        raw_data = scraper.scrape_pages(shard["start_page"], shard["end_page"])
+        cleaned_data = DataCleaner(input_file=None, output_file=None).clean_records(
+            raw_data, stamp=True
+        )
+
+        # Rows and the done marker commit together; ON CONFLICT makes reloads no-ops.
+        with get_db_conn() as conn:
+            with conn.transaction():
+                load_from_list(conn, cleaned_data)
+                load_raw_rows(conn, raw_data, [record.raw_hash for record in cleaned_data],
+                              DataCleaner.CLEANER_VERSION)
+                finish_backfill_shard(conn, shard, len(raw_data))
+        print(f"     Shard loaded {len(cleaned_data)} rows.")
+    except Exception as shard_error:
+        with get_db_conn() as conn:
+            fail_backfill_shard(conn, shard, shard_error)
+        raise
+
+def handle_reclean(ch, method, properties, body):
+    """
+    Re-clean the stored raw rows not yet processed by this cleaner version,
+    upserting them in committed batches. After a
+    cleaner change (a CLEANER_VERSION bump) this touches only stale rows, and a
+    redelivered or interrupted task resumes where the committed batches end.
+    """
+    payload = json.loads(body).get("payload", {})
+    batch_size = int(payload.get("batch_size") or RECLEAN_BATCH_ROWS)
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    print(f" [x] Handling reclean (cleaner version {cleaner.CLEANER_VERSION})")
+
+    total = 0
+    with get_db_conn() as conn:
+        ensure_tables(conn)
+        for batch in iter_stale_raw_rows(conn, cleaner.CLEANER_VERSION, batch_size):
+            records = cleaner.clean_records([raw for _, raw in batch])
+            cleaner.stamp_records(records, [raw_hash for raw_hash, _ in batch])
+            with conn.transaction():
+                upsert_records(conn, records)
+            total += len(records)
+            print(f"     Re-cleaned {len(records)} rows ({total} so far)")
+    print(f"     Reclean done: {total} rows.")
 
 def handle_recompute_analytics(ch, method, properties, body):
     print(" [x] Handling recompute_analytics")
@@ -141,6 +253,10 @@ def main():
         try:
             if kind == "scrape_new_data":
                 handle_scrape_new_data(ch, method, props, body)
+            elif kind == "backfill_range":
+                handle_backfill_range(ch, method, props, body)
+            elif kind == "reclean":
+                handle_reclean(ch, method, props, body)
             elif kind == "recompute_analytics":
                 handle_recompute_analytics(ch, method, props, body)
             else:
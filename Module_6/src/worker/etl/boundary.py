@@ -0,0 +1,75 @@
+"""
+Boundary Search Module
+======================
+
+Locate the listings page where a catch-up scrape can stop. Pages are
+probed at 1, 2, 4, 8, ... and the gap between the last two probes is
+bisected, so a watermark N pages back costs O(log N) requests.
+"""
+
+import time
+
+
+def probe_page(fetch, page, attempts=3, retry_delay=2.0, debug=False):
+    """
+    Fetch one probe, retrying a failed download with a linear backoff.
+
+    Args:
+        fetch (callable): ``fetch(page)`` returns the page's entries, or
+            None if the request failed.
+        page (int): Page number.
+        attempts (int): Downloads tried before giving up.
+        retry_delay (float): Seconds slept after the first failure; each
+            further failure waits that much longer.
+        debug (bool): Print each failed attempt.
+
+    Raises:
+        ConnectionError: Every attempt failed.
+    """
+    for attempt in range(1, attempts + 1):
+        entries = fetch(page)
+        if entries is not None:
+            return entries
+        if debug:
+            print(f"Boundary probe of page {page} failed (attempt {attempt}).")
+        if attempt < attempts:
+            time.sleep(retry_delay * attempt)
+    raise ConnectionError(f"Boundary probe of page {page} failed {attempts} times")
+
+
+def find_boundary_page(probe, reached, max_page=10000):
+    """
+    Return the first page whose entries reach the watermark.
+
+    ``reached`` must be monotone over the listings: once a page reaches the
+    watermark, every later page does too.
+
+    Args:
+        probe (callable): ``probe(page)`` returns the page's entries.
+        reached (callable): ``reached(entries)`` is True for a page at or
+            past the watermark.
+        max_page (int): Highest page the search may return.
+
+    Returns:
+        tuple: ``(boundary_page, probes)`` where ``probes`` maps each probed
+        page number to its entries. ``boundary_page`` is None when no page
+        up to ``max_page`` is reached.
+    """
+    probes = {}
+
+    def probe_reached(page):
+        probes[page] = probe(page)
+        return reached(probes[page])
+
+    low, high = 0, 1
+    while not probe_reached(high):
+        if high >= max_page:
+            return None, probes
+        low, high = high, min(high * 2, max_page)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if probe_reached(middle):
+            high = middle
+        else:
+            low = middle
+    return high, probes
@@ -5,23 +5,194 @@ Data Cleaning Module
 Handles the cleaning, normalization, and deduplication of scraped applicant data.
 """
 
+import hashlib
 import json
+import multiprocessing
 import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
 from pathlib import Path
 
+try:
+    from src.worker.etl.dates import parse_date
+    from src.worker.etl.raw_store import RawStore, store_path_for
+    from src.worker.etl.record import DATE_KEY_VARIANTS, ApplicantRecord, blank_to_none
+    from src.worker.etl.signatures import SignatureFile, SignatureSet, signature64
+except ImportError:  # pragma: no cover - local test fallback
+    from worker.etl.dates import parse_date
+    from worker.etl.raw_store import RawStore, store_path_for
+    from worker.etl.record import DATE_KEY_VARIANTS, ApplicantRecord, blank_to_none
+    from worker.etl.signatures import SignatureFile, SignatureSet, signature64
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow is an optional fast path
+    pa = None
+    pc = None
+# pyarrow.compute generates its kernel functions at import time
+# pylint: disable=no-member
+
+# update_and_merge's files inside the output store directory
+SIGNATURE_INDEX_FILE = "signatures.idx"
+MERGE_STATE_FILE = "merge.json"
+
+
+def raw_hash(item):
+    """Return the content hash of a raw row: key order and JSON formatting don't matter."""
+    canonical = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Every regex field clean_data reads from a row's text, fused into one
+# pattern over the lowercased text and scanned once with finditer. The
+# alternatives start with distinct literals, so no two can match at the same
+# position, and none can start inside another's match: the decision-date
+# alternatives only consume their leading "o" and check the rest in a
+# lookahead. The first hit of each group is therefore exactly what its own
+# case-insensitive re.search would return. Season alternatives have no
+# group, so their ``lastgroup`` is None.
+FIELD_RE = re.compile(
+    r"o(?=n\s+(?:(?P<on_day>\d{1,2})\s+(?P<on_day_month>[a-z]{3})"
+    r"|(?P<on_month>[a-z]{3})\s+(?P<on_month_day>\d{1,2})))"
+    r"|fall\s+\d{4}|spring\s+\d{4}|summer\s+\d{4}|winter\s+\d{4}"
+    r"|g(?:pa\s*:?\s*(?P<gpa>\d\.\d+)|re\s*:?\s*(?P<gre>\d{3}))"
+    r"|v\s*(?P<verbal>\d{3})"
+    r"|aw\s*(?P<aw>\d(?:\.\d)?)"
+)
+# FIELD_RE's alternatives as separate RE2 patterns for Arrow's extract_regex.
+# The whitespace class spells out Python's ASCII \s, which is wider than RE2's.
+_WS = r"[\t\n\x0b\x0c\r\x1c-\x1f ]"
+ARROW_FIELD_PATTERNS = {
+    "on_day": rf"(?i)on{_WS}+(?P<day>\d{{1,2}}){_WS}+(?P<month>[a-z]{{3}})",
+    "on_month": rf"(?i)on{_WS}+(?P<month>[a-z]{{3}}){_WS}+(?P<day>\d{{1,2}})",
+    "season": rf"(?i)(?P<season>(?:fall|spring|summer|winter){_WS}+\d{{4}})",
+    "gpa": rf"(?i)gpa{_WS}*:?{_WS}*(?P<gpa>\d\.\d+)",
+    "gre": rf"(?i)gre{_WS}*:?{_WS}*(?P<gre>\d{{3}})",
+    "verbal": rf"(?i)v{_WS}*(?P<verbal>\d{{3}})",
+    "aw": rf"(?i)aw{_WS}*(?P<aw>\d(?:\.\d)?)",
+}
+
+
+def _text_array(values):
+    """Arrow string array of ``values``, with non-strings passed through ``str``."""
+    try:
+        return pa.array(values, pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [value if value is None or isinstance(value, str) else str(value) for value in values],
+            pa.string(),
+        )
+
+
+def _number_array(values):
+    """Arrow float64 array of ``values``; blanks and non-numbers become null."""
+    try:
+        return pa.array(values, pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    numbers = []
+    for value in values:
+        try:
+            numbers.append(None if value is None else float(value))
+        except (TypeError, ValueError):
+            numbers.append(None)
+    return pa.array(numbers, pa.float64())
+
+
+def _null_where(mask, values):
+    return pc.if_else(mask, pa.scalar(None, values.type), values)
+
+
+def _collapse(values, keep_empty=False):
+    """``DataCleaner._clean_str`` over an array of ASCII strings."""
+    collapsed = pc.utf8_trim(pc.replace_substring_regex(values, f"{_WS}+", " "), " ")
+    if keep_empty:
+        return pc.fill_null(collapsed, "")
+    return _null_where(pc.equal(collapsed, ""), collapsed)
+
+
+def _date_array(texts, references):
+    """
+    ``parse_date`` over an Arrow string array as a date32 array.
+
+    ``references`` is a date32 array or scalar. Each distinct (text,
+    reference) pair is parsed once and broadcast back with ``index_in``.
+    """
+    keys = pc.binary_join_element_wise(texts, pc.cast(references, pa.string()), "|")
+    distinct = pc.unique(keys)
+    parsed = []
+    for key in distinct.to_pylist():
+        text, _, reference = (key or "").rpartition("|")
+        parsed.append(parse_date(text, date.fromisoformat(reference)) if text else None)
+    return pa.array(parsed, pa.date32()).take(pc.index_in(keys, value_set=distinct))
+
+
+def _blank_to_null(values):
+    """Null out blank strings, as ``DataCleaner._prune_nulls`` drops them."""
+    return _null_where(pc.match_substring_regex(values, f"^{_WS}*$"), values)
+
 
 class DataCleaner:
     """Clean raw JSON data and merge it with existing normalized data."""
 
-    DATE_KEY_VARIANTS = (
-        "Date of Information Added to Grad CafÃ©",
-        "Date of Information Added to Grad CafÃƒÂ©",
-        "Date of Information Added to Grad CafÃƒÆ’Ã‚Â©",
+    DATE_KEY_VARIANTS = DATE_KEY_VARIANTS
+
+    # Stamped on every loaded row. Bump it with any change to the cleaned
+    # output; the worker's ``reclean`` task then re-cleans only the rows
+    # stamped with an older version.
+    CLEANER_VERSION = 2
+
+    # clean_table's columns: load_from_list's columns and the record key each reads
+    TABLE_COLUMNS = (
+        ("program", "Program Name"),
+        ("university", "University"),
+        ("comments", "Comments"),
+        ("date_added", "Date of Information Added to Grad CafÃ©"),
+        ("url", "URL link to applicant entry"),
+        ("status", "Applicant Status"),
+        ("term", "Semester and Year of Program Start"),
+        ("us_or_international", "International / American Student"),
+        ("gpa", "GPA"),
+        ("gre", "GRE Score"),
+        ("gre_v", "GRE V Score"),
+        ("gre_aw", "GRE AW"),
+        ("degree", "Masters or PhD"),
+        ("llm_generated_program", "llm_generated_program"),
+        ("llm_generated_university", "llm_generated_university"),
     )
-
-    def __init__(self, input_file="raw_applicant_data.json", output_file="applicant_data.json"):
-        """Set input and output paths relative to this module when needed."""
+    NUMERIC_COLUMNS = ("gpa", "gre", "gre_v", "gre_aw")
+
+    # clean_data_parallel defaults: rows per pool task, and the batch size
+    # below which spawning worker processes costs more than it saves
+    PARALLEL_CHUNK_ROWS = 5000
+    PARALLEL_MIN_ROWS = 20000
+
+    # Detail page label -> (record field, type, lowest valid, highest valid).
+    # GradCafe shows unreported scores as 0, which the ranges reject.
+    DETAIL_SCORE_FIELDS = {
+        "undergrad gpa": ("gpa", float, 0.01, 5.0),
+        "gpa": ("gpa", float, 0.01, 5.0),
+        "gre general": ("gre", int, 260, 340),
+        "gre": ("gre", int, 260, 340),
+        "gre verbal": ("gre_v", int, 130, 170),
+        "analytical writing": ("gre_aw", float, 0.5, 6.0),
+        "gre aw": ("gre_aw", float, 0.5, 6.0),
+    }
+
+    def __init__(
+        self, input_file="raw_applicant_data.json", output_file="applicant_data.json", workers=0
+    ):
+        """
+        Set input and output paths relative to this module when needed.
+
+        ``workers`` is the process count ``update_and_merge`` cleans with
+        (see ``clean_data_parallel``); the default 0 cleans in-process.
+        """
         src_dir = Path(__file__).resolve().parents[2]
         data_dir = src_dir / "data"
 
@@ -39,153 +210,459 @@ class DataCleaner:
         else:
             self.output_file = output_file
 
+        self.workers = workers
         self.cleaned_data = []
+        self.chunk_timings = []
 
     def update_and_merge(self):
-        """Load raw and existing data, clean new rows, deduplicate, and persist."""
+        """
+        Clean the raw rows added since the last merge and append the new unique ones.
+
+        Cleaned records live in an append-only ``RawStore`` next to
+        ``output_file`` (``applicant_data.store``), one batch per merge, so
+        ``to_list(newest_batch_first=True)`` is the legacy newest-first list.
+        Their dedupe signatures are kept in a memory-mapped ``SignatureFile``
+        in the same directory, and ``merge.json`` records how many raw and
+        cleaned records it reflects, so a merge only reads, cleans and writes
+        new rows. A legacy ``output_file`` JSON list is imported on first use;
+        a missing or stale index, or one written by another ``CLEANER_VERSION``,
+        is rebuilt from the store.
+        """
         if not self.input_file or not self.output_file:
             return
 
-        existing_data = []
-        try:
-            with open(self.output_file, "r", encoding="utf-8") as file_handle:
-                existing_data = json.load(file_handle)
-        except (FileNotFoundError, ValueError):
-            existing_data = []
+        out_store = RawStore(store_path_for(self.output_file))
+        state = self._read_merge_state(out_store)
 
         raw_data = []
+        raw_total = 0
+        raw_store = RawStore(store_path_for(self.input_file))
         try:
-            with open(self.input_file, "r", encoding="utf-8") as file_handle:
-                raw_data = json.load(file_handle)
+            if raw_store.exists():
+                raw_total = len(raw_store)
+                offset = state["raw_offset"] if state["raw_offset"] <= raw_total else 0
+                raw_data = raw_store.to_list(newest_batch_first=True, offset=offset)
+            else:
+                with open(self.input_file, "r", encoding="utf-8") as file_handle:
+                    raw_data = json.load(file_handle)
         except (FileNotFoundError, ValueError):
             return
 
-        new_cleaned_entries = self.clean_data(raw_data)
-
-        existing_sigs = set()
-        for entry in existing_data:
-            sig = (
-                self._norm(entry.get("University")),
-                self._norm(entry.get("Program Name")),
-                self._norm(self._get_date(entry)),
-                self._norm(entry.get("Comments")),
-            )
-            existing_sigs.add(sig)
-
-        unique_new_entries = []
-        for item in new_cleaned_entries:
-            sig = (
-                self._norm(item.get("University")),
-                self._norm(item.get("Program Name")),
-                self._norm(self._get_date(item)),
-                self._norm(item.get("Comments")),
-            )
-            if sig not in existing_sigs:
-                unique_new_entries.append(item)
-                existing_sigs.add(sig)
-
-        self.cleaned_data = unique_new_entries + existing_data
-        self.save_data()
+        out_store.import_json(self.output_file)
+        index = self._open_index(out_store, state)
+        try:
+            new_records = self.clean_records_parallel(raw_data, workers=self.workers)
+
+            batch_sigs = SignatureSet(capacity=len(new_records))
+            unique_new_entries = []
+            for record in new_records:
+                signature = self._signature(record)
+                if signature not in index and batch_sigs.add(signature):
+                    unique_new_entries.append(record.to_dict())
+
+            # Records are durable before the index and state claim them
+            self.cleaned_data = unique_new_entries
+            if not self.save_data(out_store):
+                return
+            index.update(batch_sigs)
+            index.flush()
+            self._write_merge_state(out_store, {
+                "records": len(out_store),
+                "raw_offset": raw_total,
+                "cleaner_version": self.CLEANER_VERSION,
+            })
+        finally:
+            index.close()
+
+    def iter_clean(self, raw_chunks, columnar=False, stamp=False):
+        """
+        Clean an iterable of raw chunks lazily, yielding one cleaned chunk per input chunk.
+
+        Chunks are ``ApplicantRecord`` lists, or with ``columnar`` Arrow
+        tables from ``clean_table``; ``load_stream`` takes either. ``stamp``
+        is passed through to the clean call.
+        """
+        clean_chunk = self.clean_table if columnar else self.clean_records
+        for raw_chunk in raw_chunks:
+            yield clean_chunk(raw_chunk, stamp=stamp)
 
     def clean_data(self, raw_data):
-        """Transform raw scraped rows into normalized applicant records."""
-        cleaned_batch = []
-        for item in raw_data:
-            raw_text_blob = " ".join(
-                [
-                    str(item.get("raw_text", "")),
-                    str(item.get("Decision Details", "")),
-                    str(item.get("raw_decision", "")),
-                    str(item.get("raw_comments", "")),
-                    str(item.get("Comments", "")),
-                ]
-            )
-
-            status, decision_date_str = self._parse_status_date(raw_text_blob)
-            if decision_date_str:
-                formatted_date = self._manual_format_date(decision_date_str)
-            else:
-                formatted_date = None
+        """Transform raw scraped rows into normalized applicant records (legacy JSON dicts)."""
+        return [record.to_dict() for record in self.clean_records(raw_data)]
+
+    def clean_records(self, raw_data, stamp=False):
+        """
+        Transform raw scraped rows into ``ApplicantRecord`` objects.
+
+        With ``stamp`` each record also carries ``CLEANER_VERSION`` and the
+        ``raw_hash`` of its raw row, for loading into the DB.
+        """
+        if stamp:
+            raw_data = list(raw_data)
+        records = [
+            self._build_record(item, self._extract_fields(self._text_blob(item)))
+            for item in raw_data
+        ]
+        if stamp:
+            self.stamp_records(records, [raw_hash(item) for item in raw_data])
+        return records
+
+    def stamp_records(self, records, raw_hashes):
+        """Stamp ``records`` with ``CLEANER_VERSION`` and their raw rows' hashes; returns them."""
+        for record, digest in zip(records, raw_hashes):
+            record.cleaner_version = self.CLEANER_VERSION
+            record.raw_hash = digest
+        return records
+
+    def clean_data_parallel(self, raw_iter, workers=None, chunk_size=None, min_rows=None):
+        """``clean_records_parallel``, returning legacy JSON dicts like ``clean_data``."""
+        records = self.clean_records_parallel(raw_iter, workers, chunk_size, min_rows)
+        return [record.to_dict() for record in records]
+
+    def clean_records_parallel(  # pylint: disable=too-many-locals
+        self, raw_iter, workers=None, chunk_size=None, min_rows=None
+    ):
+        """
+        Clean rows across a process pool, keeping the input order.
+
+        ``raw_iter`` is consumed lazily in chunks of ``chunk_size`` rows
+        (``PARALLEL_CHUNK_ROWS``) with at most two chunks per worker in
+        flight. If it holds fewer than ``min_rows`` rows
+        (``PARALLEL_MIN_ROWS``), or ``workers`` is 0, the rows are cleaned
+        in-process instead. ``chunk_timings`` is reset to one
+        ``{"rows", "seconds"}`` entry per chunk, timed where it was cleaned.
+
+        Args:
+            raw_iter (Iterable[dict]): Raw rows.
+            workers (int or None): Processes; None uses every core, 0 none.
+            chunk_size (int or None): Rows per pool task.
+            min_rows (int or None): Smallest batch worth a pool.
+
+        Returns:
+            list: The ``ApplicantRecord`` objects, in input order.
+        """
+        chunk_size = max(1, chunk_size or self.PARALLEL_CHUNK_ROWS)
+        min_rows = self.PARALLEL_MIN_ROWS if min_rows is None else min_rows
+        raw_iter = iter(raw_iter)
+        self.chunk_timings = []
+
+        # Peek whole chunks until the batch is known to be big enough for a pool
+        head = list(islice(raw_iter, -(-max(min_rows, 1) // chunk_size) * chunk_size))
+        if workers == 0 or not head or len(head) < min_rows:
+            head.extend(raw_iter)
+            cleaned = []
+            for start in range(0, len(head), chunk_size):
+                records, seconds = _timed_clean(self, head[start:start + chunk_size])
+                self.chunk_timings.append({"rows": len(records), "seconds": seconds})
+                cleaned.extend(records)
+            return cleaned
+
+        def chunks():
+            for start in range(0, len(head), chunk_size):
+                yield head[start:start + chunk_size]
+            while True:
+                chunk = list(islice(raw_iter, chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+        cleaned = []
+        workers = workers or os.cpu_count() or 1
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            window = 2 * workers
+            in_flight = deque()
+            for chunk in chunks():
+                in_flight.append(pool.submit(_clean_chunk, chunk))
+                if len(in_flight) >= window:
+                    self._collect(in_flight.popleft(), cleaned)
+            while in_flight:
+                self._collect(in_flight.popleft(), cleaned)
+        return cleaned
+
+    def _collect(self, future, cleaned):
+        records, seconds = future.result()
+        self.chunk_timings.append({"rows": len(records), "seconds": seconds})
+        cleaned.extend(records)
+
+    def clean_table(self, raw_data, stamp=False):  # pylint: disable=too-many-locals
+        """
+        Clean a batch column-wise into an Arrow table for ``load_table``.
+
+        The row texts go into Arrow string arrays and every field is derived
+        by ``pyarrow.compute`` kernels: substring tests and RE2
+        ``extract_regex`` for the text fields, regex replace and trim for
+        whitespace, and ``parse_date`` once per distinct string for dates.
+        The table has ``TABLE_COLUMNS``, holding what ``load_from_list``
+        would insert for the ``clean_records`` records, with scores as
+        float64 and ``date_added`` as date32. Rows with non-ASCII text, where
+        RE2 and ``re`` can disagree on case and whitespace, are cleaned by
+        ``clean_data`` and patched in. With ``stamp`` the table also has
+        ``cleaner_version`` and ``raw_hash`` columns, as ``clean_records``
+        stamps them.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+        """
+        if pc is None:
+            raise ValueError("Columnar cleaning requires the pyarrow package.")
+        raw_data = list(raw_data)
+        blobs = pa.array([self._text_blob(item) for item in raw_data], pa.string())
+        fields = self._extract_columns(blobs)
+
+        texts = {
+            "program": [item.get("raw_prog") or item.get("Program Name") for item in raw_data],
+            "university": [item.get("raw_inst") or item.get("University") for item in raw_data],
+            "comments": [item.get("raw_comments") or item.get("Comments") for item in raw_data],
+            "url": [item.get("url") or item.get("URL link") for item in raw_data],
+            "term": [item.get("Season") for item in raw_data],
+            "us_or_international": [
+                item.get("International / American Student") for item in raw_data
+            ],
+            "degree": [item.get("raw_degree") or item.get("Masters or PhD") for item in raw_data],
+            "llm_generated_program": [item.get("llm_generated_program") for item in raw_data],
+            "llm_generated_university": [
+                item.get("llm_generated_university") for item in raw_data
+            ],
+        }
+        texts = {name: _text_array(values) for name, values in texts.items()}
+        today = pa.scalar(date.today(), pa.date32())
+        listed = _date_array(_text_array([self._raw_date(item) for item in raw_data]), today)
+        decided = _date_array(fields["decision_date"], pc.fill_null(listed, today))
+
+        columns = {
+            "program": _collapse(texts["program"]),
+            "university": _collapse(texts["university"]),
+            "comments": _collapse(texts["comments"], keep_empty=True),
+            "date_added": pc.coalesce(decided, listed),
+            "url": _blank_to_null(texts["url"]),
+            "status": fields["status"],
+            "term": _blank_to_null(pc.coalesce(fields["season"], texts["term"])),
+            "us_or_international": _blank_to_null(
+                pc.coalesce(fields["origin"], texts["us_or_international"])
+            ),
+            "degree": _collapse(texts["degree"]),
+            "llm_generated_program": _blank_to_null(texts["llm_generated_program"]),
+            "llm_generated_university": _blank_to_null(texts["llm_generated_university"]),
+        }
 
-            if not formatted_date:
-                raw_date = (
-                    item.get("raw_date")
-                    or item.get("Date of Information Added")
-                    or item.get("raw_date_added")
+        details = [
+            self._extract_detail_scores(item["raw_detail"]) if item.get("raw_detail") else None
+            for item in raw_data
+        ]
+        has_details = any(details)
+        for name, key in self.TABLE_COLUMNS:
+            if name not in self.NUMERIC_COLUMNS:
+                continue
+            candidates = [fields[name], _number_array([item.get(key) for item in raw_data])]
+            if has_details:
+                candidates.append(
+                    _number_array([detail.get(name) if detail else None for detail in details])
                 )
-                if raw_date:
-                    formatted_date = self._manual_format_date(raw_date)
-
-            obj = {
-                "Program Name": self._clean_str(item.get("raw_prog") or item.get("Program Name")),
-                "University": self._clean_str(item.get("raw_inst") or item.get("University")),
-                "Comments": self._clean_str(
-                    item.get("raw_comments") or item.get("Comments"),
-                    keep_empty=True,
-                ),
-                "Date of Information Added to Grad CafÃ©": formatted_date,
-                "URL link to applicant entry": item.get("url") or item.get("URL link"),
-                "Applicant Status": status,
-                "Accepted": None,
-                "Rejected": None,
-                "Semester and Year of Program Start": (
-                    self._extract_season(raw_text_blob) or item.get("Season")
-                ),
-                "International / American Student": (
-                    self._extract_origin(raw_text_blob)
-                    or item.get("International / American Student")
-                ),
-                "GRE Score": item.get("GRE Score"),
-                "GRE V Score": item.get("GRE V Score"),
-                "GRE AW": item.get("GRE AW"),
-                "Masters or PhD": self._clean_str(
-                    item.get("raw_degree") or item.get("Masters or PhD")
+            columns[name] = pc.coalesce(*candidates)
+
+        ascii_rows = pc.string_is_ascii(blobs)
+        for values in texts.values():
+            ascii_rows = pc.and_(ascii_rows, pc.fill_null(pc.string_is_ascii(values), True))
+        if not pc.all(ascii_rows).as_py():
+            other_rows = pc.invert(ascii_rows)
+            records = self.clean_records(
+                raw_data[index] for index in pc.indices_nonzero(other_rows).to_pylist()
+            )
+            for name, _ in self.TABLE_COLUMNS:
+                cells = [getattr(record, name) for record in records]
+                if name in self.NUMERIC_COLUMNS:
+                    patch = _number_array(cells)
+                elif name == "date_added":
+                    patch = pa.array(cells, pa.date32())
+                else:
+                    patch = _text_array(cells)
+                columns[name] = pc.replace_with_mask(columns[name], other_rows, patch)
+
+        names = [name for name, _ in self.TABLE_COLUMNS]
+        if stamp:
+            columns["cleaner_version"] = pa.array(
+                [self.CLEANER_VERSION] * len(raw_data), pa.int32()
+            )
+            columns["raw_hash"] = pa.array([raw_hash(item) for item in raw_data], pa.string())
+            names.extend(("cleaner_version", "raw_hash"))
+        return pa.table([columns[name] for name in names], names=names)
+
+    @staticmethod
+    def _extract_columns(blobs):
+        """Run the ``_extract_fields`` extraction over an Arrow string array."""
+
+        def contains(word):
+            return pc.match_substring(blobs, word, ignore_case=True)
+
+        def extract(name):
+            return pc.struct_field(pc.extract_regex(blobs, ARROW_FIELD_PATTERNS[name]), name)
+
+        def score(name):
+            return pc.cast(extract(name), pa.float64())
+
+        status = pc.if_else(
+            contains("accepted"),
+            "Accepted",
+            pc.if_else(
+                contains("rejected"),
+                "Rejected",
+                pc.if_else(
+                    contains("wait"),
+                    "Waitlisted",
+                    pc.if_else(contains("interview"), "Interview", "Other"),
                 ),
-                "GPA": item.get("GPA"),
-                "llm_generated_program": item.get("llm_generated_program"),
-                "llm_generated_university": item.get("llm_generated_university"),
-            }
-
-            if status == "Accepted":
-                obj["Accepted"] = formatted_date
-            elif status == "Rejected":
-                obj["Rejected"] = formatted_date
-
-            gpa = self._extract_gpa(raw_text_blob)
-            if gpa is not None:
-                obj["GPA"] = gpa
-
-            gre = self._extract_gre(raw_text_blob)
-            if gre["total"] is not None:
-                obj["GRE Score"] = gre["total"]
-            if gre["verbal"] is not None:
-                obj["GRE V Score"] = gre["verbal"]
-            if gre["aw"] is not None:
-                obj["GRE AW"] = gre["aw"]
-
-            cleaned_batch.append(self._prune_nulls(obj))
-
-        return cleaned_batch
-
-    def save_data(self):
-        """Write cleaned records to disk."""
+            ),
+        )
+        origin = pc.if_else(
+            contains("international"),
+            "International",
+            pc.if_else(contains("american"), "American", pa.scalar(None, pa.string())),
+        )
+        on_day = pc.extract_regex(blobs, ARROW_FIELD_PATTERNS["on_day"])
+        on_month = pc.extract_regex(blobs, ARROW_FIELD_PATTERNS["on_month"])
+        decision_date = pc.coalesce(
+            pc.binary_join_element_wise(
+                pc.struct_field(on_day, "day"), pc.struct_field(on_day, "month"), " "
+            ),
+            pc.binary_join_element_wise(
+                pc.struct_field(on_month, "day"), pc.struct_field(on_month, "month"), " "
+            ),
+        )
+        return {
+            "status": status,
+            "decision_date": decision_date,
+            "season": extract("season"),
+            "origin": origin,
+            "gpa": score("gpa"),
+            "gre": score("gre"),
+            "gre_v": score("verbal"),
+            "gre_aw": score("aw"),
+        }
+
+    @staticmethod
+    def _text_blob(item):
+        """Join the free-text fields of a raw row the way every extractor sees them."""
+        return " ".join(
+            [
+                str(item.get("raw_text", "")),
+                str(item.get("Decision Details", "")),
+                str(item.get("raw_decision", "")),
+                str(item.get("raw_comments", "")),
+                str(item.get("Comments", "")),
+            ]
+        )
+
+    def _build_record(self, item, fields):
+        """Assemble one ``ApplicantRecord`` from a raw row and its extracted ``fields``."""
+        status = fields["status"]
+        # A decision date has no year: it is the latest one on or before the listing date
+        today = date.today()
+        listed = parse_date(self._raw_date(item), today)
+        decided = fields["decision_date"]
+        formatted_date = parse_date(decided, listed or today) if decided else None
+        if formatted_date is None:
+            formatted_date = listed
+
+        record = ApplicantRecord.__new__(ApplicantRecord)
+        record.program = self._clean_str(item.get("raw_prog") or item.get("Program Name"))
+        record.university = self._clean_str(item.get("raw_inst") or item.get("University"))
+        record.comments = self._clean_str(
+            item.get("raw_comments") or item.get("Comments"),
+            keep_empty=True,
+        )
+        record.date_added = formatted_date
+        record.url = blank_to_none(item.get("url") or item.get("URL link"))
+        record.status = status
+        record.accepted = formatted_date if status == "Accepted" else None
+        record.rejected = formatted_date if status == "Rejected" else None
+        record.term = blank_to_none(fields["season"] or item.get("Season"))
+        record.us_or_international = blank_to_none(
+            fields["origin"] or item.get("International / American Student")
+        )
+        record.degree = self._clean_str(item.get("raw_degree") or item.get("Masters or PhD"))
+        record.llm_generated_program = blank_to_none(item.get("llm_generated_program"))
+        record.llm_generated_university = blank_to_none(item.get("llm_generated_university"))
+        record.cleaner_version = None
+        record.raw_hash = None
+
+        gpa = fields["gpa"]
+        gre = fields["gre"]
+        verbal = fields["verbal"]
+        aw = fields["aw"]
+        record.gpa = gpa if gpa is not None else blank_to_none(item.get("GPA"))
+        record.gre = gre if gre is not None else blank_to_none(item.get("GRE Score"))
+        record.gre_v = verbal if verbal is not None else blank_to_none(item.get("GRE V Score"))
+        record.gre_aw = aw if aw is not None else blank_to_none(item.get("GRE AW"))
+
+        if item.get("raw_detail"):
+            for key, value in self._extract_detail_scores(item["raw_detail"]).items():
+                if getattr(record, key) is None:
+                    setattr(record, key, value)
+
+        return record
+
+    def save_data(self, out_store=None):
+        """Append ``cleaned_data`` to the output store as one batch; returns True on success."""
+        if not self.cleaned_data:
+            return True
         try:
-            with open(self.output_file, "w", encoding="utf-8") as file_handle:
-                json.dump(self.cleaned_data, file_handle, indent=4)
+            if out_store is None:
+                out_store = RawStore(store_path_for(self.output_file))
+            out_store.new_segment()
+            out_store.append(self.cleaned_data)
         except (OSError, TypeError, ValueError) as save_error:
             print(f"Error saving data: {save_error}")
+            return False
+        return True
+
+    @classmethod
+    def _read_merge_state(cls, out_store):
+        try:
+            with open(out_store.path / MERGE_STATE_FILE, "r", encoding="utf-8") as file_handle:
+                state = json.load(file_handle)
+            merge_state = {"records": int(state["records"]), "raw_offset": int(state["raw_offset"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {"records": None, "raw_offset": 0}
+        # Another cleaner version signs records differently: rebuild the index
+        if state.get("cleaner_version") != cls.CLEANER_VERSION:
+            merge_state["records"] = None
+        return merge_state
+
+    @staticmethod
+    def _write_merge_state(out_store, state):
+        tmp_file = out_store.path / (MERGE_STATE_FILE + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as file_handle:
+            json.dump(state, file_handle)
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        os.replace(tmp_file, out_store.path / MERGE_STATE_FILE)
+
+    def _open_index(self, out_store, state):
+        """Map the store's signature index, rebuilding it unless ``state`` matches the store."""
+        index_file = out_store.path / SIGNATURE_INDEX_FILE
+        if state["records"] == len(out_store):
+            index = SignatureFile.open(index_file)
+            if index is not None:
+                return index
+        out_store.path.mkdir(parents=True, exist_ok=True)
+        index = SignatureFile(index_file, capacity=len(out_store))
+        index.update(self._signature(ApplicantRecord.from_dict(entry)) for entry in out_store)
+        return index
 
     @staticmethod
     def _norm(value):
         return " ".join(str(value).strip().lower().split()) if value else ""
 
     @classmethod
-    def _get_date(cls, entry):
-        for key in cls.DATE_KEY_VARIANTS:
-            value = entry.get(key)
-            if value:
-                return value
-        return None
+    def _signature(cls, record):
+        """Return the 64-bit dedupe signature of an ``ApplicantRecord``."""
+        return signature64(
+            cls._norm(record.university),
+            cls._norm(record.program),
+            cls._norm(record.date_added),
+            cls._norm(record.comments),
+        )
 
     @staticmethod
     def _clean_str(value, keep_empty=False):
@@ -198,19 +675,98 @@ class DataCleaner:
 
     @staticmethod
     def _prune_nulls(obj):
-        pruned = {}
-        for key, value in obj.items():
-            if key == "Comments":
-                pruned[key] = "" if (value is None or str(value).strip() == "") else value
-                continue
-            if value is None:
-                continue
-            if isinstance(value, str) and value.strip() == "":
-                continue
-            pruned[key] = value
-        pruned.setdefault("Comments", "")
+        pruned = {
+            key: value
+            for key, value in obj.items()
+            if key == "Comments"
+            or (value is not None and not (isinstance(value, str) and not value.strip()))
+        }
+        comments = pruned.get("Comments")
+        if comments is None or not str(comments).strip():
+            pruned["Comments"] = ""
         return pruned
 
+    @classmethod
+    def _extract_fields(cls, text):  # pylint: disable=too-many-branches
+        """
+        Extract every text-derived field of a row in one scan of ``text``.
+
+        Returns the same values as ``_parse_status_date``, ``_extract_season``,
+        ``_extract_origin``, ``_extract_gpa`` and ``_extract_gre`` combined:
+        ``status``, ``decision_date``, ``season``, ``origin``, ``gpa``,
+        ``gre``, ``verbal`` and ``aw``. Non-ASCII text, where lowercasing
+        and case-insensitive matching can disagree, goes through those
+        helpers instead.
+        """
+        text = str(text)
+        if not text.isascii():
+            return cls._extract_fields_slow(text)
+
+        text_lower = text.lower()
+        if "accepted" in text_lower:
+            status = "Accepted"
+        elif "rejected" in text_lower:
+            status = "Rejected"
+        elif "wait" in text_lower:
+            status = "Waitlisted"
+        elif "interview" in text_lower:
+            status = "Interview"
+        else:
+            status = "Other"
+        if "international" in text_lower:
+            origin = "International"
+        elif "american" in text_lower:
+            origin = "American"
+        else:
+            origin = None
+
+        first = {}
+        for match in FIELD_RE.finditer(text_lower):
+            if match.lastgroup not in first:
+                first[match.lastgroup] = match
+
+        decision_date = None
+        if "on_day_month" in first:
+            match = first["on_day_month"]
+            month = text[match.start("on_day_month"):match.end("on_day_month")]
+            decision_date = f"{match.group('on_day')} {month}"
+        elif "on_month_day" in first:
+            match = first["on_month_day"]
+            month = text[match.start("on_month"):match.end("on_month")]
+            decision_date = f"{match.group('on_month_day')} {month}"
+
+        season = first.get(None)
+        gpa = first.get("gpa")
+        gre = first.get("gre")
+        verbal = first.get("verbal")
+        aw = first.get("aw")
+        return {
+            "status": status,
+            "decision_date": decision_date,
+            "season": text[season.start():season.end()] if season else None,
+            "origin": origin,
+            "gpa": float(gpa.group("gpa")) if gpa else None,
+            "gre": int(gre.group("gre")) if gre else None,
+            "verbal": int(verbal.group("verbal")) if verbal else None,
+            "aw": float(aw.group("aw")) if aw else None,
+        }
+
+    @classmethod
+    def _extract_fields_slow(cls, text):
+        """``_extract_fields`` built from the per-field helpers."""
+        status, decision_date = cls._parse_status_date(text)
+        gre = cls._extract_gre(text)
+        return {
+            "status": status,
+            "decision_date": decision_date,
+            "season": cls._extract_season(text),
+            "origin": cls._extract_origin(text),
+            "gpa": cls._extract_gpa(text),
+            "gre": gre["total"],
+            "verbal": gre["verbal"],
+            "aw": gre["aw"],
+        }
+
     @staticmethod
     def _parse_status_date(text):
         text_lower = str(text).lower()
@@ -235,41 +791,14 @@ class DataCleaner:
         return status, None
 
     @staticmethod
-    def _manual_format_date(date_str):
-        if not date_str:
-            return None
-
-        cleaned = str(date_str).replace(",", "").strip()
-        year_match = re.search(r"\d{4}", cleaned)
-        year = year_match.group(0) if year_match else "2026"
-
-        month_map = {
-            "jan": "Jan",
-            "feb": "Feb",
-            "mar": "Mar",
-            "apr": "Apr",
-            "may": "May",
-            "jun": "Jun",
-            "jul": "Jul",
-            "aug": "Aug",
-            "sep": "Sep",
-            "oct": "Oct",
-            "nov": "Nov",
-            "dec": "Dec",
-        }
-        month_match = re.search(r"[A-Za-z]{3,}", cleaned)
-        if not month_match:
-            return None
-
-        raw_month = month_match.group(0).lower()[:3]
-        month = month_map.get(raw_month, raw_month.capitalize())
-
-        without_year = cleaned.replace(year, "")
-        day_match = re.search(r"\d{1,2}", without_year)
-        if not day_match:
-            return None
-        day = day_match.group(0)
-        return f"{day} {month} {year}"
+    def _raw_date(item):
+        """Return the listing date string of a raw row, or None."""
+        return (
+            item.get("raw_date")
+            or item.get("Date of Information Added")
+            or item.get("raw_date_added")
+            or None
+        )
 
     @staticmethod
     def _extract_season(text):
@@ -310,10 +839,44 @@ class DataCleaner:
 
         return result
 
+    @classmethod
+    def _extract_detail_scores(cls, detail):
+        """Map detail page fields (see ``enrich_details``) to ``ApplicantRecord`` score fields."""
+        scores = {}
+        if not isinstance(detail, dict):
+            return scores
+        for label, value in detail.items():
+            spec = cls.DETAIL_SCORE_FIELDS.get(" ".join(str(label).lower().rstrip(":").split()))
+            number = re.search(r"\d+(?:\.\d+)?", str(value))
+            if spec is None or number is None:
+                continue
+            field, cast, lowest, highest = spec
+            parsed = cast(float(number.group(0)))
+            if lowest <= parsed <= highest:
+                scores.setdefault(field, parsed)
+        return scores
+
+
+_CHUNK_CLEANER = None
+
+
+def _timed_clean(cleaner, raw_chunk):
+    start = time.perf_counter()
+    records = cleaner.clean_records(raw_chunk)
+    return records, time.perf_counter() - start
+
+
+def _clean_chunk(raw_chunk):
+    """Clean one chunk in a pool process; the target of ``clean_data_parallel``."""
+    global _CHUNK_CLEANER  # pylint: disable=global-statement
+    if _CHUNK_CLEANER is None:
+        _CHUNK_CLEANER = DataCleaner(input_file=None, output_file=None)
+    return _timed_clean(_CHUNK_CLEANER, raw_chunk)
+
 
 def main():
-    """Execute the cleaning pipeline directly."""
-    cleaner = DataCleaner()
+    """Execute the cleaning pipeline directly, on every core for large inputs."""
+    cleaner = DataCleaner(workers=None)
     cleaner.update_and_merge()
 
 
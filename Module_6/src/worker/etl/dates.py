@@ -0,0 +1,111 @@
+"""
+Date Normalization Module
+=========================
+
+One parser for every date the pipeline handles: GradCafe listing dates
+("28 Feb 2026", "February 23, 2026"), decision dates without a year
+("6 Jan"), legacy cleaned records and ISO dates from the DB. Each distinct
+string is parsed once; dates come back as ``datetime.date`` values, which
+psycopg stores in ``DATE`` columns and JSON records spell in ISO format.
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+# Distinct date strings whose parse is kept; a scrape sees a few hundred.
+DATE_CACHE_SIZE = 4096
+# Furthest back a yearless date is placed (Feb 29 can need up to eight years).
+MAX_YEARS_BACK = 8
+
+_YEAR_RE = re.compile(r"\d{4}")
+_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+_DAY_RE = re.compile(r"\d{1,2}")
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+# Full and three-letter month names (and "sept"), lowercased -> month number
+MONTHS = {name: number for number, name in enumerate(_MONTH_NAMES, 1)}
+MONTHS.update({name[:3]: number for name, number in list(MONTHS.items())})
+MONTHS["sept"] = 9
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _date_parts(text):
+    """Return ``(year or None, month, day)`` for a date string, or None."""
+    try:
+        parsed = date.fromisoformat(text)
+        return parsed.year, parsed.month, parsed.day
+    except ValueError:
+        pass
+
+    year_match = _YEAR_RE.search(text)
+    month = next(
+        (
+            MONTHS[word]
+            for word in map(str.lower, _WORD_RE.findall(text))
+            if word in MONTHS
+        ),
+        None,
+    )
+    if month is None:
+        return None
+    without_year = text.replace(year_match.group(0), " ") if year_match else text
+    day_match = _DAY_RE.search(without_year)
+    if not day_match:
+        return None
+    return (int(year_match.group(0)) if year_match else None), month, int(day_match.group(0))
+
+
+def parse_date(value, reference=None):
+    """
+    Normalize a date string (or date) to a ``datetime.date``.
+
+    A date without a year ("6 Jan") is placed in the latest year that puts
+    it on or before ``reference``, e.g. the date its row was posted; with
+    no ``reference`` it is rejected.
+
+    Args:
+        value: A GradCafe, legacy or ISO date string, or a date.
+        reference (datetime.date or None): Latest date a yearless date can be.
+
+    Returns:
+        datetime.date or None: The date, or None if ``value`` is not a
+        valid date (including Feb 29 outside a leap year).
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    parts = _date_parts(" ".join(str(value).replace(",", " ").split()))
+    if parts is None:
+        return None
+
+    return _place_date(*parts, reference)
+
+
+def _place_date(year, month, day, reference):
+    """Build the date, putting a yearless one in the latest year on or before ``reference``."""
+    if year is not None:
+        years = (year,)
+    elif reference is not None:
+        years = range(reference.year, reference.year - MAX_YEARS_BACK, -1)
+    else:
+        return None
+    for candidate_year in years:
+        try:
+            candidate = date(candidate_year, month, day)
+        except ValueError:
+            continue
+        if year is not None or candidate <= reference:
+            return candidate
+    return None
+
+
+def iso_date(value, reference=None):
+    """Return ``parse_date(value, reference)`` as a "YYYY-MM-DD" string, or None."""
+    parsed = parse_date(value, reference)
+    return parsed.isoformat() if parsed else None
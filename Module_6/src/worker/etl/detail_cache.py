@@ -0,0 +1,66 @@
+"""
+Detail Cache Module
+===================
+
+Persistent cache of the fields parsed from GradCafe result detail pages,
+keyed by detail page URL.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+try:
+    from src.worker.etl.ndjson import load_ndjson
+except ImportError:  # pragma: no cover - local test fallback
+    from worker.etl.ndjson import load_ndjson
+
+
+class DetailCache:
+    """
+    Append-only NDJSON map of detail page URL to its parsed fields.
+
+    Each stored page is one ``{"url": ..., "fields": {...}}`` line, written
+    as soon as it is fetched, so a detail page is downloaded at most once
+    across runs. A page that no longer exists is stored with empty fields.
+    With no path the cache lives in memory only.
+    """
+
+    def __init__(self, path=None):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path (str, Path or None): NDJSON file; None keeps the cache in memory.
+        """
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._fields = {}
+
+        if self.path is None:
+            return
+        for record in load_ndjson(self.path):
+            self._fields[record["url"]] = record["fields"]
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, url):
+        return url in self._fields
+
+    def get(self, url):
+        """Return the cached fields of ``url``, or None if it was never fetched."""
+        return self._fields.get(url)
+
+    def put(self, url, fields):
+        """Store the fields parsed from ``url``; later puts for the same URL are ignored."""
+        with self._lock:
+            if url in self._fields:
+                return
+            self._fields[url] = fields
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as file_handle:
+                record = {"url": url, "fields": fields}
+                file_handle.write(json.dumps(record, ensure_ascii=False) + "\n")
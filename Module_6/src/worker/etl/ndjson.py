@@ -0,0 +1,49 @@
+"""
+NDJSON Log Module
+=================
+
+Read side of the append-only NDJSON files the page archive index and the
+detail cache are kept in.
+"""
+
+import json
+import os
+
+
+def load_ndjson(path):
+    """
+    Return the records of an append-only NDJSON file, repairing a torn tail.
+
+    A write interrupted mid-append leaves a final line without its newline.
+    The file is truncated back to the last newline, so the next append starts
+    a fresh line instead of running into the fragment. Complete lines that
+    do not parse are skipped.
+
+    Args:
+        path (str or Path): NDJSON file.
+
+    Returns:
+        list: The parsed records in file order; empty if the file is missing
+        or unreadable.
+    """
+    records = []
+    complete = 0
+    try:
+        with open(path, "rb") as file_handle:
+            for line in file_handle:
+                if not line.endswith(b"\n"):
+                    break
+                complete += len(line)
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+            torn = os.fstat(file_handle.fileno()).st_size > complete
+    except OSError:
+        return []
+    if torn:
+        try:
+            os.truncate(path, complete)
+        except OSError:
+            pass  # a read-only copy still loads; it is just never appended to
+    return records
@@ -0,0 +1,139 @@
+"""
+Page Archive Module
+===================
+
+WARC-like, gzip-compressed snapshot archive of every fetched result page so
+raw entries can be rebuilt offline after a parser or cleaner fix.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    from src.worker.etl.ndjson import load_ndjson
+except ImportError:  # pragma: no cover - local test fallback
+    from worker.etl.ndjson import load_ndjson
+
+_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+
+
+class PageArchive:
+    """
+    Append-only archive of page snapshots.
+
+    Each snapshot is one gzip member holding a WARC-style header block and
+    the raw body, appended to ``snapshots-NNNNN.warc.gz`` segments, so any
+    record can be read back with a single seek. ``index.ndjson`` lists each
+    record's URL, page number, capture time, body hash and member offset.
+    A body identical to the last snapshot of the same URL is not stored
+    again.
+    """
+
+    SEGMENT_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, path):
+        """
+        Open (or create) an archive directory.
+
+        Args:
+            path (str or Path): Archive directory.
+        """
+        self.path = Path(path)
+        self.index_file = self.path / "index.ndjson"
+        self._lock = threading.Lock()
+        self._records = []
+        self._latest = {}
+
+        for record in load_ndjson(self.index_file):
+            self._records.append(record)
+            self._latest[record["url"]] = record["sha256"]
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        """Yield ``(record, body)`` pairs in capture order."""
+        for record in self.records():
+            yield record, self.read(record)
+
+    def records(self):
+        """Return a copy of the index records in capture order."""
+        with self._lock:
+            return list(self._records)
+
+    def add(self, url, body, fetched_at=None):
+        """
+        Archive one page body.
+
+        Args:
+            url (str): Page URL.
+            body (bytes or str): Response body.
+            fetched_at (float or None): UNIX capture time, defaults to now.
+
+        Returns:
+            bool: True if a new snapshot was written.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        sha = hashlib.sha256(body).hexdigest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        captured = datetime.fromtimestamp(fetched_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {captured}\r\n"
+            f"WARC-Payload-Digest: sha256:{sha}\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("utf-8")
+        member = gzip.compress(header + body + b"\r\n\r\n")
+
+        with self._lock:
+            if self._latest.get(url) == sha:
+                return False
+            self.path.mkdir(parents=True, exist_ok=True)
+            segment = self._segment_name()
+            with open(self.path / segment, "ab") as file_handle:
+                offset = file_handle.tell()
+                file_handle.write(member)
+            page_match = _PAGE_RE.search(url)
+            record = {
+                "url": url,
+                "page": int(page_match.group(1)) if page_match else None,
+                "fetched_at": fetched_at,
+                "sha256": sha,
+                "file": segment,
+                "offset": offset,
+                "length": len(member),
+            }
+            with open(self.index_file, "a", encoding="utf-8") as file_handle:
+                file_handle.write(json.dumps(record) + "\n")
+            self._records.append(record)
+            self._latest[url] = sha
+        return True
+
+    def read(self, record):
+        """Return the body bytes of one index record."""
+        with open(self.path / record["file"], "rb") as file_handle:
+            file_handle.seek(record["offset"])
+            member = gzip.decompress(file_handle.read(record["length"]))
+        _, _, body = member.partition(b"\r\n\r\n")
+        return body[:-4] if body.endswith(b"\r\n\r\n") else body
+
+    def _segment_name(self):
+        name = self._records[-1]["file"] if self._records else "snapshots-00001.warc.gz"
+        try:
+            if os.path.getsize(self.path / name) >= self.SEGMENT_BYTES:
+                number = int(name.split("-")[1].split(".")[0]) + 1
+                name = f"snapshots-{number:05d}.warc.gz"
+        except OSError:
+            pass
+        return name
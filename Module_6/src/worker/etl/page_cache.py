@@ -0,0 +1,163 @@
+"""
+Page Cache Module
+=================
+
+Content-addressed on-disk cache of GradCafe result pages with the validators
+needed for conditional requests.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class PageCache:
+    """
+    Store fetched pages by body hash and remember per-URL validators.
+
+    ``index.json`` maps each URL to its ``etag``, ``last_modified``, body
+    ``sha256`` and the ``ingested`` hash of the last version whose entries
+    were handed to the pipeline. Bodies live gzip-compressed under
+    ``pages/<sha[:2]>/<sha>.html.gz`` so identical pages share one file.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir (str or Path): Directory holding the index and bodies.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.index_file = self.cache_dir / "index.json"
+        self._lock = threading.Lock()
+        self.index = {}
+        self.stats = {}
+        self.reset_stats()
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as file_handle:
+                self.index = json.load(file_handle)
+            if not isinstance(self.index, dict):
+                self.index = {}
+        except (OSError, ValueError):
+            self.index = {}
+
+    def reset_stats(self):
+        """Zero the per-run counters."""
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+        }
+
+    def report(self):
+        """Return the run counters plus the overall hit rate."""
+        hits = self.stats["not_modified"] + self.stats["unchanged"]
+        requests = self.stats["requests"]
+        return {**self.stats, "hits": hits, "hit_rate": hits / requests if requests else 0.0}
+
+    def conditional_headers(self, url):
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for ``url``."""
+        entry = self.index.get(url)
+        if not entry or not self._body_path(entry["sha256"]).exists():
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_not_modified(self, url):
+        """Count a 304 for ``url`` and return the cached body hash."""
+        entry = self.index[url]
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["not_modified"] += 1
+            self.stats["bytes_saved"] += entry.get("size", 0)
+        return entry["sha256"]
+
+    def store(self, url, body, headers):
+        """
+        Save a freshly downloaded body and its validators.
+
+        Args:
+            url (str): Page URL.
+            body (bytes): Raw response body.
+            headers (Mapping): Response headers.
+
+        Returns:
+            str: Hex SHA-256 of ``body``.
+        """
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._body_path(sha)
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_downloaded"] += len(body)
+            if self.is_ingested(url, sha):
+                self.stats["unchanged"] += 1
+
+            if not path.exists():
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    with gzip.open(path, "wb") as file_handle:
+                        file_handle.write(body)
+                except OSError:
+                    pass
+
+            previous = self.index.get(url, {})
+            self.index[url] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "sha256": sha,
+                "size": len(body),
+                "ingested": previous.get("ingested"),
+            }
+            old_sha = previous.get("sha256")
+            if old_sha and old_sha != sha and not self._is_referenced(old_sha):
+                try:
+                    self._body_path(old_sha).unlink()
+                except OSError:
+                    pass
+        return sha
+
+    def read_body(self, sha):
+        """Return the cached page text for ``sha``, or None if missing."""
+        try:
+            with gzip.open(self._body_path(sha), "rb") as file_handle:
+                return file_handle.read().decode("utf-8", errors="replace")
+        except (OSError, EOFError):
+            return None
+
+    def is_ingested(self, url, sha):
+        """Return True when ``sha`` is the version of ``url`` already ingested."""
+        return self.index.get(url, {}).get("ingested") == sha
+
+    def mark_ingested(self, url, sha):
+        """Record that the entries of this page version reached the pipeline."""
+        with self._lock:
+            if url in self.index:
+                self.index[url]["ingested"] = sha
+
+    def save(self):
+        """Atomically rewrite the index."""
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with self._lock, open(tmp_file, "w", encoding="utf-8") as file_handle:
+                json.dump(self.index, file_handle)
+            os.replace(tmp_file, self.index_file)
+        except OSError as save_error:
+            print(f"Error saving page cache: {save_error}")
+
+    def _body_path(self, sha):
+        return self.cache_dir / "pages" / sha[:2] / f"{sha}.html.gz"
+
+    def _is_referenced(self, sha):
+        return any(entry.get("sha256") == sha for entry in self.index.values())
@@ -0,0 +1,174 @@
+"""
+Rate Limit Module
+=================
+
+Per-host token-bucket rate limiting with additive-increase /
+multiplicative-decrease (AIMD) control of both request rate and concurrency.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value, now=None):
+    """
+    Convert a ``Retry-After`` header into seconds.
+
+    Args:
+        value (str or None): Delay in seconds or an HTTP date.
+        now (float or None): Current UNIX time, for testing.
+
+    Returns:
+        float or None: Seconds to wait, or None if absent/unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class _HostState:  # pylint: disable=too-few-public-methods
+    """Mutable limiter state for one host."""
+
+    __slots__ = (
+        "rate", "tokens", "updated", "concurrency", "in_flight", "paused_until", "last_decrease"
+    )
+
+    def __init__(self, rate, concurrency, now):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = now
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.paused_until = now
+        self.last_decrease = float("-inf")
+
+
+class AdaptiveRateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Gate requests per host and adapt to how the server responds.
+
+    Every request takes one token (refilled at ``rate`` per second, bursting
+    up to one second's worth) and one of ``concurrency`` slots. Successful,
+    fast responses grow the rate by ``rate_step`` and the concurrency by
+    ``1 / concurrency``. A 429/503, a block page or a response slower than
+    ``latency_target`` multiplies both by ``backoff`` (at most once per
+    ``latency_target`` seconds, so one burst of failures counts once), and
+    ``Retry-After`` pauses the host entirely until it expires.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        rate=1.0,
+        min_rate=0.1,
+        max_rate=10.0,
+        concurrency=1.0,
+        max_concurrency=8,
+        *,
+        rate_step=0.1,
+        backoff=0.5,
+        latency_target=3.0,
+        clock=time.monotonic,
+    ):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._hosts = {}
+
+    def acquire(self, host):
+        """Block until ``host`` has both a free slot and a token."""
+        with self._cond:
+            state = self._state(host)
+            while True:
+                now = self._clock()
+                self._refill(state, now)
+                if now < state.paused_until:
+                    wait = state.paused_until - now
+                elif state.in_flight >= int(state.concurrency):
+                    wait = None
+                elif state.tokens < 1.0:
+                    wait = (1.0 - state.tokens) / state.rate
+                else:
+                    state.tokens -= 1.0
+                    state.in_flight += 1
+                    return
+                self._cond.wait(wait)
+
+    def release(  # pylint: disable=too-many-arguments
+        self, host, status=None, latency=None, retry_after=None, blocked=False
+    ):
+        """
+        Return a slot and feed the response back into the controller.
+
+        Args:
+            host (str): Host the request went to.
+            status (int or None): HTTP status, or None if the request failed.
+            latency (float or None): Seconds the request took.
+            retry_after (float or None): Parsed ``Retry-After`` delay.
+            blocked (bool): True if the body was a bot-protection page.
+        """
+        with self._cond:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            now = self._clock()
+
+            if retry_after:
+                state.paused_until = max(state.paused_until, now + retry_after)
+                state.tokens = 0.0
+
+            congested = blocked or status in (429, 503) or (
+                latency is not None and latency > self.latency_target
+            )
+            if congested:
+                if now - state.last_decrease >= self.latency_target:
+                    state.rate = max(self.min_rate, state.rate * self.backoff)
+                    state.concurrency = max(1.0, state.concurrency * self.backoff)
+                    state.last_decrease = now
+            elif status is not None and status < 400:
+                state.rate = min(self.max_rate, state.rate + self.rate_step)
+                state.concurrency = min(
+                    float(self.max_concurrency), state.concurrency + 1.0 / state.concurrency
+                )
+            self._cond.notify_all()
+
+    def snapshot(self):
+        """Return the live rate, concurrency and in-flight count per host."""
+        with self._cond:
+            now = self._clock()
+            return {
+                host: {
+                    "rate": round(state.rate, 3),
+                    "concurrency": int(state.concurrency),
+                    "in_flight": state.in_flight,
+                    "paused_for": round(max(0.0, state.paused_until - now), 3),
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.initial_rate, self.initial_concurrency, self._clock())
+            self._hosts[host] = state
+        return state
+
+    @staticmethod
+    def _refill(state, now):
+        elapsed = max(0.0, now - state.updated)
+        state.tokens = min(max(1.0, state.rate), state.tokens + elapsed * state.rate)
+        state.updated = now
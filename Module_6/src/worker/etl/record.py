@@ -0,0 +1,168 @@
+"""
+Applicant Record Module
+=======================
+
+Compact in-memory form of a cleaned applicant row. The cleaner builds
+``ApplicantRecord`` objects and the loader inserts them directly; the long
+legacy JSON keys only appear when a record is converted to or from a dict.
+"""
+
+from datetime import date
+
+try:
+    from src.worker.etl.dates import parse_date
+except ImportError:  # pragma: no cover - local test fallback
+    from worker.etl.dates import parse_date
+
+# Field -> legacy JSON key, in the key order of the cleaned JSON records
+JSON_KEYS = (
+    ("program", "Program Name"),
+    ("university", "University"),
+    ("comments", "Comments"),
+    ("date_added", "Date of Information Added to Grad CafÃ©"),
+    ("url", "URL link to applicant entry"),
+    ("status", "Applicant Status"),
+    ("accepted", "Accepted"),
+    ("rejected", "Rejected"),
+    ("term", "Semester and Year of Program Start"),
+    ("us_or_international", "International / American Student"),
+    ("gre", "GRE Score"),
+    ("gre_v", "GRE V Score"),
+    ("gre_aw", "GRE AW"),
+    ("degree", "Masters or PhD"),
+    ("gpa", "GPA"),
+    ("llm_generated_program", "llm_generated_program"),
+    ("llm_generated_university", "llm_generated_university"),
+)
+
+# Older exports spell the date key with extra layers of mojibake
+DATE_KEY_VARIANTS = (
+    "Date of Information Added to Grad CafÃ©",
+    "Date of Information Added to Grad CafÃƒÂ©",
+    "Date of Information Added to Grad CafÃƒÆ’Ã‚Â©",
+)
+
+# Fields holding ``datetime.date`` values, spelled "YYYY-MM-DD" in the JSON
+DATE_FIELDS = ("date_added", "accepted", "rejected")
+
+# Provenance stamped on records loaded into the DB; never part of the JSON
+STAMP_FIELDS = ("cleaner_version", "raw_hash")
+
+# The applicants table's insert columns, in load_from_list's order
+LOADER_FIELDS = (
+    "program", "university", "comments", "date_added", "url", "status", "term",
+    "us_or_international", "gpa", "gre", "gre_v", "gre_aw", "degree",
+    "llm_generated_program", "llm_generated_university",
+) + STAMP_FIELDS
+
+
+def blank_to_none(value):
+    """Return None for None and whitespace-only strings, else ``value``."""
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+class ApplicantRecord:  # pylint: disable=too-many-instance-attributes
+    """
+    One cleaned applicant row.
+
+    Fields are named after the ``applicants`` columns (plus ``accepted`` and
+    ``rejected``). Missing values are None, never blank strings, except
+    ``comments``, which is always a string. ``DATE_FIELDS`` hold
+    ``datetime.date`` values. ``cleaner_version`` and
+    ``raw_hash`` are None unless the cleaner stamped the record.
+    """
+
+    __slots__ = tuple(name for name, _ in JSON_KEYS) + STAMP_FIELDS
+
+    def __init__(self, **fields):
+        pop = fields.pop
+        self.program = pop("program", None)
+        self.university = pop("university", None)
+        self.comments = pop("comments", "")
+        self.date_added = pop("date_added", None)
+        self.url = pop("url", None)
+        self.status = pop("status", None)
+        self.accepted = pop("accepted", None)
+        self.rejected = pop("rejected", None)
+        self.term = pop("term", None)
+        self.us_or_international = pop("us_or_international", None)
+        self.gre = pop("gre", None)
+        self.gre_v = pop("gre_v", None)
+        self.gre_aw = pop("gre_aw", None)
+        self.degree = pop("degree", None)
+        self.gpa = pop("gpa", None)
+        self.llm_generated_program = pop("llm_generated_program", None)
+        self.llm_generated_university = pop("llm_generated_university", None)
+        self.cleaner_version = pop("cleaner_version", None)
+        self.raw_hash = pop("raw_hash", None)
+        if fields:
+            raise TypeError(f"Unknown applicant fields: {', '.join(sorted(fields))}")
+        if self.comments is None:
+            self.comments = ""
+
+    def __eq__(self, other):
+        # Compared by layout: the module may be imported as src.worker.etl.record too
+        if getattr(other, "__slots__", None) != self.__slots__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        )
+        return f"ApplicantRecord({fields})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def as_row(self):
+        """Return the values ``load_from_list`` inserts, in ``LOADER_FIELDS`` order."""
+        return (
+            self.program, self.university, self.comments, self.date_added, self.url,
+            self.status, self.term, self.us_or_international, self.gpa, self.gre,
+            self.gre_v, self.gre_aw, self.degree, self.llm_generated_program,
+            self.llm_generated_university, self.cleaner_version, self.raw_hash,
+        )
+
+    def to_dict(self):
+        """Return the legacy JSON record: keys in ``JSON_KEYS`` order, missing values left out."""
+        data = {}
+        for name, key in JSON_KEYS:
+            value = getattr(self, name)
+            if isinstance(value, date):
+                value = value.isoformat()
+            if value is not None:
+                data[key] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a record from a legacy JSON record, accepting any ``DATE_KEY_VARIANTS``
+        key. Dates in any format ``parse_date`` reads become ``datetime.date`` values.
+        """
+        record = cls.__new__(cls)
+        for name, key in JSON_KEYS:
+            setattr(record, name, blank_to_none(data.get(key)))
+        record.cleaner_version = None
+        record.raw_hash = None
+        if record.date_added is None:
+            for key in DATE_KEY_VARIANTS[1:]:
+                record.date_added = blank_to_none(data.get(key))
+                if record.date_added is not None:
+                    break
+        for name in DATE_FIELDS:
+            setattr(record, name, parse_date(getattr(record, name)))
+        comments = data.get("Comments")
+        record.comments = "" if comments is None or not str(comments).strip() else comments
+        return record
@@ -0,0 +1,176 @@
+"""
+Row Parser Module
+=================
+
+The row-level pieces every parser backend shares: the date and detail
+link patterns of a GradCafe result row, and ``RowStreamParser``, which
+extracts entries from HTML as it downloads.
+"""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin
+
+# GradCafe currently shows the "Added On" column as e.g. "February 23, 2026".
+LONG_DATE_RE = re.compile(
+    r"(?:January|February|March|April|May|June|July|August|September|October"
+    r"|November|December)\s+\d{1,2},\s+\d{4}"
+)
+DATE_RE = re.compile(r"\d{1,2}\s+[A-Za-z]{3}\s+\d{4}|" + LONG_DATE_RE.pattern)
+# Each result row links to its detail page, e.g. "/result/986123#comments".
+RESULT_LINK_RE = re.compile(r"/result/\d+")
+# Text inside these tags is dropped by BeautifulSoup.get_text, so lxml must skip it too.
+NON_TEXT_TAGS = ("script", "style", "template")
+
+
+def detail_link(href, page_url):
+    """Return the absolute detail page URL for a row link, or None if it is not one."""
+    if not href or not RESULT_LINK_RE.search(href):
+        return None
+    return urldefrag(urljoin(page_url, href))[0]
+
+
+def find_row_date(cell_texts):
+    """Return the first listing date in a row's cell texts, or "" if none has one."""
+    for text in cell_texts:
+        date_match = DATE_RE.search(text)
+        if date_match:
+            return date_match.group(0)
+    return ""
+
+
+class RowStreamParser(HTMLParser):  # pylint: disable=too-many-instance-attributes
+    """
+    Incremental, DOM-free counterpart of ``GradCafeScraper._extract_data_from_soup``.
+
+    Feed it HTML text in any chunk sizes; finished entries collect in
+    ``pop_entries()`` as soon as the following row starts, so only the
+    current row is held in memory. Text is gathered per ``<tr>``/``<td>``
+    exactly as ``get_text(strip=True)`` would see it. A new ``<tr>`` closes
+    the previous row the way browsers do, so unclosed rows are not nested
+    the way ``html.parser`` + BeautifulSoup would nest them.
+    """
+
+    def __init__(self, url):
+        super().__init__(convert_charrefs=True)
+        self.url = url
+        self._ready = []
+        self._current_entry = None
+        self._text = []
+        self._skip_depth = 0
+        self._in_row = False
+        self._row_pieces = []
+        self._cells = []
+        self._open_cells = []
+        self._span_pieces = None
+        self._span_depth = 0
+        self._row_link = None
+
+    def pop_entries(self):
+        """Return and clear the entries completed so far."""
+        ready, self._ready = self._ready, []
+        return ready
+
+    def close(self):
+        """Flush buffered markup and complete the final entry."""
+        super().close()
+        self._flush_text()
+        self._finish_row()
+        if self._current_entry is not None:
+            self._ready.append(self._current_entry)
+            self._current_entry = None
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in NON_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "tr":
+            self._finish_row()
+            self._in_row = True
+        elif not self._in_row:
+            return
+        elif tag == "td":
+            self._open_cells.append(len(self._cells))
+            self._cells.append([])
+        elif tag == "a" and self._row_link is None:
+            self._row_link = detail_link(dict(attrs).get("href"), self.url)
+        elif tag == "span":
+            if self._span_depth:
+                self._span_depth += 1
+            elif self._span_pieces is None and 1 in self._open_cells:
+                self._span_pieces = []
+                self._span_depth = 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in NON_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "tr":
+            self._finish_row()
+        elif tag == "td" and self._open_cells:
+            self._open_cells.pop()
+        elif tag == "span" and self._span_depth:
+            self._span_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        self._flush_text()
+
+    def _flush_text(self):
+        """Route one complete text node to the open row, cells and span."""
+        if not self._text:
+            return
+        piece = "".join(self._text).strip()
+        self._text = []
+        if not piece or not self._in_row:
+            return
+        self._row_pieces.append(piece)
+        for index in self._open_cells:
+            self._cells[index].append(piece)
+        if self._span_depth:
+            self._span_pieces.append(piece)
+
+    def _finish_row(self):
+        """Turn the buffered row into a new entry or a comment line."""
+        if not self._in_row:
+            return
+        cells = self._cells
+        if len(cells) >= 2 and len("".join(cells[0])) > 2:
+            if self._current_entry is not None:
+                self._ready.append(self._current_entry)
+
+            found_date = find_row_date(" ".join(cell) for cell in cells)
+            self._current_entry = {
+                "raw_inst": "".join(cells[0]),
+                "raw_prog": "".join(self._span_pieces or ()),
+                "raw_text": " ".join(self._row_pieces),
+                "raw_comments": "",
+                "url": self.url,
+                "raw_date": found_date,
+            }
+            if self._row_link:
+                self._current_entry["detail_url"] = self._row_link
+        elif self._current_entry is not None:
+            text = "".join(self._row_pieces)
+            if text:
+                self._current_entry["raw_comments"] += f" {text}"
+
+        self._in_row = False
+        self._row_pieces = []
+        self._cells = []
+        self._open_cells = []
+        self._span_pieces = None
+        self._span_depth = 0
+        self._row_link = None
@@ -5,39 +5,221 @@ Scraper Module
 Scrape applicant data from TheGradCafe.
 """
 
-import json
+import codecs
+import hashlib
+import multiprocessing
 import os
-import re
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import urllib3
 from bs4 import BeautifulSoup
 from urllib3.util.retry import Retry
 
-
-class GradCafeScraper:
+try:
+    from src.worker.etl.boundary import find_boundary_page, probe_page
+    from src.worker.etl.dates import parse_date
+    from src.worker.etl.detail_cache import DetailCache
+    from src.worker.etl.enrich import DetailEnricher
+    from src.worker.etl.page_archive import PageArchive
+    from src.worker.etl.page_cache import PageCache
+    from src.worker.etl.rate_limit import AdaptiveRateLimiter, parse_retry_after
+    from src.worker.etl.raw_store import RawStore, store_path_for
+    from src.worker.etl.row_parser import (
+        LONG_DATE_RE, NON_TEXT_TAGS, RESULT_LINK_RE, RowStreamParser, detail_link, find_row_date,
+    )
+    from src.worker.etl.signatures import SignatureSet, signature64
+except ImportError:  # pragma: no cover - local test fallback
+    from worker.etl.boundary import find_boundary_page, probe_page
+    from worker.etl.dates import parse_date
+    from worker.etl.detail_cache import DetailCache
+    from worker.etl.enrich import DetailEnricher
+    from worker.etl.page_archive import PageArchive
+    from worker.etl.page_cache import PageCache
+    from worker.etl.rate_limit import AdaptiveRateLimiter, parse_retry_after
+    from worker.etl.raw_store import RawStore, store_path_for
+    from worker.etl.row_parser import (
+        LONG_DATE_RE, NON_TEXT_TAGS, RESULT_LINK_RE, RowStreamParser, detail_link, find_row_date,
+    )
+    from worker.etl.signatures import SignatureSet, signature64
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - lxml is an optional fast path
+    lxml_etree = None
+    lxml_html = None
+
+PARSER_BACKENDS = ("html.parser", "lxml", "stream")
+# libxml2 folds "\r\n" into "\n"; carriage returns ride through lxml as this private-use char.
+CR_PLACEHOLDER = "\ue000"
+STREAM_CHUNK_SIZE = 16 * 1024
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+# Returned instead of entries when a page is byte-identical to the version already ingested.
+PAGE_UNCHANGED = object()
+# Bot-protection interstitials served instead of results.
+BLOCK_MARKERS = (
+    b"Just a moment",
+    b"Checking your browser",
+    b"Attention Required",
+    b"You have been blocked",
+)
+
+
+def parse_listing_date(text):
+    """
+    Parse a GradCafe date ("28 Feb 2026" or "February 23, 2026") or an ISO date.
+
+    Returns:
+        datetime.date or None: The date, or None if ``text`` is not a date.
+    """
+    return parse_date(text)
+
+
+def entry_date(entry):
+    """Return the date a raw entry was added, from ``raw_date`` or its row text."""
+    parsed = parse_listing_date(entry.get("raw_date"))
+    if parsed is None:
+        match = LONG_DATE_RE.search(str(entry.get("raw_text") or ""))
+        parsed = parse_listing_date(match.group(0)) if match else None
+    return parsed
+
+
+def dedupe_key(entry):
+    """Return the 64-bit signature a scrape run deduplicates entries on."""
+    return signature64(
+        entry.get("raw_inst"), entry.get("raw_prog"), str(entry.get("raw_text"))[:50]
+    )
+
+
+def entry_signature(entry):
+    """Return a short, stable hash identifying one raw entry."""
+    key = "\x1f".join(
+        " ".join(str(entry.get(field) or "").split())
+        for field in ("raw_inst", "raw_prog", "raw_text", "raw_comments")
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def advance_cursor(cursor, entries):
+    """
+    Move an ingest cursor past ``entries``.
+
+    A cursor is ``{"date": "YYYY-MM-DD", "signatures": [...]}``: the newest
+    listing date ingested so far and the signatures of every row ingested
+    with that date. Rows on the same date that arrive later are told apart
+    from already-ingested ones by signature.
+
+    Returns:
+        dict or None: The new cursor (unchanged if no entry has a date).
+    """
+    newest = parse_listing_date(cursor["date"]) if cursor else None
+    signatures = set(cursor["signatures"]) if cursor else set()
+    for entry in entries:
+        added = entry_date(entry)
+        if added is None:
+            continue
+        if newest is None or added > newest:
+            newest, signatures = added, set()
+        if added == newest:
+            signatures.add(entry_signature(entry))
+    if newest is None:
+        return cursor
+    return {"date": newest.isoformat(), "signatures": sorted(signatures)}
+
+
+class GradCafeScraper:  # pylint: disable=too-many-instance-attributes
     """Scrape GradCafe survey results."""
 
     BASE_URL = "https://www.thegradcafe.com/survey/index.php"
-
-    def __init__(self, output_file="raw_applicant_data.json", debug=True):
+    HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "text/html"}
+    MAX_THROTTLED_ATTEMPTS = 4
+    # A boundary probe that fails this often aborts the run; retries back off linearly.
+    BOUNDARY_PROBE_ATTEMPTS = 3
+    BOUNDARY_RETRY_DELAY = 2.0
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        output_file="raw_applicant_data.json",
+        debug=True,
+        *,
+        workers=1,
+        parser="html.parser",
+        page_cache=None,
+        rate_limiter=None,
+        parse_processes=0,
+        archive=None,
+        detail_cache=None,
+        detail_workers=8,
+    ):
         """
         Initialize the scraper.
         
         Args:
-            output_file (str or None): Path to save JSON. If None, file operations are skipped.
+            output_file (str or None): Legacy JSON path; raw entries are kept in the
+                append-only store next to it. If None, file operations are skipped.
             debug (bool): Print debug info to stdout.
+            workers (int): Max page requests in flight at once. 1 fetches sequentially.
+            parser (str): Row extractor backend, one of ``PARSER_BACKENDS``.
+            page_cache (bool, str or PageCache): Conditional-request page cache. True uses
+                ``src/data/page_cache``; a path or ``PageCache`` selects another one.
+            rate_limiter (bool or AdaptiveRateLimiter): Adaptive per-host flow control.
+                True uses the default limiter; its live state is ``rate_limiter.snapshot()``.
+            parse_processes (int): Parse pages in this many worker processes while
+                threads keep fetching. 0 parses on the fetching thread.
+            archive (bool, str or PageArchive): Keep a compressed snapshot of every
+                fetched page for offline ``reparse``. True uses ``src/data/page_archive``.
+            detail_cache (bool, str or DetailCache): Enrich new entries from their detail
+                pages, caching each page's fields by URL so it is never fetched twice.
+                True uses ``src/data/detail_cache.ndjson``.
+            detail_workers (int): Max detail page requests in flight per host.
         """
+        if parser not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend: {parser}")
+        if parser == "lxml" and lxml_html is None:
+            raise ValueError("The lxml parser backend requires the lxml package.")
+
         self.debug = debug
+        self.parser = parser
+        self.workers = max(1, int(workers))
+        self.parse_processes = max(0, int(parse_processes))
         self.raw_data = []
-        self.http = self._setup_http()
+        if rate_limiter is True:
+            rate_limiter = AdaptiveRateLimiter(max_concurrency=self.workers)
+        self.rate_limiter = rate_limiter or None
+        self.http = self._setup_http(self.workers, throttled=self.rate_limiter is not None)
         self.latest_stored_date = None
+        self.reached_watermark = False
         self.output_file = None
+        self.raw_store = None
+        self._saved_count = 0
+        self.cache_report = None
+        self._page_hashes = {}
+
+        if page_cache is True:
+            page_cache = DATA_DIR / "page_cache"
+        if page_cache and not isinstance(page_cache, PageCache):
+            page_cache = PageCache(page_cache)
+        self.page_cache = page_cache or None
+
+        if archive is True:
+            archive = DATA_DIR / "page_archive"
+        if archive and not isinstance(archive, PageArchive):
+            archive = PageArchive(archive)
+        # An empty archive is falsy (it has a __len__), so test the type instead
+        self.archive = archive if isinstance(archive, PageArchive) else None
+
+        self.detail_http = None
+        self.detail_enricher = self._setup_details(detail_cache, detail_workers)
 
         # Handle path resolution only if a filename is provided
         if output_file:
-            src_dir = Path(__file__).resolve().parents[2]
-            data_dir = src_dir / "data"
+            data_dir = DATA_DIR
             
             # Ensure data dir exists if we are going to use it
             if not os.path.exists(data_dir):
@@ -50,41 +232,134 @@ class GradCafeScraper:
                 self.output_file = str(data_dir / output_file)
             else:
                 self.output_file = output_file
+            self._load_raw_store()
 
-            # Try to load existing local data (optional, mostly for local dev)
-            try:
-                if os.path.exists(self.output_file):
-                    with open(self.output_file, "r", encoding="utf-8") as file_handle:
-                        self.raw_data = json.load(file_handle)
+    def _load_raw_store(self):
+        """
+        Load the local raw archive (optional, mostly for local dev). A legacy
+        JSON file is imported into the store once, newest batch first.
+        """
+        try:
+            self.raw_store = RawStore(store_path_for(self.output_file))
+            self.raw_store.import_json(self.output_file)
+            self.raw_data = self.raw_store.to_list(newest_batch_first=True)
+        except (OSError, ValueError):
+            self.raw_data = []
+        self._saved_count = len(self.raw_data)
+
+        for entry in self.raw_data:
+            if entry.get("raw_date"):
+                self.latest_stored_date = entry.get("raw_date")
+                break
+
+    def _setup_details(self, detail_cache, detail_workers):
+        """Return the ``DetailEnricher`` for ``detail_cache``, or None without one."""
+        if detail_cache is True:
+            detail_cache = DATA_DIR / "detail_cache.ndjson"
+        if detail_cache and not isinstance(detail_cache, DetailCache):
+            detail_cache = DetailCache(detail_cache)
+        if not isinstance(detail_cache, DetailCache):
+            return None
+        # block=True holds extra threads back instead of opening more connections
+        self.detail_http = self._setup_http(
+            detail_workers, throttled=self.rate_limiter is not None, block=True
+        )
+        return DetailEnricher(
+            detail_cache,
+            self._request_detail,
+            workers=detail_workers,
+            debug=self.debug,
+        )
+
+    @staticmethod
+    def _setup_http(maxsize=1, throttled=False, block=False):
+        """
+        Configure urllib3 with retries and one pooled connection per worker.
+
+        With ``block`` no more than ``maxsize`` connections are ever open to
+        one host; further requests wait for a free connection.
 
-                    if not isinstance(self.raw_data, list):
-                        self.raw_data = []
+        When a rate limiter is in charge, 429/503 are left to it instead of
+        being retried (and slept on) inside urllib3.
+        """
+        if throttled:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 504],
+                respect_retry_after_header=False,
+            )
+        else:
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+        return urllib3.PoolManager(retries=retry, maxsize=maxsize, block=block)
+
+    def _request(self, url, pool=None, **kwargs):
+        """
+        Issue a GET on ``pool`` (the page pool by default), going through the
+        rate limiter when one is configured.
+
+        Throttled responses (429, 503 or a block page) are reported to the
+        limiter, which slows the host down or pauses it for ``Retry-After``,
+        and the request is retried up to ``MAX_THROTTLED_ATTEMPTS`` times.
+        """
+        pool = pool or self.http
+        if self.rate_limiter is None:
+            return pool.request("GET", url, **kwargs)
+
+        host = urlsplit(url).hostname
+        response = None
+        for _ in range(self.MAX_THROTTLED_ATTEMPTS):
+            self.rate_limiter.acquire(host)
+            started = time.monotonic()
+            response = status = None
+            try:
+                response = pool.request("GET", url, **kwargs)
+                status = response.status
+            finally:
+                blocked = response is not None and self._is_block_page(response, kwargs)
+                retry_after = None
+                if response is not None and status in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.rate_limiter.release(
+                    host,
+                    status=status,
+                    latency=time.monotonic() - started,
+                    retry_after=retry_after,
+                    blocked=blocked,
+                )
+            if status not in (429, 503) and not blocked:
+                return response
+            if self.debug:
+                print(f"Throttled ({status}) on {url}: {self.rate_limiter.snapshot()[host]}")
+            if kwargs.get("preload_content") is False:
+                response.release_conn()
+        return response
 
-                    for entry in self.raw_data:
-                        if entry.get("raw_date"):
-                            self.latest_stored_date = entry.get("raw_date")
-                            break
-            except (FileNotFoundError, ValueError):
-                self.raw_data = []
+    def _request_detail(self, url):
+        """GET one detail page on the detail pool."""
+        return self._request(url, pool=self.detail_http, headers=self.HEADERS)
 
     @staticmethod
-    def _setup_http():
-        """Configure urllib3 with retries."""
-        retry = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        return urllib3.PoolManager(retries=retry)
+    def _is_block_page(response, request_kwargs):
+        """Return True if the response looks like a bot-protection page."""
+        if response.status == 403:
+            return True
+        if request_kwargs.get("preload_content") is False:
+            return False
+        head = (response.data or b"")[:4096]
+        return any(marker in head for marker in BLOCK_MARKERS)
 
     def _build_url(self, page):
         return f"{self.BASE_URL}?q=%2A&t=a&o=&page={page}"
 
     def _fetch_html(self, url):
         """Fetch HTML content from a URL."""
-        headers = {"User-Agent": "Mozilla/5.0", "Accept": "text/html"}
         try:
-            response = self.http.request("GET", url, headers=headers)
+            response = self._request(url, headers=self.HEADERS)
             if response.status >= 400:
                 return None
             return response.data.decode("utf-8", errors="replace")
@@ -93,79 +368,392 @@ class GradCafeScraper:
                 print(f"Request Error: {request_error}")
             return None
 
-    def scrape_data(self, target_count=50000, max_pages=10000, stop_date=None):
+    def _stream_entries(self, url):
+        """
+        Yield a page's entries while its body is still downloading.
+
+        The response is read in ``STREAM_CHUNK_SIZE`` pieces and fed to a
+        ``RowStreamParser``; closing the generator early drops the connection
+        instead of reading the rest of the page.
+        """
+        try:
+            response = self._request(url, headers=self.HEADERS, preload_content=False)
+        except Exception as request_error:  # pylint: disable=broad-exception-caught
+            if self.debug:
+                print(f"Request Error: {request_error}")
+            return
+
+        finished = False
+        try:
+            if response.status >= 400:
+                return
+            parser = RowStreamParser(url)
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for chunk in response.stream(STREAM_CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+                yield from parser.pop_entries()
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+            finished = True
+            yield from parser.pop_entries()
+        except Exception as stream_error:  # pylint: disable=broad-exception-caught
+            if self.debug:
+                print(f"Stream Error: {stream_error}")
+        finally:
+            if not finished:
+                response.close()
+            response.release_conn()
+
+    def _fetch_cached_html(self, url):
+        """
+        Fetch one page through the page cache.
+
+        Sends the stored validators; a 304, or a 200 whose body hash matches
+        the version already ingested, returns ``PAGE_UNCHANGED`` so nothing
+        gets parsed. Otherwise returns the page HTML, or None on failure.
+        """
+        cache = self.page_cache
+        headers = {**self.HEADERS, **cache.conditional_headers(url)}
+        try:
+            response = self._request(url, headers=headers)
+        except Exception as request_error:  # pylint: disable=broad-exception-caught
+            if self.debug:
+                print(f"Request Error: {request_error}")
+            return None
+
+        if response.status == 304:
+            sha = cache.record_not_modified(url)
+            html = None if cache.is_ingested(url, sha) else cache.read_body(sha)
+        elif response.status >= 400:
+            return None
+        else:
+            sha = cache.store(url, response.data, response.headers)
+            html = None if cache.is_ingested(url, sha) else response.data.decode(
+                "utf-8", errors="replace"
+            )
+
+        self._page_hashes[url] = sha
+        return PAGE_UNCHANGED if html is None else html
+
+    def _fetch_page_html(self, url):
+        """Fetch one page's HTML, through the page cache when there is one."""
+        if self.page_cache is not None:
+            html = self._fetch_cached_html(url)
+        else:
+            html = self._fetch_html(url)
+        if self.archive is not None and html and html is not PAGE_UNCHANGED:
+            try:
+                self.archive.add(url, html)
+            except OSError as archive_error:
+                if self.debug:
+                    print(f"Archive Error: {archive_error}")
+        return html
+
+    def _fetch_entries(self, url):
+        """Fetch one page and return its entries, or None if the request failed."""
+        if self.parser == "stream" and self.page_cache is None and self.archive is None:
+            return self._stream_entries(url)
+        html = self._fetch_page_html(url)
+        if not html or html is PAGE_UNCHANGED:
+            return html or None
+        return self._parse_html(html, url)
+
+    def _fetch_entries_in_pool(self, url, parse_pool):
+        """Fetch one page on this thread and parse it in ``parse_pool``."""
+        html = self._fetch_page_html(url)
+        if not html or html is PAGE_UNCHANGED:
+            return html or None
+        return parse_pool.submit(parse_page, html, url, self.parser).result()
+
+    def _fetch_entries_list(self, url):
+        """``_fetch_entries`` fully materialized, for use on worker threads."""
+        entries = self._fetch_entries(url)
+        if isinstance(entries, Iterator):
+            return list(entries)
+        return entries
+
+    def _iter_pages(self, start_page=1, last_page=None, prefetched=None):
+        """
+        Yield ``(url, entries)`` for consecutive pages starting at ``start_page``.
+
+        With ``workers > 1`` up to ``workers`` requests are kept in flight on a
+        thread pool, but pages are still yielded strictly in page order. Closing
+        the generator cancels every fetch that has not started yet. Pages in
+        ``prefetched`` (page number -> entries) are yielded without a request,
+        and iteration ends after ``last_page`` when it is given.
+
+        With ``parse_processes`` set, fetch threads hand each page's HTML to a
+        process pool for parsing, so parsing is not serialized on the GIL; the
+        in-flight window grows by ``parse_processes`` to keep both stages busy.
+        """
+        prefetched = prefetched or {}
+        page = start_page
+        if self.workers == 1 and not self.parse_processes:
+            while last_page is None or page <= last_page:
+                url = self._build_url(page)
+                if page in prefetched:
+                    yield url, prefetched.pop(page)
+                else:
+                    yield url, self._fetch_entries(url)
+                page += 1
+            return
+
+        window = self.workers + self.parse_processes
+        executor = ThreadPoolExecutor(max_workers=window)
+        parse_pool = None
+        if self.parse_processes:
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        in_flight = deque()
+        try:
+            while in_flight or last_page is None or page <= last_page:
+                while len(in_flight) < window and (last_page is None or page <= last_page):
+                    url = self._build_url(page)
+                    if page in prefetched:
+                        future = Future()
+                        future.set_result(prefetched.pop(page))
+                    else:
+                        future = self._submit_fetch(executor, parse_pool, url)
+                    in_flight.append((url, future))
+                    page += 1
+                url, future = in_flight.popleft()
+                yield url, future.result()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_fetch(self, executor, parse_pool, url):
+        """Fetch ``url`` on ``executor``, parsing it in ``parse_pool`` when there is one."""
+        if parse_pool is not None:
+            return executor.submit(self._fetch_entries_in_pool, url, parse_pool)
+        return executor.submit(self._fetch_entries_list, url)
+
+    def find_boundary_page(self, stop_date, max_page=10000):
         """
-        Run the scraping loop.
+        Locate the first page that reaches back to ``stop_date`` (see ``boundary``).
+
+        A page reaches it when it holds an entry on or before ``stop_date``,
+        or is empty or unchanged since the last ingest. A probe that fails
+        to download is retried ``BOUNDARY_PROBE_ATTEMPTS`` times.
+
+        Returns:
+            tuple: ``(boundary_page, probes)``; ``boundary_page`` is None when
+            no page up to ``max_page`` reaches ``stop_date``.
+
+        Raises:
+            ConnectionError: A probe kept failing, so the boundary is unknown.
+        """
+        watermark = parse_listing_date(stop_date)
+
+        def reached(entries):
+            if entries is PAGE_UNCHANGED or not entries or watermark is None:
+                return True
+            dates = [d for d in map(entry_date, entries) if d is not None]
+            return bool(dates) and min(dates) <= watermark
+
+        def probe(page):
+            return probe_page(
+                lambda number: self._fetch_entries_list(self._build_url(number)),
+                page,
+                attempts=self.BOUNDARY_PROBE_ATTEMPTS,
+                retry_delay=self.BOUNDARY_RETRY_DELAY,
+                debug=self.debug,
+            )
+
+        boundary, probes = find_boundary_page(probe, reached, max_page=max_page)
+        if self.debug and boundary is not None:
+            print(f"Boundary for {stop_date} is page {boundary} ({len(probes)} probes)")
+        return boundary, probes
+
+    # pylint: disable-next=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    def iter_scrape(
+        self,
+        target_count=50000,
+        max_pages=10000,
+        stop_date=None,
+        boundary_search=False,
+        cursor=None,
+    ):
+        """
+        Run the scraping loop, yielding each page's new entries as soon as it is parsed.
         
         Args:
             target_count (int): Max number of new entries to fetch.
             max_pages (int): Max number of pages to crawl.
-            stop_date (str): A date string (e.g. "28 Feb 2026"). If found, scraping stops.
+            stop_date (str or datetime.date): A date (e.g. "28 Feb 2026" or
+                "2026-02-28"). Scraping stops at the first entry from that day.
+            boundary_search (bool): Locate the page holding ``stop_date`` with
+                ``find_boundary_page`` (searching up to ``max_pages``) and fetch
+                only the pages before it, ``workers`` at a time.
+            cursor (dict or None): Ingest cursor from ``advance_cursor``. When
+                given it replaces ``stop_date``: the run stops at the first row
+                older than the cursor date or already ingested on that date.
             
-        Returns:
-            list: A list of ONLY the newly scraped entries.
+        Yields:
+            list: The new entries of one page (pages without any are skipped).
+
+        Consumers can commit each chunk before the next page is requested, so
+        the first rows land after one page and memory stays flat. With a page
+        cache, reaching a page identical to the one already ingested also
+        stops the run: listings only shift down, so every later page is
+        unchanged too. Cache counters for the run are left in ``cache_report``.
+        In boundary mode any entry dated on or before ``stop_date`` stops the run.
+        With a ``detail_cache`` every chunk goes through ``enrich_details`` first.
+
+        ``reached_watermark`` ends up True only if the run got back to rows
+        already ingested (or to the end of the listings); a run cut short by
+        ``target_count`` or ``max_pages`` leaves a gap and keeps it False.
         """
         current_page = 1
         pages_scraped = 0
-
-        # Optimization: If we are looking for a specific recent date, don't crawl 10k pages
-        if (stop_date or self.latest_stored_date) and max_pages == 10000:
+        watermark = parse_listing_date(stop_date)
+        last_page = None
+        probes = None
+        cursor_date = parse_listing_date(cursor["date"]) if cursor else None
+        cursor_signatures = set(cursor["signatures"]) if cursor else set()
+        stored_date = parse_listing_date(self.latest_stored_date)
+        search_date = watermark
+        if cursor_date is not None:
+            stop_date = None
+            # Rows from the cursor day can still be new, so search for the page
+            # reaching the day before; every cursor-day row comes ahead of it.
+            search_date = cursor_date - timedelta(days=1)
+        ordered = boundary_search and search_date is not None
+
+        if self.page_cache is not None:
+            self.page_cache.reset_stats()
+        self._page_hashes = {}
+        self.reached_watermark = False
+        boundary_found = False
+
+        if ordered:
+            last_page, probes = self.find_boundary_page(search_date, max_page=max_pages)
+            boundary_found = last_page is not None
+            if not boundary_found:
+                if self.debug:
+                    print(f"Watermark not found within {max_pages} pages.")
+                last_page = max_pages
+            max_pages = last_page
+        elif (stop_date or self.latest_stored_date) and max_pages == 10000:
+            # Optimization: If we are looking for a specific recent date, don't crawl 10k pages
             max_pages = 10 
 
         if self.debug:
-            print(f"--- STARTING SCRAPE (Max Pages: {max_pages}, Stop Date: {stop_date}) ---")
+            print(
+                f"--- STARTING SCRAPE (Max Pages: {max_pages}, Stop Date: {stop_date}, "
+                f"Cursor: {cursor_date}) ---"
+            )
 
-        new_collected_data = []
+        collected = 0
         stop_scraping = False
-        seen_in_session = set()
-
-        while (
-            not stop_scraping
-            and len(new_collected_data) < target_count
-            and pages_scraped < max_pages
-        ):
-            url = self._build_url(current_page)
-            html = self._fetch_html(url)
+        seen_in_session = SignatureSet()
+        consumed_urls = []
+        pages = self._iter_pages(current_page, last_page=last_page, prefetched=probes)
 
-            if not html:
-                current_page += 1
-                continue
+        try:
+            while (
+                not stop_scraping
+                and collected < target_count
+                and pages_scraped < max_pages
+            ):
+                page = next(pages, None)
+                if page is None:
+                    # Past the boundary page every row is already ingested
+                    self.reached_watermark = boundary_found
+                    break
+                url, new_entries = page
+                consumed_urls.append(url)
+                found_rows = False
+                page_new = []
 
-            soup = BeautifulSoup(html, "html.parser")
-            new_entries = self._extract_data_from_soup(soup, url)
+                if new_entries is PAGE_UNCHANGED:
+                    if self.debug:
+                        print("Page unchanged since last ingest. Stopping.")
+                    stop_scraping = self.reached_watermark = True
+                    continue
+
+                for entry in new_entries or ():
+                    found_rows = True
+
+                    # 0. Ingest cursor: stop at exactly the first already-ingested row
+                    if cursor_date is not None and self._behind_cursor(
+                        entry, cursor_date, cursor_signatures
+                    ):
+                        if self.debug:
+                            print(f"Reached ingest cursor ({cursor_date}). Stopping.")
+                        stop_scraping = self.reached_watermark = True
+                        break
 
-            if not new_entries:
-                current_page += 1
-                continue
+                    # 1. Check the explicitly passed stop_date (from DB watermark)
+                    if stop_date and watermark is not None and entry_date(entry) == watermark:
+                        if self.debug:
+                            print(f"Found stop date ({stop_date}). Stopping.")
+                        stop_scraping = self.reached_watermark = True
+                        break
+                    # Boundary mode trusts the date order: stop at the first row on or
+                    # before the watermark, even when raw_date missed its date
+                    if (
+                        ordered
+                        and cursor_date is None
+                        and (entry_date(entry) or date.max) <= watermark
+                    ):
+                        if self.debug:
+                            print(f"Reached stop date ({stop_date}). Stopping.")
+                        stop_scraping = self.reached_watermark = True
+                        break
 
-            for entry in new_entries:
-                # 1. Check the explicitly passed stop_date (from DB watermark)
-                if stop_date and entry.get("raw_date") == stop_date:
-                    if self.debug:
-                        print(f"Found stop date ({stop_date}). Stopping.")
-                    stop_scraping = True
-                    break
+                    # 2. Check internal state (backward compatibility for local runs)
+                    if (
+                        not stop_date 
+                        and cursor_date is None
+                        and stored_date is not None
+                        and entry_date(entry) == stored_date
+                    ):
+                        stop_scraping = self.reached_watermark = True
+                        break
 
-                # 2. Check internal state (backward compatibility for local runs)
-                if (
-                    not stop_date 
-                    and self.latest_stored_date
-                    and entry.get("raw_date") == self.latest_stored_date
-                ):
-                    stop_scraping = True
-                    break
+                    if seen_in_session.add(dedupe_key(entry)):
+                        page_new.append(entry)
+
+                if hasattr(new_entries, "close"):
+                    new_entries.close()
+                if found_rows:
+                    pages_scraped += 1
+                if page_new:
+                    collected += len(page_new)
+                    self.enrich_details(page_new)
+                    yield page_new
+        finally:
+            # Cancels in-flight fetches once the watermark or a limit is hit.
+            pages.close()
+
+        # Only a run that was consumed to the end marks its pages as ingested.
+        if self.page_cache is not None:
+            self._finish_cache_run(consumed_urls)
+
+    def scrape_data(  # pylint: disable=too-many-arguments
+        self,
+        target_count=50000,
+        max_pages=10000,
+        stop_date=None,
+        boundary_search=False,
+        cursor=None,
+    ):
+        """
+        Run the scraping loop to completion.
 
-                sig = (
-                    entry.get("raw_inst"),
-                    entry.get("raw_prog"),
-                    str(entry.get("raw_text"))[:50],
-                )
-                if sig not in seen_in_session:
-                    seen_in_session.add(sig)
-                    new_collected_data.append(entry)
+        Takes the same arguments as ``iter_scrape``.
 
-            current_page += 1
-            pages_scraped += 1
+        Returns:
+            list: A list of ONLY the newly scraped entries.
+        """
+        new_collected_data = []
+        for chunk in self.iter_scrape(target_count, max_pages, stop_date, boundary_search, cursor):
+            new_collected_data.extend(chunk)
 
         # Merge with local history if we are using a file
         self.raw_data = new_collected_data + self.raw_data
@@ -175,6 +763,79 @@ class GradCafeScraper:
             
         return new_collected_data
 
+
+    @staticmethod
+    def _behind_cursor(entry, cursor_date, cursor_signatures):
+        """Return True if ``entry`` was ingested at or before the cursor."""
+        added = entry_date(entry)
+        if added is not None and added < cursor_date:
+            return True
+        if added is None or added == cursor_date:
+            return entry_signature(entry) in cursor_signatures
+        return False
+
+    def scrape_pages(self, start_page, end_page):
+        """
+        Scrape every page in ``[start_page, end_page]``, ignoring watermarks.
+
+        Used for backfill shards: pages are fetched ``workers`` at a time and
+        rows are only deduplicated within the range. Nothing is saved locally.
+
+        Returns:
+            list: Entries in page order.
+        """
+        entries = []
+        seen = SignatureSet()
+        pages = self._iter_pages(start_page, last_page=end_page)
+        try:
+            for _, page_entries in pages:
+                if page_entries is PAGE_UNCHANGED:
+                    continue
+                for entry in page_entries or ():
+                    if seen.add(dedupe_key(entry)):
+                        entries.append(entry)
+        finally:
+            pages.close()
+        self.enrich_details(entries)
+        return entries
+
+    def enrich_details(self, entries):
+        """
+        Attach each entry's detail page fields as ``raw_detail`` (see ``enrich``).
+
+        Returns:
+            int: Number of detail pages requested (0 without a ``detail_cache``).
+        """
+        if self.detail_enricher is None:
+            return 0
+        return self.detail_enricher.enrich(entries)
+
+    def _finish_cache_run(self, consumed_urls):
+        """Mark the pages this run consumed as ingested and report cache savings."""
+        for url in consumed_urls:
+            if url in self._page_hashes:
+                self.page_cache.mark_ingested(url, self._page_hashes[url])
+        self.page_cache.save()
+        self.cache_report = self.page_cache.report()
+        if self.debug:
+            report = self.cache_report
+            print(
+                f"Page cache: {report['hits']}/{report['requests']} hits "
+                f"({report['hit_rate']:.0%}), {report['bytes_saved']} bytes saved"
+            )
+
+    def _parse_html(self, html, url):
+        """Extract entries from one page with the configured parser backend."""
+        if self.parser == "lxml":
+            return self._extract_data_from_lxml(html, url)
+        if self.parser == "stream":
+            parser = RowStreamParser(url)
+            parser.feed(html)
+            parser.close()
+            return parser.pop_entries()
+        soup = BeautifulSoup(html, "html.parser")
+        return self._extract_data_from_soup(soup, url)
+
     def _extract_data_from_soup(self, soup, url):  # pylint: disable=too-many-locals
         """Parse HTML table rows into entry dictionaries."""
         entries = []
@@ -183,7 +844,6 @@ class GradCafeScraper:
             return entries
 
         current_entry = None
-        date_re = re.compile(r"\d{1,2}\s+[A-Za-z]{3}\s+\d{4}")
 
         for row in rows:
             cells = row.find_all("td")
@@ -199,14 +859,7 @@ class GradCafeScraper:
                 prog_block = cells[1].find_all("span")
                 prog_text = prog_block[0].get_text(strip=True) if prog_block else ""
                 full_row_text = row.get_text(" ", strip=True)
-
-                found_date = ""
-                for cell in cells:
-                    text = cell.get_text(" ", strip=True)
-                    date_match = date_re.search(text)
-                    if date_match:
-                        found_date = date_match.group(0)
-                        break
+                found_date = find_row_date(cell.get_text(" ", strip=True) for cell in cells)
 
                 current_entry = {
                     "raw_inst": school,
@@ -216,6 +869,9 @@ class GradCafeScraper:
                     "url": url,
                     "raw_date": found_date,
                 }
+                link = row.find("a", href=RESULT_LINK_RE)
+                if link is not None:
+                    current_entry["detail_url"] = detail_link(link["href"], url)
             elif current_entry is not None:
                 text = row.get_text(strip=True)
                 if text:
@@ -226,19 +882,108 @@ class GradCafeScraper:
 
         return entries
 
+    @staticmethod
+    def _lxml_text(node, separator=""):
+        """Mirror ``Tag.get_text(separator, strip=True)`` for an lxml element."""
+        return separator.join(
+            text for text in (piece.strip() for piece in node.itertext()) if text
+        )
+
+    @staticmethod
+    def _lxml_text_cr(node, separator=""):
+        """``_lxml_text`` for documents whose carriage returns were masked."""
+        return separator.join(
+            text
+            for text in (piece.replace(CR_PLACEHOLDER, "\r").strip() for piece in node.itertext())
+            if text
+        )
+
+    def _extract_data_from_lxml(self, html, url):
+        """
+        Parse HTML table rows into entry dictionaries using lxml.
+
+        Produces the same entries as ``_extract_data_from_soup`` but builds the
+        tree in C, which is several times faster than ``html.parser``.
+        """
+        entries = []
+        text_of = self._lxml_text
+        if "\r" in html:
+            html = html.replace("\r", CR_PLACEHOLDER)
+            text_of = self._lxml_text_cr
+        try:
+            root = lxml_html.fromstring(html)
+        except (lxml_etree.ParserError, ValueError):
+            return entries
+        lxml_etree.strip_elements(root, *NON_TEXT_TAGS, with_tail=False)
+
+        current_entry = None
+
+        for row in root.iter("tr"):
+            cells = list(row.iter("td"))
+            if len(cells) >= 2 and len(text_of(cells[0])) > 2:
+                if current_entry is not None:
+                    entries.append(current_entry)
+
+                prog_block = next(cells[1].iter("span"), None)
+                found_date = find_row_date(text_of(cell, " ") for cell in cells)
+
+                current_entry = {
+                    "raw_inst": text_of(cells[0]),
+                    "raw_prog": text_of(prog_block) if prog_block is not None else "",
+                    "raw_text": text_of(row, " "),
+                    "raw_comments": "",
+                    "url": url,
+                    "raw_date": found_date,
+                }
+                for anchor in row.iter("a"):
+                    link = detail_link(anchor.get("href"), url)
+                    if link:
+                        current_entry["detail_url"] = link
+                        break
+            elif current_entry is not None:
+                text = text_of(row)
+                if text:
+                    current_entry["raw_comments"] += f" {text}"
+
+        if current_entry is not None:
+            entries.append(current_entry)
+
+        return entries
+
     def save_raw_data(self):
-        """Write raw data to JSON."""
-        if not self.output_file:
+        """Append the entries scraped since the last save to the raw store as one batch."""
+        if self.raw_store is None:
+            return
+
+        unsaved = self.raw_data[:len(self.raw_data) - self._saved_count]
+        if not unsaved:
             return
-            
         try:
-            with open(self.output_file, "w", encoding="utf-8") as file_handle:
-                json.dump(self.raw_data, file_handle, indent=2)
+            self.raw_store.new_segment()
+            self.raw_store.append(unsaved)
+            self._saved_count = len(self.raw_data)
         except (OSError, TypeError, ValueError) as save_error:
             if self.debug:
                 print(f"Error saving: {save_error}")
 
 
+_PAGE_PARSERS = {}
+
+
+def parse_page(html, url, parser="html.parser"):
+    """
+    Extract the entries of one page; the target of ``parse_processes`` workers.
+
+    Each process keeps one scraper per backend, so only the HTML and the
+    resulting entries cross the process boundary.
+    """
+    scraper = _PAGE_PARSERS.get(parser)
+    if scraper is None:
+        scraper = GradCafeScraper(output_file=None, debug=False, parser=parser)
+        _PAGE_PARSERS[parser] = scraper
+    return scraper._parse_html(html, url)  # pylint: disable=protected-access
+
+
 def main():
     """Execute a small scraping run directly."""
     scraper = GradCafeScraper(output_file="test_run.json")
@@ -0,0 +1,278 @@
+"""
+Signature Index Module
+======================
+
+Compact dedupe indexes: entries are reduced to 64-bit hashes kept in an
+array-backed hash set, either in memory or memory-mapped from a file, and
+optionally fronted by a persisted Bloom filter.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+
+
+def signature64(*parts):
+    """
+    Hash ``parts`` to an unsigned 64-bit signature.
+
+    Parts are joined with ``\\x1f`` first, so ``signature64("a\\x1fb")`` and
+    ``signature64("a", "b")`` are the same signature. None counts as "".
+    """
+    key = "\x1f".join("" if part is None else str(part) for part in parts)
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SignatureSet:
+    """
+    Set of 64-bit signatures stored in one ``array('Q')``.
+
+    Open addressing with linear probing, kept at most half full, so a
+    member costs at most 16 bytes instead of a tuple of strings. Slot value
+    0 marks an empty slot; the signature 0 is stored as 1.
+    """
+
+    MIN_SLOTS = 1024
+
+    def __init__(self, signatures=(), capacity=0):
+        """
+        Build a set, sized for ``capacity`` members up front.
+
+        Args:
+            signatures (Iterable[int]): Initial members.
+            capacity (int): Expected number of members.
+        """
+        slots = self.MIN_SLOTS
+        while slots < capacity * 2:
+            slots *= 2
+        self._slots = None
+        self._mask = 0
+        self._count = 0
+        self._allocate(slots)
+        self.update(signatures)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (value for value in self._slots if value)
+
+    def __contains__(self, signature):
+        signature = signature or 1
+        slots = self._slots
+        mask = self._mask
+        index = signature & mask
+        while True:
+            value = slots[index]
+            if value == signature:
+                return True
+            if not value:
+                return False
+            index = (index + 1) & mask
+
+    def add(self, signature):
+        """Add ``signature``; returns True if it was not a member yet."""
+        signature = signature or 1
+        slots = self._slots
+        mask = self._mask
+        index = signature & mask
+        while True:
+            value = slots[index]
+            if value == signature:
+                return False
+            if not value:
+                break
+            index = (index + 1) & mask
+        slots[index] = signature
+        self._count += 1
+        if self._count * 2 > len(slots):
+            self._grow()
+        return True
+
+    def update(self, signatures):
+        """Add every signature in ``signatures``."""
+        for signature in signatures:
+            self.add(signature)
+
+    def _allocate(self, slots):
+        """Start an empty table of ``slots`` slots (a power of two)."""
+        self._slots = array("Q", bytes(8 * slots))
+        self._mask = slots - 1
+        self._count = 0
+
+    def _grow(self):
+        old = self._slots
+        self._allocate(2 * len(old))
+        for value in old:
+            if value:
+                self.add(value)
+
+
+class SignatureFile(SignatureSet):
+    """
+    ``SignatureSet`` whose slot table is a memory-mapped file.
+
+    Opening one maps the file instead of reading it, so a lookup or an add
+    only touches the pages it probes. ``flush`` writes the member count to
+    the header and syncs the mapping; call ``close`` when done.
+    """
+
+    _HEADER = struct.Struct("<4sQQ")
+    _MAGIC = b"SIG1"
+
+    def __init__(self, path, capacity=0):
+        """
+        Create an empty file at ``path``, replacing any file there.
+
+        Args:
+            path (str or Path): Index file.
+            capacity (int): Expected number of members.
+        """
+        self.path = Path(path)
+        self._mmap = None
+        super().__init__(capacity=capacity)
+
+    @classmethod
+    def open(cls, path):
+        """Map a file written by ``flush``; returns None if it is missing or damaged."""
+        try:
+            with open(path, "rb") as file_handle:
+                header = file_handle.read(cls._HEADER.size)
+                size = os.fstat(file_handle.fileno()).st_size
+        except OSError:
+            return None
+        if len(header) != cls._HEADER.size:
+            return None
+        magic, slots, _ = cls._HEADER.unpack(header)
+        if magic != cls._MAGIC or slots & (slots - 1) or size != cls._HEADER.size + 8 * slots:
+            return None
+        index = cls.__new__(cls)
+        index.path = Path(path)
+        index._map_file()
+        return index
+
+    def flush(self):
+        """Record the member count in the header and sync the mapping to disk."""
+        self._mmap[:self._HEADER.size] = self._HEADER.pack(
+            self._MAGIC, len(self._slots), self._count
+        )
+        self._mmap.flush()
+
+    def close(self):
+        """Flush and unmap the file."""
+        if self._mmap is None:
+            return
+        self.flush()
+        self._unmap()
+
+    def _allocate(self, slots):
+        with open(self.path, "wb") as file_handle:
+            file_handle.write(self._HEADER.pack(self._MAGIC, slots, 0))
+            file_handle.truncate(self._HEADER.size + 8 * slots)
+        self._map_file()
+
+    def _map_file(self):
+        with open(self.path, "r+b") as file_handle:
+            self._mmap = mmap.mmap(file_handle.fileno(), 0)
+        _, slots, self._count = self._HEADER.unpack_from(self._mmap)
+        self._slots = memoryview(self._mmap)[self._HEADER.size:].cast("Q")
+        self._mask = slots - 1
+
+    def _unmap(self):
+        self._slots.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def _grow(self):
+        grown = SignatureFile(self.path.with_name(self.path.name + ".tmp"), capacity=self._count)
+        grown.update(value for value in self._slots if value)
+        grown.close()
+        self._unmap()
+        os.replace(grown.path, self.path)
+        self._map_file()
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit signatures, persisted as one small binary file.
+
+    The ``k`` bit positions come from double hashing the two 32-bit halves
+    of a signature. ``count`` is the number of distinct members the owner
+    has added; it is saved with the bits so a stale file can be detected.
+    """
+
+    _HEADER = struct.Struct("<4sQIQQ")
+    _MAGIC = b"BLM1"
+
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        Size the filter for ``capacity`` members at ``error_rate`` false positives.
+
+        Args:
+            capacity (int): Expected number of members.
+            error_rate (float): Target false-positive rate at ``capacity``.
+        """
+        capacity = max(1, int(capacity))
+        bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.size = (bits + 7) // 8 * 8
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray(self.size // 8)
+
+    def _positions(self, signature):
+        low = signature & 0xFFFFFFFF
+        step = (signature >> 32) | 1
+        size = self.size
+        return ((low + i * step) % size for i in range(self.hashes))
+
+    def __contains__(self, signature):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(signature))
+
+    def add(self, signature):
+        """Set the bits of ``signature``."""
+        bits = self._bits
+        for pos in self._positions(signature):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def is_full(self):
+        """Return True once ``count`` passes ``capacity`` and the error rate climbs."""
+        return self.count > self.capacity
+
+    def save(self, path):
+        """Atomically write the filter to ``path``."""
+        path = Path(path)
+        tmp_file = path.with_name(path.name + ".tmp")
+        with open(tmp_file, "wb") as file_handle:
+            file_handle.write(
+                self._HEADER.pack(self._MAGIC, self.size, self.hashes, self.capacity, self.count)
+            )
+            file_handle.write(self._bits)
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by ``save``; returns None if it is missing or damaged."""
+        try:
+            with open(path, "rb") as file_handle:
+                header = file_handle.read(cls._HEADER.size)
+                bits = file_handle.read()
+        except OSError:
+            return None
+        if len(header) != cls._HEADER.size:
+            return None
+        magic, size, hashes, capacity, count = cls._HEADER.unpack(header)
+        if magic != cls._MAGIC or len(bits) * 8 != size:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.size = size
+        bloom.hashes = hashes
+        bloom.capacity = capacity
+        bloom.count = count
+        bloom._bits = bytearray(bits)
+        return bloom
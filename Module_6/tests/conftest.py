@@ -6,6 +6,8 @@ from unittest.mock import MagicMock
 # 1. Force 'src' to be the root for imports
 # This allows 'import app' to work directly, avoiding 'src.app' duplication
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# The project root is also needed for the shared page fixtures in benchmarks/
+sys.path.insert(1, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # 2. Global DB Mock
 mock_psycopg = MagicMock()
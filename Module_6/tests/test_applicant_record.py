@@ -0,0 +1,48 @@
+import pickle
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from benchmarks.pages import load_raw_entries
+from board.clean import DataCleaner
+from db.load_data import APPLICANT_COLUMNS, load_from_list
+from worker.etl.record import LOADER_FIELDS, ApplicantRecord
+
+
+def _executed(rows):
+    conn = MagicMock()
+    load_from_list(conn, rows)
+    cursor = conn.cursor.return_value.__enter__.return_value
+    return [row for call in cursor.executemany.call_args_list for row in call.args[1]]
+
+
+@pytest.mark.analysis
+def test_records_round_trip_through_legacy_dicts():
+    """to_dict/from_dict are inverse on cleaned rows, and records pickle compactly."""
+    records = DataCleaner(input_file=None, output_file=None).clean_records(load_raw_entries())
+
+    assert [ApplicantRecord.from_dict(record.to_dict()) for record in records] == records
+    assert pickle.loads(pickle.dumps(records[:50])) == records[:50]
+    assert not hasattr(records[0], "__dict__")
+
+    legacy = ApplicantRecord.from_dict(
+        {"University": "MIT", "Comments": None, "URL link to applicant entry": " ",
+         "Date of Information Added to Grad CafÃƒÂ©": "6 Jan 2026"}
+    )
+    assert legacy == ApplicantRecord(university="MIT", date_added=date(2026, 1, 6))
+    assert legacy.to_dict() == {"University": "MIT", "Comments": "",
+                                "Date of Information Added to Grad CafÃ©": "2026-01-06"}
+    with pytest.raises(TypeError):
+        ApplicantRecord(college="MIT")
+
+
+@pytest.mark.db
+def test_loader_inserts_records_like_their_dicts():
+    """load_from_list binds the same values for a record and for its legacy dict."""
+    records = DataCleaner(input_file=None, output_file=None).clean_records(
+        load_raw_entries()[:200]
+    )
+
+    assert LOADER_FIELDS == tuple(APPLICANT_COLUMNS)
+    assert _executed(records) == _executed([record.to_dict() for record in records])
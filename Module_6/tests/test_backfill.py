@@ -0,0 +1,89 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.worker.consumer as consumer
+from web import publisher
+from web.publisher import publish_backfill, shard_page_range
+
+
+def _page_html(page):
+    return (
+        "<table>"
+        f"<tr><td>School {page}</td><td><span>Prog</span></td><td>{page} Jan 2026</td></tr>"
+        "</table>"
+    )
+
+
+@pytest.mark.integration
+def test_shard_page_range_covers_range_exactly():
+    """Covers inclusive shard boundaries and argument validation."""
+    assert shard_page_range(1, 10, 4) == [(1, 4), (5, 8), (9, 10)]
+    assert shard_page_range(7, 7, 25) == [(7, 7)]
+    for bad in ((0, 5, 2), (5, 4, 2), (1, 5, 0)):
+        with pytest.raises(ValueError):
+            shard_page_range(*bad)
+
+
+@pytest.mark.integration
+def test_publish_backfill_sends_one_task_per_shard():
+    """One channel carries every shard message of a job."""
+    conn, ch = MagicMock(), MagicMock()
+    with patch.object(publisher, "_open_channel", return_value=(conn, ch)):
+        job_id, count = publish_backfill(1, 60, shard_size=25, job_id="job")
+
+    bodies = [json.loads(c.kwargs["body"]) for c in ch.basic_publish.call_args_list]
+    assert (job_id, count) == ("job", 3)
+    assert {b["kind"] for b in bodies} == {"backfill_range"}
+    assert [(b["payload"]["start_page"], b["payload"]["end_page"]) for b in bodies] == [
+        (1, 25), (26, 50), (51, 60)
+    ]
+    conn.close.assert_called_once()
+
+
+@pytest.mark.integration
+def test_scrape_pages_fetches_only_the_shard():
+    """Shard scraping requests exactly its page range."""
+    s = consumer.GradCafeScraper(output_file=None, debug=False, workers=3)
+    s._fetch_html = MagicMock(side_effect=lambda url: _page_html(int(url.rsplit("=", 1)[1])))
+
+    out = s.scrape_pages(4, 9)
+
+    assert [e["raw_inst"] for e in out] == [f"School {p}" for p in range(4, 10)]
+    assert s._fetch_html.call_count == 6
+
+
+@pytest.mark.integration
+def test_backfill_handler_claims_loads_and_finishes():
+    """Covers claimed, already-claimed and failing shards."""
+    body = json.dumps({"kind": "backfill_range", "payload": {
+        "job_id": "job", "shard_id": 2, "start_page": 5, "end_page": 6,
+    }})
+    scraper = MagicMock()
+    scraper.return_value.scrape_pages.return_value = [{"raw_inst": "School"}]
+    with patch.object(consumer, "get_db_conn"), \
+         patch.object(consumer, "GradCafeScraper", scraper), \
+         patch.object(consumer, "claim_backfill_shard", return_value=True), \
+         patch.object(consumer, "load_from_list") as load, \
+         patch.object(consumer, "finish_backfill_shard") as finish:
+        consumer.handle_backfill_range(None, None, None, body)
+    scraper.return_value.scrape_pages.assert_called_once_with(5, 6)
+    assert load.called
+    assert finish.call_args.args[2] == 1
+
+    with patch.object(consumer, "get_db_conn"), \
+         patch.object(consumer, "GradCafeScraper", scraper), \
+         patch.object(consumer, "claim_backfill_shard", return_value=False):
+        scraper.reset_mock()
+        consumer.handle_backfill_range(None, None, None, body)
+    assert not scraper.called
+
+    scraper.return_value.scrape_pages.side_effect = RuntimeError("blocked")
+    with patch.object(consumer, "get_db_conn"), \
+         patch.object(consumer, "GradCafeScraper", scraper), \
+         patch.object(consumer, "claim_backfill_shard", return_value=True), \
+         patch.object(consumer, "fail_backfill_shard") as fail, \
+         pytest.raises(RuntimeError):
+        consumer.handle_backfill_range(None, None, None, body)
+    assert str(fail.call_args.args[2]) == "blocked"
@@ -0,0 +1,130 @@
+import re
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from board.scrape import GradCafeScraper
+from worker.etl.scrape import entry_date, parse_listing_date
+
+START = date(2026, 3, 1)
+
+
+def _listing(total_pages, per_page=4):
+    """Newest-first pages where every row is one day older than the last."""
+    def html(page):
+        if page > total_pages:
+            return "<table></table>"
+        rows = []
+        for i in range(per_page):
+            added = START - timedelta(days=(page - 1) * per_page + i)
+            rows.append(
+                f"<tr><td>School {page}-{i}</td><td><span>Prog</span></td>"
+                f"<td>{added.strftime('%B')} {added.day}, {added.year}</td></tr>"
+            )
+        return "<table>" + "".join(rows) + "</table>"
+    return html
+
+
+def _recording_scraper(total_pages, workers=1):
+    s = GradCafeScraper(output_file=None, debug=False, workers=workers)
+    requested = []
+    lock = threading.Lock()
+    listing = _listing(total_pages)
+
+    def fetch(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        with lock:
+            requested.append(page)
+        return listing(page)
+
+    s._fetch_html = fetch
+    return s, requested
+
+
+@pytest.mark.integration
+def test_listing_dates_parse_both_formats():
+    """Covers short and long GradCafe dates from raw_date or the row text."""
+    assert parse_listing_date("28 Feb 2026") == date(2026, 2, 28)
+    assert parse_listing_date("February 3,2026") == date(2026, 2, 3)
+    assert parse_listing_date("soon") is None
+    assert entry_date({"raw_date": "", "raw_text": "Yale PhD March 1, 2026 Accepted"}) == START
+    assert entry_date({"raw_text": "no date"}) is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("boundary", [1, 2, 37, 64, 100])
+def test_find_boundary_page_uses_logarithmic_probes(boundary):
+    """Galloping plus bisection lands on the page holding the watermark."""
+    s, requested = _recording_scraper(total_pages=200)
+    watermark = START - timedelta(days=(boundary - 1) * 4 + 2)
+
+    page, probes = s.find_boundary_page(watermark.strftime("%d %b %Y"), max_page=500)
+
+    assert page == boundary
+    assert set(probes) == set(requested)
+    assert len(requested) <= 2 * boundary.bit_length() + 1
+
+
+@pytest.mark.integration
+def test_find_boundary_page_caps_and_treats_the_end_as_reached():
+    """Running off the end counts as reached; past max_page there is no boundary."""
+    s, _ = _recording_scraper(total_pages=10)
+    assert s.find_boundary_page("1 Jan 2000", max_page=500)[0] == 11
+
+    s, _ = _recording_scraper(total_pages=200)
+    assert s.find_boundary_page("1 Jan 2000", max_page=20)[0] is None
+
+
+@pytest.mark.integration
+def test_failed_probes_are_retried_then_abort_the_search():
+    """A failed download is not a boundary: it is retried, and repeated failure raises."""
+    s, requested = _recording_scraper(total_pages=200)
+    s.BOUNDARY_RETRY_DELAY = 0
+    fetch = s._fetch_html
+    failures = {4: 2}
+
+    def flaky(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        if failures.get(page):
+            failures[page] -= 1
+            return None
+        return fetch(url)
+
+    s._fetch_html = flaky
+    watermark = START - timedelta(days=37 * 4 + 2)
+    assert s.find_boundary_page(watermark.strftime("%d %b %Y"), max_page=500)[0] == 38
+    assert requested.count(4) == 1
+
+    failures[64] = 3
+    with pytest.raises(ConnectionError):
+        s.scrape_data(max_pages=500, stop_date=watermark.strftime("%d %b %Y"), boundary_search=True)
+
+
+@pytest.mark.integration
+def test_capped_catch_up_does_not_reach_the_watermark():
+    """Scraping stops at max_pages but reports that rows below it were never seen."""
+    s, _ = _recording_scraper(total_pages=200)
+    out = s.scrape_data(max_pages=8, stop_date="1 Jan 2000", boundary_search=True)
+    assert len(out) == 8 * 4
+    assert s.reached_watermark is False
+
+    s.scrape_data(max_pages=500, stop_date="1 Jan 2026", boundary_search=True)
+    assert s.reached_watermark is True
+
+
+@pytest.mark.integration
+def test_boundary_search_scrape_fetches_only_the_gap():
+    """The catch-up run reuses probed pages and stops at the watermark row."""
+    s, requested = _recording_scraper(total_pages=200, workers=4)
+    watermark = START - timedelta(days=41)
+
+    out = s.scrape_data(
+        target_count=1000, max_pages=500, stop_date=watermark.strftime("%d %b %Y"),
+        boundary_search=True,
+    )
+
+    assert len(out) == 41
+    assert [entry_date(e) for e in out] == [START - timedelta(days=d) for d in range(41)]
+    assert max(requested) <= 16
+    assert len(requested) == len(set(requested))
@@ -0,0 +1,57 @@
+import pytest
+
+from benchmarks.pages import load_raw_entries
+from board.clean import DataCleaner
+
+EDGE_CASES = [
+    "",
+    "Accepted on 6 Jan Fall 2026 International GPA 3.91 GRE 328 V 165 AW 4.5",
+    "REJECTED ON FEB 14 spring 2025 AMERICAN gpa: 3.2 gre:320 v160 aw5",
+    "Interview on 3 Fall 2026 on Mar 9 winter 2027",
+    "wait listed on 12 gre 331 gpa 3.5 on 1 aw 4",
+    "Decision on 6 Summer 2026 GPA3.70GRE 311V151AW3.5",
+    "Other: international american",
+    "on 6\n\tJan, Fall\t2026 GPA : 3.0",
+    "Montreal option von 123 raw 4.0 gpa .9 gre 12",
+    "Wait on ſpring 2026 İnternational GRE 330",
+]
+
+
+def _blob(item):
+    return " ".join(
+        str(item.get(key, ""))
+        for key in ("raw_text", "Decision Details", "raw_decision", "raw_comments", "Comments")
+    )
+
+
+@pytest.mark.analysis
+def test_fused_extractor_matches_the_field_helpers():
+    """One finditer pass returns exactly what the per-field helpers return."""
+    blobs = [_blob(item) for item in load_raw_entries()] + EDGE_CASES
+    for blob in blobs:
+        assert DataCleaner._extract_fields(blob) == DataCleaner._extract_fields_slow(blob), blob
+
+
+@pytest.mark.analysis
+def test_clean_data_keeps_record_layout():
+    """Pruning keeps key order, drops blanks and always keeps Comments."""
+    cleaned = DataCleaner(input_file=None, output_file=None).clean_data(
+        [
+            {"raw_inst": "MIT", "raw_prog": " CS ", "raw_text": "Accepted on 6 Jan GPA 3.9",
+             "raw_comments": "  ", "Season": " ", "url": "u", "raw_date": "9 Jan 2026"},
+            {"University": "Yale", "Comments": None},
+        ]
+    )
+
+    assert list(cleaned[0]) == [
+        "Program Name",
+        "University",
+        "Comments",
+        "Date of Information Added to Grad CafÃ©",
+        "URL link to applicant entry",
+        "Applicant Status",
+        "Accepted",
+        "GPA",
+    ]
+    assert cleaned[0]["Accepted"] == "2026-01-06" and cleaned[0]["Comments"] == ""
+    assert cleaned[1] == {"University": "Yale", "Comments": "", "Applicant Status": "Other"}
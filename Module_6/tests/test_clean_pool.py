@@ -0,0 +1,35 @@
+import pytest
+
+import worker.etl.clean as clean_module
+from benchmarks.pages import load_raw_entries
+from board.clean import DataCleaner
+
+
+@pytest.mark.analysis
+def test_parallel_clean_keeps_input_order_and_times_chunks():
+    """Chunks cleaned in worker processes come back in input order, each timed."""
+    rows = load_raw_entries()[:700]
+    cleaner = DataCleaner(input_file=None, output_file=None)
+
+    out = cleaner.clean_data_parallel(iter(rows), workers=2, chunk_size=100, min_rows=0)
+
+    assert out == cleaner.clean_data(rows)
+    assert [timing["rows"] for timing in cleaner.chunk_timings] == [100] * 7
+    assert all(timing["seconds"] >= 0 for timing in cleaner.chunk_timings)
+
+
+@pytest.mark.analysis
+def test_small_batches_are_cleaned_in_process(monkeypatch):
+    """Below min_rows, or with workers=0, no process pool is started."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(clean_module, "ProcessPoolExecutor", no_pool)
+    rows = load_raw_entries()[:250]
+    cleaner = DataCleaner(input_file=None, output_file=None)
+
+    assert cleaner.clean_data_parallel(rows, workers=4, chunk_size=100) == cleaner.clean_data(rows)
+    assert [timing["rows"] for timing in cleaner.chunk_timings] == [100, 100, 50]
+    assert cleaner.clean_data_parallel(rows, workers=0, min_rows=0) == cleaner.clean_data(rows)
+    assert cleaner.clean_data_parallel([], workers=4, min_rows=0) == []
@@ -0,0 +1,72 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+import worker.etl.clean as clean_module  # noqa: E402
+from benchmarks.pages import load_raw_entries  # noqa: E402
+from board.clean import DataCleaner  # noqa: E402
+from db.load_data import APPLICANT_COLUMNS, load_stream  # noqa: E402
+from tests.test_clean_fields import EDGE_CASES  # noqa: E402
+
+
+def _as_number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+@pytest.mark.analysis
+def test_clean_table_matches_clean_data():
+    """Every table row holds what load_from_list would insert for the clean_records record."""
+    rows = load_raw_entries() + [
+        {"raw_text": text, "raw_inst": " MIT\t ", "Season": " ", "GPA": "3.1",
+         "raw_detail": {"GRE Verbal": "160"}}
+        for text in EDGE_CASES
+    ] + [
+        {"University": "Université  de Montréal", "Comments": None},
+        {"url": " \x1c", "raw_date": "Feb 3, 2025", "GRE Score": 320, "GPA": "n/a"},
+        {},
+    ]
+    cleaner = DataCleaner(input_file=None, output_file=None)
+
+    table = cleaner.clean_table(rows)
+
+    assert table.column_names == APPLICANT_COLUMNS[:len(DataCleaner.TABLE_COLUMNS)]
+    assert cleaner.clean_table(rows[:3], stamp=True).column_names == APPLICANT_COLUMNS
+    assert table.schema.field("gpa").type == pa.float64()
+    assert table.schema.field("date_added").type == pa.date32()
+    got = [tuple(map(_as_number, row.values())) for row in table.to_pylist()]
+    expected = [
+        tuple(_as_number(getattr(record, name)) for name, _ in DataCleaner.TABLE_COLUMNS)
+        for record in cleaner.clean_records(rows)
+    ]
+    assert got[:-2] == expected[:-2]
+    assert got[-2][8] is None and expected[-2][8] == "n/a"
+    assert got[-1] == expected[-1]
+    assert cleaner.clean_table([]).num_rows == 0
+
+
+@pytest.mark.analysis
+def test_load_stream_inserts_tables_in_one_executemany(monkeypatch):
+    """Arrow chunks load through executemany; without pyarrow clean_table refuses."""
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    raw_chunks = [[{"raw_inst": f"School {i}", "raw_text": "Accepted on 6 Jan",
+                    "raw_date": "7 Jan 2026"}] * 2
+                  for i in range(2)]
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    counts = list(load_stream(conn, cleaner.iter_clean(raw_chunks, columnar=True)))
+
+    assert counts == [2, 2]
+    assert cursor.executemany.call_count == 2
+    rows = list(cursor.executemany.call_args_list[0].args[1])
+    assert rows[0][:6] == (None, "School 0", "", date(2026, 1, 6), None, "Accepted")
+
+    monkeypatch.setattr(clean_module, "pc", None)
+    with pytest.raises(ValueError):
+        cleaner.clean_table(raw_chunks[0])
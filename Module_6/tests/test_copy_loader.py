@@ -0,0 +1,82 @@
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import db.load_data as load_data_module
+from benchmarks.pages import load_raw_entries
+from board.clean import DataCleaner
+from db.load_data import APPLICANT_COLUMNS, copy_from_list
+
+
+class _Sql:
+    """Stand-in for psycopg.sql that renders composed statements as plain text."""
+
+    class SQL(str):
+        def format(self, *args):
+            return _Sql.SQL(str.format(self, *args))
+
+        def join(self, parts):
+            return _Sql.SQL(str.join(self, parts))
+
+    @staticmethod
+    def Identifier(name):
+        return f'"{name}"'
+
+
+def _copied(rows, rowcount):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.rowcount = rowcount
+    with patch.object(load_data_module, "sql", _Sql):
+        counts = copy_from_list(conn, rows)
+    copy = cursor.copy.return_value.__enter__.return_value
+    written = [call.args[0] for call in copy.write_row.call_args_list]
+    return counts, cursor, copy, written
+
+
+@pytest.mark.db
+def test_copy_from_list_stages_rows_and_merges_once():
+    """Rows stream through one binary COPY; one INSERT ... SELECT reports inserted vs skipped."""
+    records = DataCleaner(input_file=None, output_file=None).clean_records(
+        load_raw_entries()[:200]
+    )
+
+    counts, cursor, copy, written = _copied(records, 150)
+
+    assert counts == (150, 50)
+    assert cursor.copy.call_args.args[0] == (
+        'COPY applicants_staging ("program", "university", "comments", "date_added", "url", '
+        '"status", "term", "us_or_international", "gpa", "gre", "gre_v", "gre_aw", "degree", '
+        '"llm_generated_program", "llm_generated_university", "cleaner_version", "raw_hash") '
+        "FROM STDIN (FORMAT BINARY)"
+    )
+    types = copy.set_types.call_args.args[0]
+    assert len(types) == len(APPLICANT_COLUMNS)
+    assert types[APPLICANT_COLUMNS.index("date_added")] == "date"
+    assert types[APPLICANT_COLUMNS.index("gpa")] == "float8"
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert statements[0].startswith("CREATE TEMP TABLE IF NOT EXISTS applicants_staging ")
+    assert statements[1] == "TRUNCATE applicants_staging"
+    columns = ", ".join(f'"{col}"' for col in APPLICANT_COLUMNS)
+    assert statements[2:] == [
+        f"INSERT INTO applicants ({columns}) SELECT {columns} FROM applicants_staging "
+        "ON CONFLICT DO NOTHING"
+    ]
+    assert len(written) == 200
+    assert written == _copied([record.to_dict() for record in records], 0)[3]
+
+
+@pytest.mark.db
+def test_copy_from_list_coerces_legacy_values():
+    """Legacy dates and numeric strings are typed for the binary COPY; junk scores become NULL."""
+    legacy = {"University": "MIT", "Date of Information Added to Grad CafÃ©": "6 Jan 2026",
+              "GPA": "3.9", "GRE Score": "n/a", "GRE AW": 4}
+
+    counts, _, _, written = _copied([legacy], 0)
+
+    assert counts == (0, 1)
+    row = dict(zip(APPLICANT_COLUMNS, written[0]))
+    assert row["date_added"] == date(2026, 1, 6)
+    assert (row["gpa"], row["gre"], row["gre_aw"]) == (3.9, None, 4.0)
+    assert copy_from_list(MagicMock(), []) == (0, 0)
@@ -1,5 +1,6 @@
 import pytest
 import os
+from datetime import date
 from unittest.mock import MagicMock, patch
 from bs4 import BeautifulSoup
 
@@ -13,9 +14,9 @@ from board.scrape import GradCafeScraper
 def test_load_data_helper_edge_cases():
     """Covers non-string and blank-value branches in loader helper functions."""
     assert clean_val(123) == 123
-    assert clean_date(123) == 123
+    assert clean_date(123) is None
     assert clean_date("   ") is None
-    assert clean_date("29 Mar 2024") == "29 Mar 2024"
+    assert clean_date("29 Mar 2024") == date(2024, 3, 29)
 
 
 @pytest.mark.db
@@ -109,8 +110,9 @@ def test_cleaner_remaining_branches():
         "raw_text": "Rejected on 2 Feb GPA: 3.9 GRE: 320 V 160 AW 4.0",
         "raw_prog": "CS",
         "raw_inst": "Uni",
+        "raw_date": "3 Feb 2026",
     }])[0]
-    assert result["Rejected"] == "2 Feb 2026"
+    assert result["Rejected"] == "2026-02-02"
     assert result["GPA"] == 3.9
     assert result["GRE Score"] == 320
     assert result["GRE V Score"] == 160
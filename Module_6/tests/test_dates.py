@@ -0,0 +1,93 @@
+import json
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from board.clean import DataCleaner
+from db.load_data import clean_date, load_from_list, update_watermark
+from worker.etl.dates import _date_parts, iso_date, parse_date
+from worker.etl.raw_store import RawStore, store_path_for
+
+
+@pytest.mark.analysis
+def test_parse_date_reads_every_format_and_infers_missing_years():
+    """Listing, legacy and ISO dates agree; yearless dates fall on or before the reference."""
+    expected = date(2026, 2, 3)
+    for text in ("3 Feb 2026", "February 3, 2026", "February 3,2026", "2026-02-03",
+                 " Feb  3 2026 ", expected):
+        assert parse_date(text) == expected, text
+    assert iso_date("3 Feb 2026") == "2026-02-03"
+
+    reference = date(2026, 1, 10)
+    assert parse_date("6 Jan", reference) == date(2026, 1, 6)
+    assert parse_date("Dec 28", reference) == date(2025, 12, 28)
+    assert parse_date("29 Feb", reference) == date(2024, 2, 29)
+    assert parse_date("6 Jan") is None
+    for text in ("29 Feb 2025", "31 Apr", "Decision 2026", "", None, "6 Xyz"):
+        assert parse_date(text, reference) is None, text
+
+    _date_parts.cache_clear()
+    for _ in range(3):
+        parse_date("6 Jan", reference)
+    assert _date_parts.cache_info().hits == 2
+
+
+@pytest.mark.analysis
+def test_cleaner_dates_decisions_from_the_listing_date():
+    """A decision's year comes from its row's listing date; JSON records spell it in ISO."""
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    records = cleaner.clean_records([
+        {"raw_inst": "A", "raw_text": "Accepted on 28 Dec", "raw_date": "January 2, 2026"},
+        {"raw_inst": "B", "raw_text": "Rejected on Jan 3", "raw_date": "4 Jan 2026"},
+        {"raw_inst": "C", "raw_text": "Interview", "raw_date": "5 Jan 2026"},
+        {"raw_inst": "D", "raw_text": "Accepted on 6 Foo"},
+    ])
+
+    assert [record.date_added for record in records] == [
+        date(2025, 12, 28), date(2026, 1, 3), date(2026, 1, 5), None
+    ]
+    assert records[0].accepted == date(2025, 12, 28)
+    assert records[0].to_dict()["Accepted"] == "2025-12-28"
+
+
+@pytest.mark.db
+def test_loader_and_watermark_store_dates():
+    """Legacy dicts and the watermark go to the DB as date values."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    load_from_list(conn, [{"University": "MIT",
+                           "Date of Information Added to Grad CafÃ©": "6 Jan 2026"}])
+    assert cursor.executemany.call_args.args[1][0][3] == date(2026, 1, 6)
+
+    update_watermark(conn, "February 23, 2026")
+    assert cursor.execute.call_args.args[1] == (date(2026, 2, 23),)
+    assert clean_date("29 Feb 2025") is None
+
+
+@pytest.mark.integration
+def test_merge_rebuilds_the_index_for_a_new_cleaner_version(tmp_path):
+    """Records signed by another cleaner version are re-signed, so old spellings still dedupe."""
+    (tmp_path / "clean.json").write_text(
+        json.dumps([{"University": "Old", "Comments": "",
+                     "Date of Information Added to Grad CafÃ©": "1 Jan 2026"}]),
+        encoding="utf-8",
+    )
+    raw = RawStore(store_path_for(tmp_path / "raw.json"))
+    raw.append([{"raw_inst": "New", "raw_date": "1 Jan 2026"}])
+    cleaner = DataCleaner(
+        input_file=str(tmp_path / "raw.json"), output_file=str(tmp_path / "clean.json")
+    )
+    cleaner.update_and_merge()
+    store_dir = store_path_for(tmp_path / "clean.json")
+
+    state = json.loads((store_dir / "merge.json").read_text(encoding="utf-8"))
+    state["cleaner_version"] = DataCleaner.CLEANER_VERSION - 1
+    (store_dir / "merge.json").write_text(json.dumps(state))
+    raw.new_segment()
+    raw.append([{"raw_inst": "Old", "raw_date": "2026-01-01"}])
+    cleaner.update_and_merge()
+
+    rows = RawStore(store_dir).to_list(newest_batch_first=True)
+    assert [row["University"] for row in rows] == ["New", "Old"]
@@ -0,0 +1,116 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.pages import results_pages
+from board.clean import DataCleaner
+from board.scrape import GradCafeScraper
+from worker.etl.detail_cache import DetailCache
+from worker.etl.scrape import PARSER_BACKENDS, parse_page
+
+DETAIL_HTML = (
+    "<dl><div><dt>Institution</dt><dd>MIT</dd></div>"
+    "<div><dt>Undergrad GPA</dt><dd>3.85</dd></div>"
+    "<div><dt>GRE General:</dt><dd>0</dd></div>"
+    "<div><dt>GRE Verbal</dt><dd>165</dd></div>"
+    "<div><dt>Analytical Writing</dt><dd>4.50</dd></div></dl>"
+)
+
+
+def _entries(count):
+    return [
+        {"raw_inst": f"School {i}", "raw_text": "", "detail_url": f"https://x/result/{i}"}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.integration
+def test_every_backend_extracts_the_detail_link():
+    """Rows carry the absolute detail page URL, without its fragment, in every backend."""
+    entries, html = results_pages(
+        [{"raw_inst": "MIT", "raw_prog": "CS", "raw_text": "", "raw_comments": "hi"}]
+    )[0]
+    url = "https://www.thegradcafe.com/survey/index.php?page=1"
+    parsed = {parser: parse_page(html, url, parser) for parser in PARSER_BACKENDS}
+
+    assert len(entries) == len(parsed["html.parser"]) == 1
+    assert parsed["html.parser"][0]["detail_url"] == "https://www.thegradcafe.com/result/1"
+    assert parsed["lxml"] == parsed["stream"] == parsed["html.parser"]
+
+
+@pytest.mark.integration
+def test_enrichment_caps_concurrency_and_never_refetches(tmp_path):
+    """Detail pages are fetched at most detail_workers at a time and only once per URL."""
+    requested = []
+    active = [0, 0]
+    lock = threading.Lock()
+
+    def fake_request(url, pool=None, **kwargs):
+        with lock:
+            requested.append(url)
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if url.endswith("/3"):
+            return SimpleNamespace(status=404, data=b"")
+        if url.endswith("/4"):
+            return SimpleNamespace(status=503, data=b"")
+        return SimpleNamespace(status=200, data=DETAIL_HTML.encode())
+
+    s = GradCafeScraper(
+        output_file=None, debug=False, detail_cache=tmp_path / "details.ndjson", detail_workers=3
+    )
+    assert s.detail_http.connection_pool_kw["maxsize"] == 3
+    s._request = fake_request
+    entries = _entries(10) + _entries(2) + [{"raw_inst": "No link"}]
+
+    assert s.enrich_details(entries) == 10
+    assert len(requested) == 10 and active[1] == 3
+    assert entries[0]["raw_detail"]["Undergrad GPA"] == "3.85"
+    assert "raw_detail" not in entries[3] and "raw_detail" not in entries[4]
+
+    again = GradCafeScraper(output_file=None, debug=False, detail_cache=tmp_path / "details.ndjson")
+    again._request = fake_request
+    requested.clear()
+    rerun = _entries(10)
+    assert again.enrich_details(rerun) == 1
+    assert requested == ["https://x/result/4"]
+    assert rerun[9]["raw_detail"] == entries[9]["raw_detail"]
+    assert len(DetailCache(tmp_path / "details.ndjson")) == 9
+
+
+@pytest.mark.integration
+def test_detail_cache_cuts_a_torn_line_before_appending(tmp_path):
+    """A torn final line is truncated on open, so the next put lands on its own line."""
+    path = tmp_path / "details.ndjson"
+    DetailCache(path).put("https://x/result/1", {"GPA": "3.9"})
+    with path.open("a", encoding="utf-8") as file_handle:
+        file_handle.write('{"url": "https://x/res')
+
+    cache = DetailCache(path)
+    cache.put("https://x/result/2", {"GPA": "3.1"})
+
+    reopened = DetailCache(path)
+    assert reopened.get("https://x/result/2") == {"GPA": "3.1"}
+    assert len(reopened) == 2
+
+
+@pytest.mark.integration
+def test_cleaner_fills_scores_from_detail_fields():
+    """Detail fields fill scores the row text lacks; zero (unreported) scores are ignored."""
+    raw = {
+        "raw_inst": "MIT",
+        "raw_text": "MIT CS GPA 3.20",
+        "raw_detail": {"Undergrad GPA": "3.85", "GRE General:": "0", "GRE Verbal": "165",
+                       "Analytical Writing": "4.50"},
+    }
+    cleaned = DataCleaner(input_file=None, output_file=None).clean_data([raw])[0]
+
+    assert cleaned["GPA"] == 3.20
+    assert cleaned["GRE V Score"] == 165
+    assert cleaned["GRE AW"] == 4.5
+    assert "GRE Score" not in cleaned
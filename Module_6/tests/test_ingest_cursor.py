@@ -0,0 +1,117 @@
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.worker.consumer as consumer
+from board.scrape import GradCafeScraper
+from worker.etl.scrape import advance_cursor, entry_signature
+
+
+def _row(label, added):
+    return (
+        f"<tr><td>{label}</td><td><span>Prog</span></td>"
+        f"<td>{added}</td><td>Accepted</td></tr>"
+    )
+
+
+# Newest first, three rows per page; March 1 spans pages 1-2.
+LISTING = [
+    [("New A", "March 2, 2026"), ("New B", "March 1, 2026"), ("New C", "March 1, 2026")],
+    [("New D", "March 1, 2026"), ("Old E", "March 1, 2026"), ("Old F", "March 1, 2026")],
+    [("Old G", "February 28, 2026"), ("Old H", "February 27, 2026"), ("Old I", "February 26, 2026")],
+    [("Old J", "February 25, 2026"), ("Old K", "February 24, 2026"), ("Old L", "February 23, 2026")],
+]
+
+
+def _scraper(workers=1):
+    s = GradCafeScraper(output_file=None, debug=False, workers=workers)
+    requested = []
+
+    def fetch(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        requested.append(page)
+        rows = LISTING[page - 1] if page <= len(LISTING) else []
+        return "<table>" + "".join(_row(*row) for row in rows) + "</table>"
+
+    s._fetch_html = fetch
+    return s, requested
+
+
+def _ingested_cursor():
+    s, _ = _scraper()
+    old = [e for e in s.scrape_pages(2, 4) if e["raw_inst"].startswith("Old")]
+    return advance_cursor(None, old)
+
+
+@pytest.mark.integration
+def test_raw_date_captures_long_form_dates():
+    """Covers raw_date extraction for the 'Month D, YYYY' column."""
+    s, _ = _scraper()
+    assert s.scrape_pages(1, 1)[0]["raw_date"] == "March 2, 2026"
+
+
+@pytest.mark.integration
+def test_advance_cursor_tracks_newest_date_signatures():
+    """Covers cursor creation, same-date growth and date roll-forward."""
+    cursor = _ingested_cursor()
+    assert cursor["date"] == "2026-03-01"
+    assert len(cursor["signatures"]) == 2
+
+    same_day = [{"raw_inst": "X", "raw_date": "1 Mar 2026"}]
+    grown = advance_cursor(cursor, same_day)
+    assert grown["date"] == "2026-03-01"
+    assert entry_signature(same_day[0]) in grown["signatures"]
+    assert len(grown["signatures"]) == 3
+
+    rolled = advance_cursor(grown, [{"raw_inst": "Y", "raw_date": "2 Mar 2026"}])
+    assert rolled["date"] == "2026-03-02" and len(rolled["signatures"]) == 1
+    assert advance_cursor(cursor, [{"raw_inst": "no date"}]) == cursor
+    assert advance_cursor(None, []) is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("boundary_search", [False, True])
+def test_cursor_stops_at_first_ingested_row(boundary_search):
+    """Same-date rows before the first ingested signature are still collected."""
+    s, requested = _scraper()
+    out = s.scrape_data(max_pages=50, cursor=_ingested_cursor(), boundary_search=boundary_search)
+
+    assert [e["raw_inst"] for e in out] == ["New A", "New B", "New C", "New D"]
+    assert len(requested) == len(set(requested)) and max(requested) <= 4
+
+
+@pytest.mark.integration
+def test_scrape_handler_advances_cursor_with_load():
+    """Covers the worker writing the advanced cursor after a successful load."""
+    cursor = _ingested_cursor()
+    s, _ = _scraper()
+    with patch.object(consumer, "get_ingest_cursor", return_value=cursor), \
+         patch.object(consumer, "GradCafeScraper", return_value=s), \
+         patch.object(consumer, "get_db_conn"), \
+         patch("src.db.load_data.load_from_list") as load, \
+         patch.object(consumer, "update_ingest_cursor") as update:
+        consumer.handle_scrape_new_data(None, None, None, json.dumps({}))
+
+    assert sum(len(c.args[1]) for c in load.call_args_list) == 4
+    new_cursor = update.call_args.args[1]
+    assert new_cursor["date"] == "2026-03-02"
+    assert new_cursor["signatures"] == [entry_signature(s.scrape_pages(1, 1)[0])]
+
+
+@pytest.mark.integration
+def test_scrape_handler_keeps_cursor_when_watermark_is_out_of_reach():
+    """Rows found before CATCHUP_MAX_PAGES load, but the cursor does not skip the gap."""
+    cursor = _ingested_cursor()
+    s, _ = _scraper()
+    with patch.object(consumer, "get_ingest_cursor", return_value=cursor), \
+         patch.object(consumer, "CATCHUP_MAX_PAGES", 1), \
+         patch.object(consumer, "GradCafeScraper", return_value=s), \
+         patch.object(consumer, "get_db_conn"), \
+         patch("src.db.load_data.load_from_list") as load, \
+         patch.object(consumer, "update_ingest_cursor") as update:
+        consumer.handle_scrape_new_data(None, None, None, json.dumps({}))
+
+    assert sum(len(c.args[1]) for c in load.call_args_list) == 3
+    assert not update.called
@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from board.clean import DataCleaner
+from db.load_data import COPY_MIN_ROWS, load_from_list
+
+
+def _records(count):
+    raw = [{"raw_inst": f"School {number}", "raw_date": "1 Jan 2026"} for number in range(count)]
+    return DataCleaner(input_file=None, output_file=None).clean_records(raw)
+
+
+@pytest.mark.db
+def test_load_from_list_batches_small_loads_and_copies_large_ones():
+    """Small batches go out in one executemany; COPY_MIN_ROWS rows or more go through COPY."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    with patch("db.load_data.copy_from_list") as copy:
+        load_from_list(conn, _records(20))
+        assert not copy.called
+        assert cursor.executemany.call_count == 1 and not cursor.execute.called
+        assert len(cursor.executemany.call_args.args[1]) == 20
+
+        large = _records(COPY_MIN_ROWS)
+        load_from_list(conn, large)
+        copy.assert_called_once_with(conn, large)
+
+        load_from_list(conn, large, copy_min_rows=None)
+        load_from_list(conn, [])
+    assert cursor.executemany.call_count == 2
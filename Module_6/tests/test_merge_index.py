@@ -0,0 +1,84 @@
+import json
+import random
+
+import pytest
+
+from board.clean import DataCleaner
+from worker.etl.raw_store import RawStore, store_path_for
+from worker.etl.signatures import SignatureFile
+
+
+def _rows(*labels):
+    return [{"raw_inst": label, "raw_date": "1 Jan 2026"} for label in labels]
+
+
+def _merge(tmp_path):
+    cleaner = DataCleaner(
+        input_file=str(tmp_path / "raw.json"), output_file=str(tmp_path / "clean.json")
+    )
+    cleaned = []
+    clean = cleaner.clean_records_parallel
+    cleaner.clean_records_parallel = lambda rows, **kw: cleaned.extend(rows) or clean(rows, **kw)
+    cleaner.update_and_merge()
+    return [row["raw_inst"] for row in cleaned]
+
+
+def _universities(tmp_path):
+    store = RawStore(store_path_for(tmp_path / "clean.json"))
+    return [row["University"] for row in store.to_list(newest_batch_first=True)]
+
+
+@pytest.mark.integration
+def test_signature_file_reopens_and_grows(tmp_path):
+    """Members survive close/open and growth; damaged files are rejected."""
+    rng = random.Random(5)
+    values = [rng.getrandbits(64) for _ in range(3000)] + [0]
+    index = SignatureFile(tmp_path / "sigs.idx")
+    index.update(values)
+    index.close()
+
+    reopened = SignatureFile.open(tmp_path / "sigs.idx")
+    assert len(reopened) == len(values)
+    assert all(value in reopened for value in values)
+    assert not reopened.add(values[0]) and reopened.add(42)
+    reopened.close()
+    assert len(SignatureFile.open(tmp_path / "sigs.idx")) == len(values) + 1
+
+    (tmp_path / "torn.idx").write_bytes((tmp_path / "sigs.idx").read_bytes()[:-8])
+    assert SignatureFile.open(tmp_path / "torn.idx") is None
+    assert SignatureFile.open(tmp_path / "missing.idx") is None
+
+
+@pytest.mark.analysis
+def test_incremental_merge_cleans_and_appends_only_new_rows(tmp_path):
+    """Each merge reads raw rows past the saved offset and appends one batch of new records."""
+    (tmp_path / "clean.json").write_text(
+        json.dumps([{"University": "Legacy", "Comments": "",
+                     "Date of Information Added to Grad CafÃ©": "1 Jan 2026"}]),
+        encoding="utf-8",
+    )
+    raw = RawStore(store_path_for(tmp_path / "raw.json"))
+    raw.append(_rows("A", "B", "Legacy"))
+    store_dir = store_path_for(tmp_path / "clean.json")
+
+    assert _merge(tmp_path) == ["A", "B", "Legacy"]
+    assert _universities(tmp_path) == ["A", "B", "Legacy"]
+    state = json.loads((store_dir / "merge.json").read_text(encoding="utf-8"))
+    assert state == {"records": 3, "raw_offset": 3,
+                     "cleaner_version": DataCleaner.CLEANER_VERSION}
+
+    raw.new_segment()
+    raw.append(_rows("C", "A"))
+    assert _merge(tmp_path) == ["C", "A"]
+    assert _merge(tmp_path) == []
+    assert _universities(tmp_path) == ["C", "A", "B", "Legacy"]
+
+    state = json.loads((store_dir / "merge.json").read_text(encoding="utf-8"))
+    assert state == {"records": 4, "raw_offset": 5,
+                     "cleaner_version": DataCleaner.CLEANER_VERSION}
+
+    # A stale state (records appended, crash before the state write) rebuilds the index
+    (store_dir / "merge.json").write_text(json.dumps({"records": 1, "raw_offset": 3}))
+    (store_dir / "signatures.idx").unlink()
+    assert _merge(tmp_path) == ["C", "A"]
+    assert _universities(tmp_path) == ["C", "A", "B", "Legacy"]
@@ -0,0 +1,66 @@
+import json
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from benchmarks.pages import load_raw_entries, results_pages
+from board.scrape import GradCafeScraper
+from worker.etl import reparse as reparse_module
+from worker.etl.page_archive import PageArchive
+
+
+def _archived_scrape(tmp_path, pages, parser="html.parser"):
+    s = GradCafeScraper(output_file=None, debug=False, parser=parser, archive=tmp_path / "arc")
+    s._fetch_html = lambda url: pages[int(re.search(r"page=(\d+)", url).group(1)) - 1][1]
+    return s, s.scrape_pages(1, len(pages))
+
+
+@pytest.mark.integration
+def test_archive_round_trip_and_dedupe(tmp_path):
+    """Snapshots survive reopening; an unchanged body is not stored twice."""
+    archive = PageArchive(tmp_path)
+    url = "https://x/survey/index.php?page=3"
+    assert archive.add(url, "<p>café \r\n\r\n body</p>", fetched_at=0)
+    assert not archive.add(url, "<p>café \r\n\r\n body</p>")
+    assert archive.add(url, b"<p>v2</p>")
+
+    with (tmp_path / "index.ndjson").open("a") as index:
+        index.write('{"url": "torn')
+    reopened = PageArchive(tmp_path)
+    assert len(reopened) == 2
+    (record, body), (_, second) = list(reopened)
+    assert body.decode("utf-8") == "<p>café \r\n\r\n body</p>"
+    assert second == b"<p>v2</p>"
+    assert record["page"] == 3 and record["sha256"]
+
+    # The torn line was cut off on open, so the next snapshot is indexed intact
+    assert reopened.add(url, b"<p>v3</p>")
+    assert [body for _, body in PageArchive(tmp_path)][-1] == b"<p>v3</p>"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parser", ["html.parser", "stream"])
+def test_reparse_rebuilds_scraped_entries_offline(tmp_path, parser):
+    """Reparse from the archive matches what the live scrape produced."""
+    pages = results_pages(load_raw_entries()[:100])
+    _, scraped = _archived_scrape(tmp_path, pages, parser)
+
+    for processes in (0, 2):
+        assert reparse_module.reparse(tmp_path / "arc", processes=processes) == scraped
+
+
+@pytest.mark.integration
+def test_reparse_cli_writes_output_and_reloads(tmp_path, monkeypatch):
+    """Covers the reparse entry point's JSON output and DB reload path."""
+    pages = results_pages(load_raw_entries()[:40])
+    _, scraped = _archived_scrape(tmp_path, pages)
+    load_stream = MagicMock(side_effect=lambda conn, chunks, **kw: (len(c) for c in chunks))
+    monkeypatch.setattr(reparse_module, "load_stream", load_stream)
+    monkeypatch.setattr(reparse_module, "ensure_tables", MagicMock())
+
+    out = tmp_path / "raw.json"
+    reparse_module.main([str(tmp_path / "arc"), "--output", str(out), "--processes", "0", "--load"])
+
+    assert json.loads(out.read_text(encoding="utf-8")) == scraped
+    assert load_stream.called
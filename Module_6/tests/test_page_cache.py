@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import MagicMock
+
+from board.scrape import GradCafeScraper
+from worker.etl.page_cache import PageCache
+
+
+def _page(label):
+    return (
+        "<table>"
+        f"<tr><td>{label}</td><td><span>Prog</span></td><td>1 Jan 2026</td></tr>"
+        "</table>"
+    ).encode("utf-8")
+
+
+def _response(status=200, body=b"", etag=None):
+    headers = {"ETag": etag} if etag else {}
+    return MagicMock(status=status, data=body, headers=headers)
+
+
+def _cached_scraper(tmp_path, responses):
+    s = GradCafeScraper(output_file=None, debug=True, page_cache=tmp_path)
+    s.http = MagicMock()
+    s.http.request.side_effect = responses
+    return s
+
+
+@pytest.mark.integration
+def test_page_cache_conditional_request_skips_parse(tmp_path):
+    """A 304 on an already-ingested page stops the run without parsing."""
+    first = _cached_scraper(tmp_path, [_response(body=_page("School A"), etag='"v1"')])
+    assert [e["raw_inst"] for e in first.scrape_data(target_count=1, max_pages=1)] == ["School A"]
+    assert first.cache_report["hits"] == 0
+
+    second = _cached_scraper(tmp_path, [_response(status=304)])
+    second._parse_html = MagicMock()
+    assert second.scrape_data(target_count=10, max_pages=3) == []
+
+    sent = second.http.request.call_args.kwargs["headers"]
+    assert sent["If-None-Match"] == '"v1"'
+    assert not second._parse_html.called
+    assert second.cache_report["not_modified"] == 1
+    assert second.cache_report["bytes_saved"] == len(_page("School A"))
+    assert second.cache_report["hit_rate"] == 1.0
+
+
+@pytest.mark.integration
+def test_page_cache_hash_match_and_changed_pages(tmp_path):
+    """Same bytes without validators still skip parsing; new bytes are parsed."""
+    _cached_scraper(tmp_path, [_response(body=_page("School A"))]).scrape_data(
+        target_count=1, max_pages=1
+    )
+
+    same = _cached_scraper(tmp_path, [_response(body=_page("School A"))])
+    assert same.scrape_data(target_count=10, max_pages=3) == []
+    assert same.cache_report["unchanged"] == 1
+
+    changed = _cached_scraper(tmp_path, [_response(body=_page("School B"))])
+    assert [e["raw_inst"] for e in changed.scrape_data(target_count=1, max_pages=1)] == ["School B"]
+    assert changed.cache_report["hits"] == 0
+    assert len(list((tmp_path / "pages").rglob("*.html.gz"))) == 1
+
+
+@pytest.mark.integration
+def test_page_cache_uses_stored_body_when_not_yet_ingested(tmp_path):
+    """A 304 for a page that was fetched but never consumed parses the cached copy."""
+    cache = PageCache(tmp_path)
+    url = GradCafeScraper(output_file=None, debug=False)._build_url(1)
+    cache.store(url, _page("School C"), {"ETag": '"v2"'})
+    cache.save()
+
+    s = _cached_scraper(tmp_path, [_response(status=304)])
+    assert [e["raw_inst"] for e in s.scrape_data(target_count=1, max_pages=1)] == ["School C"]
+    assert PageCache(tmp_path).is_ingested(url, cache.index[url]["sha256"])
+
+
+@pytest.mark.integration
+def test_page_cache_error_branches(tmp_path):
+    """Covers request errors, HTTP errors, corrupt index and unwritable dirs."""
+    s = _cached_scraper(tmp_path, [Exception("down"), _response(status=500), _response(body=_page("Okay"))])
+    assert len(s.scrape_data(target_count=1, max_pages=1)) == 1
+
+    (tmp_path / "index.json").write_text("[1, 2]")
+    cache = PageCache(tmp_path)
+    assert cache.index == {}
+    assert cache.read_body("0" * 64) is None
+    assert cache.report()["hit_rate"] == 0.0
+
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    broken = PageCache(blocker / "cache")
+    broken.store("u", b"body", {})
+    broken.save()
@@ -0,0 +1,40 @@
+import re
+import time
+
+import pytest
+
+from benchmarks.pages import load_raw_entries, results_pages
+from board.scrape import GradCafeScraper
+from worker.etl.scrape import parse_page
+
+
+def _serve(pages, delay_first=0.0):
+    def fetch(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        if page == 1:
+            time.sleep(delay_first)
+        return pages[page - 1][1] if page <= len(pages) else None
+    return fetch
+
+
+@pytest.mark.integration
+def test_parse_page_matches_in_process_parser():
+    """Covers the process-pool entry point against the scraper's own parser."""
+    _, html = results_pages(load_raw_entries()[:20])[0]
+    scraper = GradCafeScraper(output_file=None, debug=False)
+    assert parse_page(html, "u") == scraper._parse_html(html, "u")
+
+
+@pytest.mark.integration
+def test_process_pool_parsing_keeps_page_order():
+    """Pages parsed out of order in worker processes are yielded by page number."""
+    pages = results_pages(load_raw_entries()[:120])
+    s = GradCafeScraper(output_file=None, debug=False, workers=3, parse_processes=2)
+    s._fetch_html = _serve(pages, delay_first=0.2)
+
+    out = s.scrape_pages(1, len(pages))
+
+    expected = GradCafeScraper(output_file=None, debug=False)
+    expected._fetch_html = _serve(pages)
+    assert out == expected.scrape_pages(1, len(pages))
+    assert [e["raw_inst"] for e in out[:20]] == [e["raw_inst"] for e in pages[0][0]]
@@ -0,0 +1,48 @@
+import pytest
+
+from benchmarks.pages import results_pages
+from board.scrape import GradCafeScraper
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parser", ["lxml", "stream"])
+def test_backend_matches_html_parser_on_stored_pages(parser):
+    """Every backend must produce identical entry dicts for every stored page."""
+    soup_scraper = GradCafeScraper(output_file=None, debug=False)
+    fast_scraper = GradCafeScraper(output_file=None, debug=False, parser=parser)
+
+    for expected, html in results_pages():
+        from_soup = soup_scraper._parse_html(html, "u")
+        assert from_soup == fast_scraper._parse_html(html, "u")
+        assert [e["raw_text"] for e in from_soup] == [e["raw_text"] for e in expected]
+        assert [e["raw_comments"].strip() for e in from_soup] == [
+            e["raw_comments"].strip() for e in expected
+        ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parser", ["lxml", "stream"])
+def test_backend_edge_markup(parser):
+    """Covers script/comment stripping, date capture, and empty documents."""
+    s = GradCafeScraper(output_file=None, debug=False, parser=parser)
+    html = (
+        "<table><tr><td>School<!-- hidden --><script>x()</script></td>"
+        "<td>Prog</td><td>4 Jan 2026</td></tr>"
+        "<tr><td>Fall 2026</td></tr><tr><td> </td></tr></table>"
+    )
+    assert s._parse_html(html, "u") == [{
+        "raw_inst": "School",
+        "raw_prog": "",
+        "raw_text": "School Prog 4 Jan 2026",
+        "raw_comments": " Fall 2026",
+        "url": "u",
+        "raw_date": "4 Jan 2026",
+    }]
+    assert s._parse_html("", "u") == []
+    assert s._parse_html("<p>no rows</p>", "u") == []
+
+
+@pytest.mark.integration
+def test_unknown_parser_backend_rejected():
+    with pytest.raises(ValueError):
+        GradCafeScraper(output_file=None, debug=False, parser="regex")
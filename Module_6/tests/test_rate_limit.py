@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from board.scrape import GradCafeScraper
+from worker.etl.rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.integration
+def test_aimd_increase_and_decrease():
+    """Successes grow rate/concurrency additively; a 429 halves them once per window."""
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(rate=1.0, concurrency=1.0, max_concurrency=4, clock=clock)
+
+    for _ in range(10):
+        limiter.acquire("h")
+        clock.now += 1.0
+        limiter.release("h", status=200, latency=0.2)
+    grown = limiter.snapshot()["h"]
+    assert grown["rate"] == pytest.approx(2.0)
+    assert grown["concurrency"] == 4
+
+    limiter.release("h", status=429)
+    limiter.release("h", status=429)
+    cut = limiter.snapshot()["h"]
+    assert cut["rate"] == pytest.approx(1.0)
+    assert cut["concurrency"] == 2
+
+    clock.now += 5.0
+    limiter.release("h", status=200, latency=10.0)
+    assert limiter.snapshot()["h"]["rate"] == pytest.approx(0.5)
+    assert limiter.snapshot()["h"]["in_flight"] == 0
+
+
+@pytest.mark.integration
+def test_retry_after_pauses_host():
+    limiter = AdaptiveRateLimiter(rate=100.0, latency_target=0.01)
+    limiter.acquire("h")
+    limiter.release("h", status=429, retry_after=0.2)
+    assert limiter.snapshot()["h"]["paused_for"] > 0
+
+    started = time.monotonic()
+    limiter.acquire("h")
+    assert time.monotonic() - started >= 0.15
+
+
+@pytest.mark.integration
+def test_concurrency_limit_blocks_until_release():
+    limiter = AdaptiveRateLimiter(rate=1000.0, concurrency=1.0)
+    limiter.acquire("h")
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire("h")
+        acquired.set()
+
+    worker = threading.Thread(target=second)
+    worker.start()
+    assert not acquired.wait(0.1)
+    limiter.release("h", status=200, latency=0.01)
+    assert acquired.wait(1.0)
+    worker.join()
+
+
+@pytest.mark.integration
+def test_parse_retry_after_formats():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.integration
+def test_scraper_retries_throttled_page_through_limiter():
+    """A 429 or block page is reported to the limiter and the page is retried."""
+    limiter = AdaptiveRateLimiter(rate=5.0, latency_target=60.0)
+    s = GradCafeScraper(output_file=None, debug=True, rate_limiter=limiter)
+    page = b"<table><tr><td>School</td><td><span>P</span></td></tr></table>"
+    s.http = MagicMock()
+    s.http.request.side_effect = [
+        MagicMock(status=429, data=b"", headers={"Retry-After": "0"}),
+        MagicMock(status=200, data=b"<title>Just a moment...</title>", headers={}),
+        MagicMock(status=200, data=page, headers={}),
+    ]
+
+    out = s.scrape_data(target_count=1, max_pages=1)
+
+    assert [e["raw_inst"] for e in out] == ["School"]
+    assert s.http.request.call_count == 3
+    state = limiter.snapshot()["www.thegradcafe.com"]
+    assert state["rate"] < 5.0 and state["in_flight"] == 0
+
+
+@pytest.mark.integration
+def test_scraper_limiter_gives_up_and_releases_on_errors():
+    """Exhausted attempts return the last response; request errors still free the slot."""
+    s = GradCafeScraper(output_file=None, debug=False, rate_limiter=True, parser="stream")
+    s.rate_limiter = AdaptiveRateLimiter(rate=1000.0, latency_target=0.0)
+    s.http = MagicMock()
+    forbidden = MagicMock(status=403)
+    s.http.request.return_value = forbidden
+    assert list(s._stream_entries("https://h/x")) == []
+    assert s.http.request.call_count == s.MAX_THROTTLED_ATTEMPTS
+    assert forbidden.release_conn.called
+
+    s.http.request.side_effect = Exception("reset")
+    assert list(s._stream_entries("https://h/x")) == []
+    assert s.rate_limiter.snapshot()["h"]["in_flight"] == 0
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from board.clean import DataCleaner
+from board.scrape import GradCafeScraper
+from worker.etl.raw_store import RawStore, store_path_for
+
+
+def _rows(*labels):
+    return [{"raw_inst": label, "raw_date": "1 Jan 2026"} for label in labels]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("compress", [False, True])
+def test_raw_store_append_and_reopen(tmp_path, compress):
+    """Appends survive reopening, roll segments, and keep batch order."""
+    store = RawStore(tmp_path / "raw.store", compress=compress)
+    store.SEGMENT_RECORDS = 2
+    assert not store.exists() and len(store) == 0
+
+    assert store.append(_rows("A", "B", "C")) == 3
+    store.new_segment()
+    store.append(_rows("D"))
+
+    reopened = RawStore(tmp_path / "raw.store")
+    assert len(reopened) == 4
+    assert [r["raw_inst"] for r in reopened] == ["A", "B", "C", "D"]
+    assert [r["raw_inst"] for r in reopened.to_list(newest_batch_first=True)] == ["D", "A", "B", "C"]
+    assert [segment["batch"] for segment in reopened.segments] == [0, 0, 1]
+
+
+@pytest.mark.integration
+def test_raw_store_reverses_whole_batches(tmp_path):
+    """A batch spanning several segments comes back newest-first as one unit, in order."""
+    store = RawStore(tmp_path / "raw.store")
+    store.SEGMENT_RECORDS = 2
+    store.new_segment()
+    store.append(_rows("A", "B", "C", "D", "E"))
+    store.new_segment()
+    store.append(_rows("F"))
+
+    assert [r["raw_inst"] for r in store.to_list(newest_batch_first=True)] == list("FABCDE")
+    assert [r["raw_inst"] for r in store.to_list(newest_batch_first=True, offset=3)] == list("FDE")
+    assert [len(batch) for batch in store.iter_batches()] == [5, 1]
+
+    # An index written before batch ids reads each segment as its own batch
+    for segment in store.segments:
+        del segment["batch"]
+    assert [len(batch) for batch in store.iter_batches(reverse=True)] == [1, 1, 2, 2]
+    store.new_segment()
+    store.append(_rows("G"))
+    assert store.segments[-1]["batch"] == 4
+
+
+@pytest.mark.integration
+def test_raw_store_truncates_torn_write_and_imports_json(tmp_path):
+    """Uncommitted tail bytes are dropped on open; legacy JSON is imported once."""
+    legacy = tmp_path / "raw.json"
+    legacy.write_text(json.dumps(_rows("A", "B")), encoding="utf-8")
+    store = RawStore(store_path_for(legacy))
+    assert store.path == tmp_path / "raw.store"
+    assert store.import_json(legacy) == 2
+    assert store.import_json(legacy) == 0
+
+    segment_file = store.path / store.segments[-1]["name"]
+    with open(segment_file, "ab") as file_handle:
+        file_handle.write(b'{"raw_inst": "half')
+
+    reopened = RawStore(store.path)
+    assert segment_file.stat().st_size == reopened.segments[-1]["bytes"]
+    reopened.append(_rows("C"))
+    assert [r["raw_inst"] for r in RawStore(store.path)] == ["A", "B", "C"]
+
+    (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+    assert RawStore(tmp_path / "bad.store").import_json(tmp_path / "bad.json") == 0
+    assert RawStore(tmp_path / "none.store").import_json(tmp_path / "none.json") == 0
+
+
+@pytest.mark.integration
+def test_scraper_saves_only_new_entries(tmp_path):
+    """save_raw_data appends one batch per run and keeps the newest-first list view."""
+    output = tmp_path / "raw_applicant_data.json"
+    output.write_text(json.dumps(_rows("Old")), encoding="utf-8")
+
+    first = GradCafeScraper(output_file=str(output), debug=False)
+    assert [e["raw_inst"] for e in first.raw_data] == ["Old"]
+    first.raw_data = _rows("New 1", "New 2") + first.raw_data
+    first.save_raw_data()
+    first.save_raw_data()
+
+    store = RawStore(store_path_for(output))
+    assert len(store) == 3
+    assert len(store.segments) == 2
+
+    second = GradCafeScraper(output_file=str(output), debug=False)
+    assert [e["raw_inst"] for e in second.raw_data] == ["New 1", "New 2", "Old"]
+
+    cleaner = DataCleaner(input_file=str(output), output_file=str(tmp_path / "clean.json"))
+    cleaner.update_and_merge()
+    merged = RawStore(store_path_for(tmp_path / "clean.json")).to_list(newest_batch_first=True)
+    assert [e["University"] for e in merged] == ["New 1", "New 2", "Old"]
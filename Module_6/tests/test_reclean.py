@@ -0,0 +1,95 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.worker.consumer as consumer
+from board.clean import DataCleaner
+from db.load_data import iter_stale_raw_rows, load_stream, upsert_records
+from worker.etl.clean import raw_hash
+
+
+def _raw(*labels):
+    return [{"raw_inst": label, "raw_text": "Accepted on 6 Jan"} for label in labels]
+
+
+@pytest.mark.db
+def test_stamped_chunks_store_their_raw_rows():
+    """Stamped records carry the version and raw hash; load_stream stores the raw rows."""
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    raw_chunks = [_raw("A", "B"), _raw("C")]
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    assert raw_hash({"a": 1, "b": "x"}) == raw_hash({"b": "x", "a": 1})
+    assert raw_hash({"a": 1}) != raw_hash({"a": 2})
+    assert cleaner.clean_records(raw_chunks[0])[0].raw_hash is None
+
+    counts = list(load_stream(conn, cleaner.iter_clean(raw_chunks, stamp=True),
+                              raw_chunks=raw_chunks))
+
+    assert counts == [2, 1]
+    batches = [call.args[1] for call in cursor.executemany.call_args_list]
+    inserted = [tuple(row[-2:]) for rows in batches[0::2] for row in rows]
+    assert inserted == [(DataCleaner.CLEANER_VERSION, raw_hash(row))
+                        for chunk in raw_chunks for row in chunk]
+    stored = [row for rows in batches[1::2] for row in rows]
+    assert stored == [(raw_hash(row), json.dumps(row), DataCleaner.CLEANER_VERSION)
+                      for chunk in raw_chunks for row in chunk]
+
+    # A raw stream that runs out first ends the load instead of raising
+    short = list(load_stream(conn, cleaner.iter_clean(raw_chunks, stamp=True),
+                             raw_chunks=iter(raw_chunks[:1])))
+    assert short == [2]
+
+
+@pytest.mark.db
+def test_reclean_pages_stale_rows_and_upserts_stamped_batches():
+    """Stale raw rows are paged by hash, re-cleaned with their stored hash and upserted."""
+    batches = [[("h1", _raw("A")[0]), ("h2", _raw("B")[0])], [("h3", _raw("C")[0])], []]
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = batches
+    upserted = []
+
+    with patch.object(consumer, "get_db_conn", return_value=conn), \
+         patch.object(consumer, "ensure_tables"), \
+         patch.object(consumer, "upsert_records", side_effect=lambda conn, records: upserted.append(records)):
+        consumer.handle_reclean(None, None, None, json.dumps({"payload": {"batch_size": 2}}))
+
+    after = [call.args[1][0] for call in cursor.execute.call_args_list]
+    assert after == ["", "h2", "h3"]
+    assert [[(r.university, r.raw_hash) for r in batch] for batch in upserted] == [
+        [("A", "h1"), ("B", "h2")], [("C", "h3")]
+    ]
+    assert {r.cleaner_version for batch in upserted for r in batch} == {
+        DataCleaner.CLEANER_VERSION
+    }
+
+    conn.reset_mock()
+    upsert_records(conn, upserted[0])
+    deleted, marked = [call.args[1] for call in cursor.execute.call_args_list]
+    assert deleted == (["h1", "h2"], DataCleaner.CLEANER_VERSION)
+    assert len(cursor.executemany.call_args.args[1]) == 2
+    # Raw rows are marked even if their cleaned row merged with another's
+    assert marked == (DataCleaner.CLEANER_VERSION, ["h1", "h2"])
+
+
+@pytest.mark.db
+def test_iter_stale_raw_rows_pages_by_hash_until_empty():
+    """Each batch starts after the last raw_hash of the previous one; an empty batch ends it."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = [[("h1", {}), ("h2", {})], [("h3", {})], []]
+
+    batches = list(iter_stale_raw_rows(conn, 7, batch_size=2))
+
+    assert [[raw_hash for raw_hash, _ in batch] for batch in batches] == [["h1", "h2"], ["h3"]]
+    params = [call.args[1] for call in cursor.execute.call_args_list]
+    assert params == [("", 7, 2), ("h2", 7, 2), ("h3", 7, 2)]
+    assert conn.transaction.call_count == 3
+
+    cursor.fetchall.side_effect = None
+    cursor.fetchall.return_value = []
+    assert list(iter_stale_raw_rows(conn, 7)) == []
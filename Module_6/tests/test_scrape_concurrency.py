@@ -0,0 +1,67 @@
+import re
+import threading
+import time
+
+import pytest
+
+from board.scrape import GradCafeScraper
+
+
+def _page_html(page):
+    return (
+        "<table>"
+        f"<tr><td>School {page}</td><td><span>Prog {page}</span></td><td>{page} Jan 2026</td></tr>"
+        "</table>"
+    )
+
+
+def _page_number(url):
+    return int(re.search(r"page=(\d+)", url).group(1))
+
+
+@pytest.mark.integration
+def test_concurrent_fetch_yields_pages_in_order():
+    """Later pages finishing first must not reorder the entries handed to dedupe."""
+    s = GradCafeScraper(output_file=None, debug=False, workers=4)
+
+    def slow_early_pages(url):
+        page = _page_number(url)
+        time.sleep(0.02 * (5 - page) if page < 5 else 0)
+        return _page_html(page)
+
+    s._fetch_html = slow_early_pages
+    out = s.scrape_data(target_count=100, max_pages=6)
+
+    assert [e["raw_inst"] for e in out] == [f"School {p}" for p in range(1, 7)]
+    assert s.http.connection_pool_kw["maxsize"] == 4
+
+
+@pytest.mark.integration
+def test_concurrent_fetch_stops_requesting_after_stop_date():
+    """Hitting the watermark cancels queued fetches instead of draining them."""
+    s = GradCafeScraper(output_file=None, debug=False, workers=3)
+    requested = []
+    lock = threading.Lock()
+
+    def record(url):
+        with lock:
+            requested.append(_page_number(url))
+        return _page_html(_page_number(url))
+
+    s._fetch_html = record
+    out = s.scrape_data(target_count=100, max_pages=500, stop_date="2 Jan 2026")
+    time.sleep(0.05)
+
+    assert [e["raw_inst"] for e in out] == ["School 1"]
+    assert max(requested) <= 2 + s.workers
+
+
+@pytest.mark.integration
+def test_concurrent_fetch_skips_failed_pages_without_counting_them():
+    """A page that fails to download is skipped and does not use up max_pages."""
+    s = GradCafeScraper(output_file=None, debug=False, workers=2)
+    s._fetch_html = lambda url: None if _page_number(url) == 2 else _page_html(_page_number(url))
+
+    out = s.scrape_data(target_count=100, max_pages=3)
+
+    assert [e["raw_inst"] for e in out] == ["School 1", "School 3", "School 4"]
@@ -0,0 +1,63 @@
+import random
+import sys
+
+import pytest
+
+from board.scrape import GradCafeScraper
+from worker.etl.scrape import dedupe_key
+from worker.etl.signatures import BloomFilter, SignatureSet, signature64
+
+
+@pytest.mark.integration
+def test_signature_set_matches_a_python_set():
+    """Membership survives growth, duplicates are rejected, and 0 is a valid signature."""
+    rng = random.Random(7)
+    values = [rng.getrandbits(64) for _ in range(5000)] + [0, 1]
+    index = SignatureSet()
+    reference = set()
+    for value in values + values[:100]:
+        assert index.add(value) == ((value or 1) not in reference)
+        reference.add(value or 1)
+
+    assert len(index) == len(reference)
+    assert set(index) == reference
+    assert all(value in index for value in values)
+    assert not any(rng.getrandbits(64) in index for _ in range(1000))
+    assert sys.getsizeof(index._slots) < sys.getsizeof(reference)
+    assert signature64("a\x1fb") == signature64("a", "b") != signature64("b", "a")
+
+
+@pytest.mark.integration
+def test_bloom_filter_persists_without_false_negatives(tmp_path):
+    """A saved filter reloads bit for bit; false positives stay near the target rate."""
+    rng = random.Random(11)
+    members = [rng.getrandbits(64) for _ in range(2000)]
+    bloom = BloomFilter(2000, error_rate=0.01)
+    for value in members:
+        bloom.add(value)
+    bloom.count = len(members)
+    bloom.save(tmp_path / "sigs.bloom")
+
+    loaded = BloomFilter.load(tmp_path / "sigs.bloom")
+    assert (loaded.size, loaded.hashes, loaded.count) == (bloom.size, bloom.hashes, 2000)
+    assert all(value in loaded for value in members)
+    false_hits = sum(rng.getrandbits(64) in loaded for _ in range(10000))
+    assert false_hits < 300
+    assert not loaded.is_full()
+
+    (tmp_path / "torn.bloom").write_bytes((tmp_path / "sigs.bloom").read_bytes()[:-3])
+    assert BloomFilter.load(tmp_path / "torn.bloom") is None
+    assert BloomFilter.load(tmp_path / "missing.bloom") is None
+
+
+@pytest.mark.integration
+def test_scraper_dedupes_on_signatures():
+    """A row repeated across pages is kept once, keyed by its 64-bit signature."""
+    s = GradCafeScraper(output_file=None, debug=False)
+    row = "<tr><td>School A</td><td><span>Prog</span></td><td>1 Jan 2026</td></tr>"
+    s._fetch_html = lambda url: f"<table>{row}</table>"
+
+    out = s.scrape_pages(1, 3)
+
+    assert len(out) == 1
+    assert isinstance(dedupe_key(out[0]), int)
@@ -0,0 +1,128 @@
+import pytest
+from unittest.mock import MagicMock
+
+from benchmarks.pages import results_pages
+from board.scrape import GradCafeScraper
+from worker.etl.row_parser import RowStreamParser
+
+
+class FakeStreamResponse:
+    """Minimal stand-in for a urllib3 response opened with preload_content=False."""
+
+    def __init__(self, body, chunk_size=64, status=200):
+        self.body = body.encode("utf-8")
+        self.chunk_size = chunk_size
+        self.status = status
+        self.chunks_sent = 0
+        self.closed = False
+        self.released = False
+
+    def stream(self, amt):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_sent += 1
+            yield self.body[start:start + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        self.released = True
+
+
+def _stream_scraper(response):
+    s = GradCafeScraper(output_file=None, debug=False, parser="stream")
+    s.http = MagicMock()
+    s.http.request.return_value = response
+    return s
+
+
+@pytest.mark.integration
+def test_stream_parser_is_chunk_size_independent():
+    """Splitting text nodes and entities across feed() calls must not change output."""
+    expected, html = results_pages()[3]
+    whole = RowStreamParser("u")
+    whole.feed(html)
+    whole.close()
+    reference = whole.pop_entries()
+
+    chunked = RowStreamParser("u")
+    got = []
+    for start in range(0, len(html), 7):
+        chunked.feed(html[start:start + 7])
+        got.extend(chunked.pop_entries())
+    chunked.close()
+    got.extend(chunked.pop_entries())
+
+    assert got == reference
+    assert len(got) == len(expected)
+
+
+@pytest.mark.integration
+def test_stream_entries_yield_before_body_is_read():
+    """The first row is handed out while most of the body is still unread."""
+    _, html = results_pages()[0]
+    response = FakeStreamResponse(html, chunk_size=512)
+    s = _stream_scraper(response)
+
+    entries = s._stream_entries("u")
+    first = next(entries)
+    total_chunks = -(-len(response.body) // response.chunk_size)
+
+    assert first["raw_inst"] == "Midwestern University"
+    assert response.chunks_sent < total_chunks // 2
+    entries.close()
+    assert response.closed and response.released
+    assert s.http.request.call_args.kwargs["preload_content"] is False
+
+
+@pytest.mark.integration
+def test_stream_scrape_stops_mid_page_and_drops_connection():
+    """Hitting the stop date mid-page closes the response without draining it."""
+    html = (
+        "<table>"
+        + "".join(
+            f"<tr><td>School {i}</td><td><span>P</span></td><td>{i} Jan 2026</td></tr>"
+            for i in range(1, 40)
+        )
+        + "</table>"
+    )
+    response = FakeStreamResponse(html, chunk_size=80)
+    s = _stream_scraper(response)
+
+    out = s.scrape_data(target_count=100, max_pages=1, stop_date="3 Jan 2026")
+
+    assert [e["raw_inst"] for e in out] == ["School 1", "School 2"]
+    assert response.closed and response.released
+
+
+@pytest.mark.integration
+def test_stream_entries_error_branches():
+    """Covers request failures, HTTP errors and mid-stream errors."""
+    s = GradCafeScraper(output_file=None, debug=True, parser="stream")
+    s.http = MagicMock()
+    s.http.request.side_effect = Exception("down")
+    assert list(s._stream_entries("u")) == []
+
+    bad_status = FakeStreamResponse("<table></table>", status=503)
+    s.http = MagicMock()
+    s.http.request.return_value = bad_status
+    assert list(s._stream_entries("u")) == []
+    assert bad_status.released
+
+    broken = FakeStreamResponse("<table></table>")
+    broken.stream = MagicMock(side_effect=Exception("reset"))
+    s.http.request.return_value = broken
+    assert list(s._stream_entries("u")) == []
+    assert broken.closed
+
+
+@pytest.mark.integration
+def test_stream_mode_with_worker_threads():
+    """Threaded fetches materialize each streamed page on the worker."""
+    s = GradCafeScraper(output_file=None, debug=False, parser="stream", workers=2)
+    s.http = MagicMock()
+    s.http.request.side_effect = lambda *a, **k: FakeStreamResponse(
+        "<table><tr><td>School</td><td><span>P</span></td></tr></table>"
+    )
+    out = s.scrape_data(target_count=1, max_pages=3)
+    assert out[0]["raw_prog"] == "P"
@@ -0,0 +1,82 @@
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.worker.consumer as consumer
+from board.clean import DataCleaner
+from board.scrape import GradCafeScraper
+from db.load_data import load_stream
+
+
+def _page_html(page):
+    return (
+        "<table>"
+        f"<tr><td>School {page}</td><td><span>Prog</span></td><td>{page} Jan 2026</td></tr>"
+        "</table>"
+    )
+
+
+def _scraper():
+    s = GradCafeScraper(output_file=None, debug=False)
+    requested = []
+
+    def fetch(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        requested.append(page)
+        return _page_html(page)
+
+    s._fetch_html = fetch
+    return s, requested
+
+
+@pytest.mark.integration
+def test_iter_scrape_yields_a_chunk_per_page_lazily():
+    """The first chunk is available after one page and later pages wait for demand."""
+    s, requested = _scraper()
+    chunks = s.iter_scrape(target_count=100, max_pages=5)
+
+    assert [e["raw_inst"] for e in next(chunks)] == ["School 1"]
+    assert requested == [1]
+    assert [len(chunk) for chunk in chunks] == [1, 1, 1, 1]
+    assert requested == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.analysis
+def test_iter_clean_and_load_stream_commit_per_chunk():
+    """Each cleaned chunk is loaded and committed before the next is cleaned."""
+    cleaner = DataCleaner(input_file=None, output_file=None)
+    events = []
+    raw_chunks = ([{"raw_inst": f"School {i}", "raw_text": "Accepted"}] for i in range(3))
+
+    def record_raw():
+        for chunk in raw_chunks:
+            events.append("clean")
+            yield chunk
+
+    conn = MagicMock()
+    conn.transaction.return_value.__exit__.side_effect = lambda *a: events.append("commit")
+    with patch("db.load_data.load_from_list") as load:
+        counts = list(load_stream(conn, cleaner.iter_clean(record_raw())))
+
+    assert counts == [1, 1, 1]
+    assert events == ["clean", "commit"] * 3
+    assert load.call_args_list[0].args[1][0].university == "School 0"
+
+
+@pytest.mark.integration
+def test_failed_chunk_keeps_earlier_commits_and_cursor():
+    """A load failure mid-run leaves earlier chunks committed and the cursor untouched."""
+    s, _ = _scraper()
+    with patch.object(consumer, "get_ingest_cursor", return_value=None), \
+         patch.object(consumer, "get_last_seen_date", return_value=None), \
+         patch.object(consumer, "GradCafeScraper", return_value=s), \
+         patch.object(consumer, "get_db_conn"), \
+         patch("src.db.load_data.load_from_list", side_effect=[None, RuntimeError("db")]) as load, \
+         patch.object(consumer, "update_ingest_cursor") as update, \
+         pytest.raises(RuntimeError):
+        consumer.handle_scrape_new_data(None, None, None, json.dumps({}))
+
+    assert load.call_count == 2
+    assert not update.called
@@ -1,11 +1,13 @@
 import pytest
 import sys
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 # Direct imports
 from board.clean import DataCleaner
 from board.scrape import GradCafeScraper
 from board.load_data import clean_date, clean_val, load_data
+from worker.etl.dates import parse_date
 
 @pytest.mark.db
 def test_cleaner_internals():
@@ -19,10 +21,10 @@ def test_cleaner_internals():
     s, d = c._parse_status_date("Wait listed")
     assert s == "Waitlisted" and d is None
 
-    # Test Manual Date Formatting
-    assert c._manual_format_date("14 Feb 2026") == "14 Feb 2026"
-    assert c._manual_format_date("Jan 1, 2025") == "1 Jan 2025"
-    assert c._manual_format_date(None) is None
+    # Test Date Normalization
+    assert parse_date("14 Feb 2026") == date(2026, 2, 14)
+    assert parse_date("Jan 1, 2025") == date(2025, 1, 1)
+    assert parse_date(None) is None
 
     # Test Regex Extractors
     txt = "GPA: 3.8 GRE: 160 V 155 AW 4.5 Fall 2026 International"